@@ -0,0 +1,258 @@
+#================================ perceiver.bus ================================
+"""!
+
+@brief    Perception bus that runs each perceiver once per frame and fans out the
+          outcome to any number of consumers.
+
+The Monitor and Progress classes contain a Perceiver instance and, by default, run
+it as part of their own processing.  An activity monitor plus a progress monitor on
+the same camera would then perceive each frame twice.  Their configurations have an
+`external` flag to skip the perceiver step, which leaves the orchestration to the
+outer scope.  The PerceptionBus is that outer scope.  It owns the perceivers, runs
+each one once per frame, then publishes the outcome to the subscribers.
+
+Subscribers come in two flavors.  Monitor-like consumers (Monitor, Progress, or
+anything with a process(I) member function and an `external` configuration flag)
+get the frame and read the already computed state from their perceiver.  Their
+`external` flag gets set when subscribing.  Reporter-like consumers get a signal
+extracted from the PerceiverState by a subscriber-provided function, which is then
+passed to their process member function.
+
+Each subscriber declares its rate as a period, in frames, between invocations.
+Subscribers may run sequentially on the caller thread or concurrently on a thread
+pool.  Either way, the bus waits for all subscribers to finish before the next
+frame is processed.
+
+@author   agent,                agent@local
+@date     2026/10/19            [created]
+"""
+#================================ perceiver.bus ================================
+#!
+#!NOTE:
+#!  set indent to 2 spaces.
+#!  do not indent function code.
+#!  set tab to 4 spaces with conversion to spaces.
+#!  90 columns
+#
+#================================ perceiver.bus ================================
+
+from typing import Any
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+from ivapy.Configuration import AlgConfig
+
+
+#================================= Subscription ================================
+#
+@dataclass
+class Subscription:
+  """!
+  @ingroup  Perceiver
+  @brief    Subscriber entry of a PerceptionBus.
+
+  The consumer is invoked every period frames, with signal(PerceiverState) when a
+  signal function is given, else with the frame.  The count is the number of
+  frames seen so far.
+  """
+  consumer: Any
+  period:   int = 1
+  signal:   Any = None
+  count:    int = 0
+
+
+#==================================== CfgBus ===================================
+#
+class CfgBus(AlgConfig):
+  """!
+  @ingroup  Perceiver
+  @brief    Configuration instance for a PerceptionBus.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | workers     | Thread pool size for subscribers. Zero means run on caller thread. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a perception bus configuration node.
+    """
+
+    if init_dict is None:
+      init_dict = CfgBus.get_default_settings()
+
+    super(CfgBus,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default configuration settings for PerceptionBus.
+    """
+
+    default_settings = dict(workers = 0)
+    return default_settings
+
+
+#================================ PerceptionBus ================================
+#
+class PerceptionBus(object):
+  """!
+  @ingroup  Perceiver
+  @brief    Run perceivers once per frame and publish their state to subscribers.
+
+  Perceivers are registered by name, so that multiple cameras or perception
+  pipelines can share a bus.  The default name is for the common single perceiver
+  case.
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for the perception bus.
+
+    @param[in]  theConfig   Bus configuration (optional).
+    """
+
+    if theConfig is None:
+      theConfig = CfgBus()
+
+    self.config      = theConfig
+    self.perceivers  = dict()         #< Perceivers by name.
+    self.subscribers = dict()         #< Subscription lists by perceiver name.
+    self.states      = dict()         #< Last published perceiver states by name.
+
+    if self.config.workers > 0:
+      self.pool = ThreadPoolExecutor(max_workers = self.config.workers)
+    else:
+      self.pool = None
+
+  #================================ addPerceiver ===============================
+  #
+  def addPerceiver(self, thePerceiver, name = "default"):
+    """!
+    @brief  Add a perceiver to the bus.
+
+    @param[in]  thePerceiver    Perceiver instance.
+    @param[in]  name            Name of perceiver on the bus (optional).
+    """
+
+    self.perceivers[name]  = thePerceiver
+    self.subscribers[name] = list()
+
+  #================================= subscribe =================================
+  #
+  def subscribe(self, theConsumer, name = "default", period = 1, signal = None):
+    """!
+    @brief  Subscribe a consumer to a perceiver's outcomes.
+
+    Without a signal function, the consumer is Monitor-like and gets the frame.
+    If it has an `external` configuration flag, then the flag is set so that it
+    does not re-run the perceiver.  Its perceiver must then be the one on the bus,
+    since that is the one that gets run.  A consumer holding a different perceiver
+    is refused with a ValueError (it would read a state that never updates).  With
+    a signal function, the consumer is Reporter-like and gets
+    signal(PerceiverState).
+
+    @param[in]  theConsumer     Monitor, Progress, Reporter, or similar instance.
+    @param[in]  name            Name of perceiver to subscribe to (optional).
+    @param[in]  period          Number of frames between invocations (optional).
+    @param[in]  signal          Function extracting the signal to pass (optional).
+    """
+
+    if signal is None and hasattr(theConsumer, "params") \
+                      and ("external" in theConsumer.params):
+      if hasattr(theConsumer, "perceiver") \
+                      and (theConsumer.perceiver is not self.perceivers[name]):
+        raise ValueError("Consumer does not use the bus perceiver: " + str(name))
+      theConsumer.params.external = True
+
+    self.subscribers[name].append(Subscription(theConsumer, period, signal))
+
+  #================================ unsubscribe ================================
+  #
+  def unsubscribe(self, theConsumer, name = "default"):
+    """!
+    @brief  Remove a consumer from a perceiver's subscription list.
+
+    @param[in]  theConsumer     Previously subscribed instance.
+    @param[in]  name            Name of perceiver subscribed to (optional).
+    """
+
+    self.subscribers[name] = [sub for sub in self.subscribers[name]
+                                            if sub.consumer is not theConsumer]
+
+  #================================== getState =================================
+  #
+  def getState(self, name = "default"):
+    """!
+    @brief  Return last published state of the named perceiver.
+    """
+    return self.states.get(name)
+
+  #================================== process ==================================
+  #
+  def process(self, I):
+    """!
+    @brief  Run each perceiver on the frame and publish to subscribers.
+
+    @param[in]  I   Frame for all perceivers, or dict of frames by perceiver name.
+    """
+
+    jobs = []
+    for name, thePerceiver in self.perceivers.items():
+
+      if isinstance(I, dict):
+        Ip = I[name]
+      else:
+        Ip = I
+
+      thePerceiver.process(Ip)
+      pState = thePerceiver.getState()
+      self.states[name] = pState
+
+      for sub in self.subscribers[name]:
+        if (sub.count % sub.period) == 0:
+          jobs.append((sub, Ip, pState))
+        sub.count += 1
+
+    if self.pool is None:
+      for job in jobs:
+        PerceptionBus._dispatch(*job)
+    else:
+      futures = [self.pool.submit(PerceptionBus._dispatch, *job) for job in jobs]
+      for fut in futures:
+        fut.result()                    # Wait, and raise any subscriber exception.
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Shut down the subscriber thread pool, if any.
+    """
+
+    if self.pool is not None:
+      self.pool.shutdown()
+      self.pool = None
+
+  #================================= _dispatch =================================
+  #
+  @staticmethod
+  def _dispatch(sub, I, pState):
+    """!
+    @brief  Pass along perceiver outcome to a subscriber.
+    """
+
+    if sub.signal is None:
+      sub.consumer.process(I)
+    else:
+      sub.consumer.process(sub.signal(pState))
+
+
+#
+#================================ perceiver.bus ================================
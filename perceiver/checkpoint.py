@@ -0,0 +1,293 @@
+#============================= perceiver.checkpoint ============================
+"""!
+
+@brief    Checkpoint and restore of full Perceiver/Monitor/Editor runtime state.
+
+Rebuilding a Monitor -> Perceiver -> detector/tracker tree, or an Editor with its
+BeatReporters, through the builders gives back the structure but not the history.
+Trigger states (Rising.pBool, onChange.prevSig), RunningCommentary buffers,
+counters, and any model adaptation are lost.  A checkpoint instead serializes the
+instance tree as is, and a restore gives back the same tree with the same state.
+
+Serialization uses pickle protocol 5 with out-of-band buffers.  Array data is not
+copied into the pickle stream but written after it as raw buffers, and restored
+arrays point into the loaded file data.  Signal filters and announcement functions
+are usually closures (see perceiver.reports.drafts), which plain pickle cannot
+serialize.  When cloudpickle is installed, it is used instead of pickle so that
+closures and their internal state (e.g., counters) get saved too.
+
+For crash recovery, a Checkpointer takes periodic snapshots from the processing
+loop and writes them to disk on a background thread.  Taking a snapshot is a
+pickling plus a copy of the array buffers.  The disk write does not block the
+processing loop.
+
+File layout: 8 byte magic, buffer count, pickle length, pickle stream, then each
+buffer as its length followed by its raw bytes.
+
+@author   agent,                agent@local
+@date     2026/10/19            [created]
+"""
+#============================= perceiver.checkpoint ============================
+#!
+#!NOTE:
+#!  set indent to 2 spaces.
+#!  do not indent function code.
+#!  set tab to 4 spaces with conversion to spaces.
+#!  90 columns
+#
+#============================= perceiver.checkpoint ============================
+
+import os
+import time
+import struct
+import pickle
+import queue
+import threading
+
+try:
+  import cloudpickle as _pickler
+except ImportError:
+  _pickler = pickle
+
+from ivapy.Configuration import AlgConfig
+
+
+MAGIC  = b"PCKPT001"
+HEADER = struct.Struct("<8sQQ")
+BUFLEN = struct.Struct("<Q")
+
+
+#============================== Support Functions ==============================
+#
+
+def snapshot(theInstance):
+  """!
+  @brief  Serialize instance into a pickle stream and a list of raw buffers.
+
+  The buffers are copies, thus the instance may keep on changing afterwards
+  without affecting the snapshot.
+
+  @param[in]  theInstance   Instance to serialize (Perceiver, Monitor, Editor, etc.).
+
+  @return     Tuple (pickle stream, list of buffers).
+  """
+
+  buffers = []
+  pdata = _pickler.dumps(theInstance, protocol = 5, buffer_callback = buffers.append)
+
+  return (pdata, [bytes(buf.raw()) for buf in buffers])
+
+def write(filename, pdata, buffers):
+  """!
+  @brief  Write a snapshot to file.  Goes through a temporary file then renames
+          it, so a crash mid-write leaves the previous checkpoint intact.
+
+  @param[in]  filename  Checkpoint file name.
+  @param[in]  pdata     Pickle stream.
+  @param[in]  buffers   List of raw buffers.
+  """
+
+  with open(filename + ".tmp", "wb") as fid:
+    fid.write(HEADER.pack(MAGIC, len(buffers), len(pdata)))
+    fid.write(pdata)
+    for buf in buffers:
+      fid.write(BUFLEN.pack(len(buf)))
+      fid.write(buf)
+    fid.flush()
+    os.fsync(fid.fileno())
+
+  os.replace(filename + ".tmp", filename)
+
+def save(theInstance, filename):
+  """!
+  @brief  Checkpoint instance to file.
+
+  Array buffers are written straight from the instance memory (no copy).
+
+  @param[in]  theInstance   Instance to checkpoint.
+  @param[in]  filename      Checkpoint file name.
+  """
+
+  buffers = []
+  pdata = _pickler.dumps(theInstance, protocol = 5, buffer_callback = buffers.append)
+
+  write(filename, pdata, [buf.raw() for buf in buffers])
+
+def load(filename):
+  """!
+  @brief  Restore instance from checkpoint file.
+
+  @param[in]  filename      Checkpoint file name.
+
+  @return     The restored instance.
+  """
+
+  with open(filename, "rb") as fid:
+    fdata = bytearray(fid.read())       # Writeable, so restored arrays are too.
+
+  (magic, nBuf, pLen) = HEADER.unpack_from(fdata, 0)
+  if magic != MAGIC:
+    raise ValueError("Not a perceiver checkpoint file: " + filename)
+
+  view = memoryview(fdata)
+  cpos = HEADER.size
+  pdata = view[cpos:cpos+pLen]
+  cpos += pLen
+
+  buffers = []
+  for bi in range(nBuf):
+    (bLen,) = BUFLEN.unpack_from(fdata, cpos)
+    cpos += BUFLEN.size
+    buffers.append(view[cpos:cpos+bLen])
+    cpos += bLen
+
+  return pickle.loads(pdata, buffers = buffers)
+
+
+#=============================== CfgCheckpointer ===============================
+#
+class CfgCheckpointer(AlgConfig):
+  """!
+  @ingroup  Perceiver
+  @brief    Configuration instance for a periodic Checkpointer.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | filename    | Checkpoint file name.  Each checkpoint replaces the previous one. |
+  | interval    | Wall clock time between checkpoints (seconds). None to disable. |
+  | frames      | Number of step invocations between checkpoints. None to disable. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a checkpointer configuration node.
+    """
+
+    if init_dict is None:
+      init_dict = CfgCheckpointer.get_default_settings()
+
+    super(CfgCheckpointer,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default configuration settings for Checkpointer.
+    """
+
+    default_settings = dict(filename = "perceiver.ckpt", interval = 5.0, frames = None)
+    return default_settings
+
+
+#================================= Checkpointer ================================
+#
+class Checkpointer(object):
+  """!
+  @ingroup  Perceiver
+  @brief    Periodic background checkpointing of an instance tree.
+
+  The step member function should be invoked once per processing loop iteration,
+  after the processing.  When a checkpoint is due, it takes the snapshot then and
+  there (so the state is consistent) and hands it over to the writer thread.  If
+  the writer falls behind, older pending snapshots are replaced by the newest one.
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self, theInstance, theConfig = None):
+    """!
+    @brief  Constructor for the checkpointer.
+
+    @param[in]  theInstance     Instance to checkpoint (Monitor, Editor, etc.).
+    @param[in]  theConfig       Checkpointer configuration (optional).
+    """
+
+    if theConfig is None:
+      theConfig = CfgCheckpointer()
+
+    self.instance = theInstance
+    self.config   = theConfig
+
+    self.nSteps   = 0                       #< Steps since last checkpoint.
+    self.tNext    = None                    #< Time when next checkpoint is due.
+    self.nSaved   = 0                       #< Number of checkpoints written.
+
+    if self.config.interval is not None:
+      self.tNext = time.monotonic() + self.config.interval
+
+    self.queue  = queue.Queue(maxsize = 1)
+    self.thread = threading.Thread(target = self._writer, daemon = True)
+    self.thread.start()
+
+  #==================================== step ===================================
+  #
+  def step(self):
+    """!
+    @brief  Note a processing step.  Checkpoint if one is due.
+
+    @return     True if a checkpoint snapshot was taken.
+    """
+
+    self.nSteps += 1
+
+    isDue = (self.config.frames is not None) and (self.nSteps >= self.config.frames)
+    if (self.tNext is not None) and (time.monotonic() >= self.tNext):
+      isDue = True
+
+    if isDue:
+      self.save()
+
+    return isDue
+
+  #==================================== save ===================================
+  #
+  def save(self):
+    """!
+    @brief  Take snapshot now and queue it for writing.
+    """
+
+    theSnap = snapshot(self.instance)
+
+    try:                                    # Newest snapshot replaces pending one.
+      self.queue.get_nowait()
+    except queue.Empty:
+      pass
+    self.queue.put(theSnap)
+
+    self.nSteps = 0
+    if self.config.interval is not None:
+      self.tNext = time.monotonic() + self.config.interval
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Wait for pending checkpoint to be written, then stop writer thread.
+    """
+
+    if self.thread.is_alive():
+      self.queue.put(None)
+      self.thread.join()
+
+  #================================== _writer ==================================
+  #
+  def _writer(self):
+    """!
+    @brief  Writer thread loop.
+    """
+
+    while True:
+      theSnap = self.queue.get()
+      if theSnap is None:
+        break
+
+      write(self.config.filename, theSnap[0], theSnap[1])
+      self.nSaved += 1
+
+
+#
+#============================= perceiver.checkpoint ============================
@@ -81,6 +81,8 @@ class CfgMonitor(AlgConfig):
   | Field       | Meaning |
   | :---        | :------- |
   | external    | Is the perceiver already externally called? If so, then Monitor implementation avoids invoking Perceiver process routine during its own processing. |
+  | eventDriven | Only run activity recognition when the perceiver state changes. |
+  | tolerance   | Track state change (max abs difference) considered to be no change. |
   | display     | Set to "basic" for simple display; "overlay" for pure
   image-based display. |
   | displayDebug    | Set to "basic" for simple display; "overlay" for pure
@@ -106,7 +108,7 @@ class CfgMonitor(AlgConfig):
   def get_default_settings():
 
     default_settings = dict(external = False, display = "basic", 
-                            displayDebug = "basic")
+                            displayDebug = "basic", eventDriven = False, tolerance = 0)
     return default_settings
 
     # @todo     What should this be?
@@ -203,6 +205,12 @@ class Monitor(object):
     self.perceiver = thePerceiver   #< Perceiver instance.
     self.activity  = theActivity    #< Activity detection/recognition instance.
     self.reporter  = theReporter    #< Takes activity outcomes and creates report out.
+    self.recorder  = None           #< Session recorder (optional). See perceiver.recorder.
+    self.timeline  = None           #< Activity timeline (optional). See perceiver.timeline.
+
+    self.lastMeas   = None          #< Track state at last activity evaluation.
+    self.nEvaluated = 0             #< Number of activity evaluations.
+    self.nSkipped   = 0             #< Number of skipped evaluations (event driven).
 
     self.params = theParams
     # TODO: Delete this code when finalized and confirmed to work.
@@ -273,6 +281,10 @@ class Monitor(object):
     """!
     @brief  Run perceive + activity recognize pipeline for one step/image
             measurement.
+
+    If a session recorder is attached, then the frame, perceiver state, and
+    activity state get archived after processing.  If an activity timeline is
+    attached, then it gets updated with the activity state.
     """
 
     self.predict()
@@ -280,6 +292,91 @@ class Monitor(object):
     self.correct()
     self.adapt()
 
+    if self.recorder is not None:
+      self.recorder.record(I, self.perceiver.getState(), self.activity.getState())
+
+    if self.timeline is not None:
+      self.timeline.update(self.activity.getState())
+
+  #============================= processBatch ============================
+  #
+  #
+  def processBatch(self, tPts, haveObs = None):
+    """!
+    @brief  Run activity recognition over an array of track points, such as those
+            from a history buffer or a recorded session.
+
+    Intended for offline re-analysis.  The live activity state is not affected.
+    If the activity instance has its own processBatch member function, then it is
+    used.  Region-based activity (an activity instance with an imRegions label
+    image) is a vectorized gather from the label image.  Otherwise, the activity
+    instance gets run sequentially, with its state restored afterwards.
+
+    @param[in]  tPts        Track points, one per row (N x d). Recorded track points
+                            of shape (N x d x 1) are also accepted.
+    @param[in]  haveObs     Observation flags (optional).  Default is that rows with
+                            no NaN entries are observations.
+
+    @return     Array of activity states, one per track point.
+    """
+
+    tPts = np.asarray(tPts, dtype=float)
+    tPts = tPts.reshape(tPts.shape[0], -1)
+
+    isValid = ~np.isnan(tPts).any(axis=1)
+    if haveObs is not None:
+      isValid = isValid & np.asarray(haveObs, dtype=bool)
+
+    if hasattr(self.activity, "processBatch"):
+      return self.activity.processBatch(tPts, isValid)
+
+    if getattr(self.activity, "imRegions", None) is not None:
+      return Monitor.regionLookup(self.activity.imRegions, tPts, isValid)
+
+    # Fallback. No vectorized version available, so loop through.
+    liveState = self.activity.getState()
+
+    aStates = []
+    for ti in range(tPts.shape[0]):
+      pState = Perceiver.PerceiverState(tMeas = tPts[ti].reshape(-1,1),
+                                        haveObs = isValid[ti], haveState = isValid[ti])
+      self.activity.process(pState)
+      aStates.append(getattr(self.activity.getState(), 'x', None))
+
+    self.activity.setState(liveState)
+
+    return np.array(aStates)
+
+  #============================= regionLookup ============================
+  #
+  #
+  @staticmethod
+  def regionLookup(imRegions, tPts, isValid):
+    """!
+    @brief  Vectorized region activity: gather activity labels from region image.
+
+    Track points are (x,y) image coordinates, thus column then row.  Points that are
+    not observations or that fall outside of the image get the 0 (no region) label.
+
+    @param[in]  imRegions   Activity region label image.
+    @param[in]  tPts        Track points, one per row (N x 2).
+    @param[in]  isValid     Observation flags (N).
+
+    @return     Array of activity region labels (N).
+    """
+
+    aStates = np.zeros(tPts.shape[0], dtype=imRegions.dtype)
+
+    cols = np.fix(tPts[isValid,0]).astype(int)
+    rows = np.fix(tPts[isValid,1]).astype(int)
+    inIm = (rows >= 0) & (rows < imRegions.shape[0]) \
+                       & (cols >= 0) & (cols < imRegions.shape[1])
+
+    isValid = np.flatnonzero(isValid)[inIm]
+    aStates[isValid] = imRegions[rows[inIm], cols[inIm]]
+
+    return aStates
+
   #============================ displayState ===========================
   #
   def displayState(self, dState = None):
@@ -383,16 +480,58 @@ class Monitor(object):
     @brief  Run activity detection process to generate activity state measurement. 
             If perceiver has no measurement/observation, then does nothing.
 
+    When configured to be event driven, activity recognition only runs if the
+    perceiver state has changed since the last evaluation.  Otherwise the previous
+    activity state carries forward and the skip gets counted.
+
     @param[in]  I   Image to process. Depending on implementation, might be optional.
     """
 
     if not self.params.external:    # Perceiver process not externally called.
       self.perceiver.process(I)     # so should run perceiver process now.
 
-    self.activity.process(self.perceiver.getState())
+    pState = self.perceiver.getState()
+    if self.params.eventDriven and not self.hasChanged(pState):
+      self.nSkipped += 1
+      return
+
+    self.activity.process(pState)
+    self.nEvaluated += 1
 
     # do post processing to collect what is needed.
 
+  #============================== hasChanged =============================
+  #
+  #
+  def hasChanged(self, pState):
+    """!
+    @brief  Check if perceiver state has changed since last activity evaluation.
+
+    No observation is no new information, thus no change.  The comparison is
+    against the track state of the last evaluation, not the last frame, so that
+    slow drift still registers as change once beyond the tolerance.  Track states
+    that are not numeric arrays (e.g., Lie group elements) count as changed.
+
+    @param[in]  pState  Perceiver state to check.
+
+    @return     True if the state has changed, False otherwise.
+    """
+
+    if not pState.haveObs:
+      return False
+
+    try:
+      tMeas = np.array(pState.tMeas, dtype=float)
+    except (TypeError, ValueError):
+      return True
+
+    if (self.lastMeas is None) or (self.lastMeas.shape != tMeas.shape) \
+       or (np.max(np.abs(tMeas - self.lastMeas), initial=0) > self.params.tolerance):
+      self.lastMeas = tMeas
+      return True
+
+    return False
+
   #=============================== correct ===============================
   #
   #
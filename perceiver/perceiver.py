@@ -20,7 +20,7 @@ import os
 import matplotlib.pyplot as plt
 import time
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from Lie.group.SE2.Homog import Homog
 from ivapy.Configuration import AlgConfig
@@ -31,7 +31,7 @@ from ivapy.Configuration import AlgConfig
 class PerceiverState:
   tMeas: any
   g: Homog = None
-  tPts: np.ndarray = np.array([])
+  tPts: np.ndarray = field(default_factory=lambda: np.array([]))
   gOB: Homog = None
   haveObs: bool = False
   haveState:  bool = False
@@ -181,6 +181,7 @@ class Perceiver(object):
 
     # data storage
     self.I = None           #< Image passed for processing.
+    self.recorder = None    #< Session recorder (optional). See perceiver.recorder.
 
     # results. e.g., tpt of the trackpointers class
     self.tMeas = None       #< The last measured track state of the target.
@@ -309,6 +310,9 @@ class Perceiver(object):
     self.correct()
     self.adapt()
 
+    if self.recorder is not None:
+      self.recorder.record(I, self.getState())
+
   #============================ displayState ===========================
   #
   def displayState(self, dState=None):
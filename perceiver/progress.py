@@ -54,6 +54,12 @@ class ProgressState:
   pLevel:    any
   haveObs:   bool = False
 
+@dataclass
+class MultiProgressState:
+  pLevels:   np.ndarray
+  ranking:   np.ndarray
+  haveObs:   bool = False
+
 #
 #-------------------------------------------------------------------------------
 #============================= Configuration Nodes =============================
@@ -71,6 +77,14 @@ class CfgProgress(AlgConfig):
   Instantiating a progress monitor requires the perceiver and goal comparator
   instances to be complete.  Any other settings should be specific to how the
   progress monitor will operate or what to do with the processed information.
+
+  Fields of the CfgProgress include:
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | external    | Is the perceiver already externally called? If so, then Progress implementation avoids invoking Perceiver process routine during its own processing. |
+  | incremental | Only compare scene elements that changed since the last frame. |
+  | tolerance   | Element state change (max abs difference) considered to be no change. |
   """
 
   #------------------------------ __init__ -----------------------------
@@ -81,9 +95,9 @@ class CfgProgress(AlgConfig):
     """
 
     if init_dict is None:
-      init_dict = CfgMonitor.get_default_settings()
+      init_dict = CfgProgress.get_default_settings()
 
-    super(CfgMonitor,self).__init__(init_dict, key_list, new_allowed)
+    super(CfgProgress,self).__init__(init_dict, key_list, new_allowed)
 
 
   #------------------------ get_default_settings -----------------------
@@ -91,7 +105,8 @@ class CfgProgress(AlgConfig):
   @staticmethod
   def get_default_settings():
 
-    default_settings = dict(display = None, version = None)
+    default_settings = dict(external = False, incremental = False, tolerance = 0,
+                            display = None, version = None)
     return default_settings
 
     # @todo     What should this be?
@@ -138,6 +153,43 @@ class BuildCfgProgress(BuildConfig):
     return default_settings
 
 
+#=============================== CfgMultiProgress ==============================
+#
+class CfgMultiProgress(CfgProgress):
+  """!
+  @ingroup  Perceiver
+  @brief    Configuration instance for a multi-goal progress monitor.
+
+  Adds to the CfgProgress fields:
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | tau         | Distance below which a scene element matches its goal element. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a multi-goal progress monitor configuration node.
+    """
+
+    if init_dict is None:
+      init_dict = CfgMultiProgress.get_default_settings()
+
+    super(CfgMultiProgress,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+
+    default_settings = CfgProgress.get_default_settings()
+    default_settings.update(dict(tau = 1.0))
+    return default_settings
+
+
 #
 #-------------------------------------------------------------------------------
 #================================ Progress Class ===============================
@@ -159,6 +211,14 @@ class Progress(object):
   the implicit messaging of the "perceiver" name and the consequence of progress
   monitoring.
 
+  When a goal state is given (see setGoal), the scene state is taken to be a
+  collection of elements (e.g., puzzle pieces), either an array with one element
+  per row or a dict by element key.  Each element gets scored against its goal
+  counterpart by the comparator, and the progress level is the average score over
+  the goal elements.  In incremental mode, only elements whose state changed since
+  the last frame get compared, the rest come from the cache of comparator results.
+  The comparator should either have a compare(element, goalElement) member function
+  or be a function with that signature, returning a score in [0,1].
   """
 
   #================================ Monitor ================================
@@ -184,6 +244,13 @@ class Progress(object):
     # states
     self.pLevel    = 0   #< progress level. 
 
+    self.goal      = None   #< Goal state, as elements (optional).
+    self.parts     = None   #< Cached element states of last comparison.
+    self.scores    = None   #< Cached comparator results per goal element.
+    self.pSum      = 0      #< Running sum of cached comparator results.
+    self.nCompared = 0      #< Number of comparator invocations.
+    self.nCached   = 0      #< Number of comparator results taken from cache.
+
     # @todo Does comparator have the level, or does it return level to this scope?
 
     # @todo Code missing. Process the run-time parameters. Maybe no need for base
@@ -312,13 +379,154 @@ class Progress(object):
   def measure(self, I):
     """!
     @brief  Measure progress level from raw scene input.
+
+    @param[in]  I   Image to process. Depending on implementation, might be optional.
     """
 
-    self.perceiver.process(I)
-    self.activity.process(self.perceiver.getState())
+    if not self.params.external:    # Perceiver process not externally called.
+      self.perceiver.process(I)     # so should run perceiver process now.
+
+    if self.goal is None:
+      self.comparator.process(self.perceiver.getState())
+    else:
+      self.pLevel = self.compareToGoal(self.perceiver.getState().tMeas)
 
     # do post processing to collect what is needed.
 
+  #=============================== setGoal ===============================
+  #
+  #
+  def setGoal(self, theGoal):
+    """!
+    @brief  Set the goal state and clear the comparator cache.
+
+    @param[in]  theGoal     Goal elements: array with one per row, or dict by key.
+    """
+
+    if isinstance(theGoal, dict):
+      self.goal   = theGoal
+      self.parts  = dict()
+      self.scores = dict()
+    else:
+      self.goal   = np.asarray(theGoal, dtype=float)
+      self.goal   = self.goal.reshape(self.goal.shape[0], -1)
+      self.parts  = None
+      self.scores = np.zeros(self.goal.shape[0])
+
+    self.pSum = 0
+
+  #============================ compareToGoal ============================
+  #
+  #
+  def compareToGoal(self, theScene):
+    """!
+    @brief  Compare scene elements to the goal and return the progress level.
+
+    @param[in]  theScene    Scene elements: array with one per row, or dict by key.
+
+    @return     Progress level (average element score).
+    """
+
+    if isinstance(self.goal, dict):
+      self._compareDict(theScene)
+    else:
+      self._compareArray(theScene)
+
+    return self.pSum / max(len(self.goal), 1)
+
+  #============================ _compareArray ============================
+  #
+  #
+  def _compareArray(self, theScene):
+    """!
+    @brief  Update comparator results for array scene state.
+
+    Missing elements (NaN rows) score zero.  Finding the changed rows is a
+    vectorized comparison against the cached element states.
+    """
+
+    theScene = np.asarray(theScene, dtype=float).reshape(self.goal.shape)
+
+    if (not self.params.incremental) or (self.parts is None):
+      isChanged = np.ones(self.goal.shape[0], dtype=bool)
+    else:
+      isNaN = np.isnan(theScene)
+      isChanged = np.any(np.abs(theScene - self.parts) > self.params.tolerance, axis=1) \
+                  | np.any(isNaN != np.isnan(self.parts), axis=1)
+
+    if self.parts is None:
+      self.parts = theScene.copy()
+
+    for ei in np.flatnonzero(isChanged):
+      newScore = self._score(theScene[ei], self.goal[ei])
+      self.pSum += newScore - self.scores[ei]
+      self.scores[ei]  = newScore
+      self.parts[ei,:] = theScene[ei]
+
+    self.nCompared += np.count_nonzero(isChanged)
+    self.nCached   += isChanged.size - np.count_nonzero(isChanged)
+
+  #============================= _compareDict ============================
+  #
+  #
+  def _compareDict(self, theScene):
+    """!
+    @brief  Update comparator results for dict scene state.
+
+    Only goal keys count.  Elements absent from the scene score zero.
+    """
+
+    for key, goalPart in self.goal.items():
+      part = theScene.get(key)
+
+      if self.params.incremental and (key in self.parts) \
+                                 and Progress._isSame(part, self.parts[key],
+                                                      self.params.tolerance):
+        self.nCached += 1
+        continue
+
+      newScore = self._score(part, goalPart)
+      self.pSum += newScore - self.scores.get(key, 0)
+      self.scores[key] = newScore
+      self.parts[key]  = part
+      self.nCompared  += 1
+
+  #================================ _score ===============================
+  #
+  #
+  def _score(self, part, goalPart):
+    """!
+    @brief  Score scene element against goal element using the comparator.
+    """
+
+    if part is None or np.any(np.isnan(np.asarray(part, dtype=float))):
+      return 0
+
+    if hasattr(self.comparator, "compare"):
+      return self.comparator.compare(part, goalPart)
+    else:
+      return self.comparator(part, goalPart)
+
+  #=============================== _isSame ===============================
+  #
+  #
+  @staticmethod
+  def _isSame(part, prevPart, tol):
+    """!
+    @brief  Check if element state is unchanged within tolerance.
+    """
+
+    if (part is None) or (prevPart is None):
+      return (part is None) and (prevPart is None)
+
+    part     = np.asarray(part, dtype=float)
+    prevPart = np.asarray(prevPart, dtype=float)
+    if part.shape != prevPart.shape:
+      return False
+
+    return not np.any(np.abs(part - prevPart) > tol) \
+           and np.array_equal(np.isnan(part), np.isnan(prevPart))
+
   #=============================== correct ===============================
   #
   #
@@ -343,5 +551,172 @@ class Progress(object):
     """
     pass
 
+
+#
+#-------------------------------------------------------------------------------
+#============================= MultiProgress Class =============================
+#-------------------------------------------------------------------------------
+#
+
+class MultiProgress(Progress):
+  """!
+  @ingroup  Perceiver
+  @brief    Progress monitoring against many candidate goals at once.
+
+  Sometimes the goal is not known in advance, only that it is one of several
+  candidates (e.g., the puzzle layouts a subject might be assembling).  Rather
+  than one Progress instance per goal, each re-running the perceiver and the
+  comparisons, the candidate goals get stacked into a single array (goal x element
+  x dimension) and the scene is compared to all of them in one vectorized pass.
+  A scene element matches when it is within tau of the goal element, and each
+  goal's progress level is the fraction of its elements matched.  Goals with fewer
+  elements are NaN padded, which never matches.
+
+  The scene state should have one element per row, in the same order as the goal
+  elements.  The pLevel member holds the progress level of the best ranked goal.
+  """
+
+  #============================ MultiProgress ============================
+  #
+  #
+  def __init__(self, theParams, thePerceiver, theGoals = None):
+    """!
+    @brief  Constructor for the multi-goal progress monitor.
+
+    @param[in] theParams        Option set of paramters.  A CfgProgress instance
+                                gets the CfgMultiProgress defaults for the rest.
+    @param[in] thePerceiver     Perceiver instance (or possibly not).
+    @param[in] theGoals         List of goals (optional). See addGoal.
+    """
+
+    if theParams is None:
+      theParams = CfgMultiProgress()
+    elif "tau" not in theParams:
+      theParams = theParams.clone()
+      theParams.tau = CfgMultiProgress.get_default_settings()["tau"]
+
+    super(MultiProgress,self).__init__(theParams, thePerceiver, None)
+
+    self.goals   = np.zeros((0,0,0))     #< Stacked goals (goal x element x dim).
+    self.nElem   = np.zeros(0)           #< Number of elements per goal.
+    self.names   = list()                #< Goal names.
+    self.pLevels = np.zeros(0)           #< Progress level per goal.
+    self.ranking = np.zeros(0, dtype=int)  #< Goal indices, best to worst.
+    self.haveObs = False                 #< Was the last scene observed?
+
+    if theGoals is not None:
+      for theGoal in theGoals:
+        self.addGoal(theGoal)
+
+  #=============================== addGoal ===============================
+  #
+  #
+  def addGoal(self, theGoal, name = None):
+    """!
+    @brief  Add a candidate goal to the stack.
+
+    All goals should have the same element dimension.
+
+    @param[in]  theGoal     Goal elements, one per row.
+    @param[in]  name        Goal name (optional). Default is its index.
+    """
+
+    theGoal = np.asarray(theGoal, dtype=float)
+    theGoal = theGoal.reshape(theGoal.shape[0], -1)
+
+    nGoals = self.goals.shape[0]
+    if (nGoals > 0) and (theGoal.shape[1] != self.goals.shape[2]):
+      raise ValueError("Goal element dimension " + str(theGoal.shape[1])
+                       + " does not match existing goals ("
+                       + str(self.goals.shape[2]) + ").")
+
+    nElem  = max(self.goals.shape[1], theGoal.shape[0])
+    nDim   = theGoal.shape[1]
+
+    newGoals = np.full((nGoals+1, nElem, nDim), np.nan)
+    if nGoals > 0:
+      newGoals[:nGoals, :self.goals.shape[1], :] = self.goals
+    newGoals[nGoals, :theGoal.shape[0], :] = theGoal
+
+    self.goals = newGoals
+    self.nElem = np.append(self.nElem, theGoal.shape[0])
+    self.names.append(nGoals if name is None else name)
+
+    self.pLevels = np.zeros(nGoals+1)
+    self.ranking = np.arange(nGoals+1)
+
+  #=============================== getState ==============================
+  #
+  #
+  def getState(self):
+    """!
+    @brief      Returns the current multi-goal progress state.
+
+    @return     The current state structure.
+    """
+
+    cstate = MultiProgressState(pLevels = self.pLevels, ranking = self.ranking,
+                                haveObs = self.haveObs)
+    return cstate
+
+  #=============================== measure ===============================
+  #
+  #
+  def measure(self, I):
+    """!
+    @brief  Measure progress levels of all goals from raw scene input.
+
+    @param[in]  I   Image to process. Depending on implementation, might be optional.
+    """
+
+    if not self.params.external:    # Perceiver process not externally called.
+      self.perceiver.process(I)     # so should run perceiver process now.
+
+    pState = self.perceiver.getState()
+    self.haveObs = pState.haveObs
+    self.compareToGoals(pState.tMeas)
+
+  #============================ compareToGoals ===========================
+  #
+  #
+  def compareToGoals(self, theScene):
+    """!
+    @brief  Compare scene to all goals in one pass and rank them.
+
+    @param[in]  theScene    Scene elements, one per row.
+
+    @return     Progress levels of all goals (empty if no goals).
+    """
+
+    (nGoals, nElem, nDim) = self.goals.shape
+    if nGoals == 0:
+      return self.pLevels
+
+    theScene = np.asarray(theScene, dtype=float).reshape(-1, nDim)
+    scene = np.full((nElem, nDim), np.nan)
+    nUse  = min(nElem, theScene.shape[0])
+    scene[:nUse] = theScene[:nUse]
+
+    sqDist = np.sum(np.square(self.goals - scene[np.newaxis]), axis=2)
+    isMatch = sqDist < self.params.tau**2           # NaN never matches.
+
+    self.pLevels = np.count_nonzero(isMatch, axis=1) / np.maximum(self.nElem, 1)
+    self.ranking = np.argsort(-self.pLevels, kind="stable")
+
+    if nGoals > 0:
+      self.pLevel = self.pLevels[self.ranking[0]]
+
+    return self.pLevels
+
+  #================================ ranked ===============================
+  #
+  #
+  def ranked(self):
+    """!
+    @brief  Return ranked list of (goal name, progress level), best first.
+    """
+
+    return [(self.names[gi], self.pLevels[gi]) for gi in self.ranking]
+
 #
 #============================== perceiver.progress =============================
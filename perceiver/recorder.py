@@ -0,0 +1,581 @@
+#============================== perceiver.recorder =============================
+"""!
+
+@brief    Session recording of perceiver inputs and outcomes for audits and replay.
+
+A Recorder archives what a Perceiver saw (the frames) and what it concluded (the
+PerceiverState fields), plus the activity state when attached to a Monitor.  The
+recording should not slow down the live processing loop, so the caller thread only
+packages up the frame record and queues it.  A background writer thread collects
+records into chunks, compresses them, and writes them out.  Pose fields (Homog
+instances) are stored as homogeneous matrices.
+
+The on-disk format is a directory with one compressed numpy archive per chunk
+(chunk000000.npz, chunk000001.npz, ...) and a plain text index file.  Each chunk is
+written to a temporary file then renamed into place, after which the index gets a
+new line with the chunk time range.  Frame records not yet on disk (queued,
+accumulated, or being written) never exceed one chunk's worth, so a crash loses at
+most one chunk.  Once at the limit, new frames are dropped (and counted) rather
+than stalling the live loop, unless the recorder is configured to block.  Chunk
+files whose index line did not make it to disk are recovered when the session is
+re-opened.  Re-opening an existing session
+directory appends new chunks to it.
+
+A SessionReader loads the index only, then supports seek-by-time and loading of
+a time window or a subset of the recorded fields.  Chunks outside of the requested
+window are never opened.
+
+@author   agent,                agent@local
+@date     2026/10/19            [created]
+"""
+#============================== perceiver.recorder =============================
+#!
+#!NOTE:
+#!  set indent to 2 spaces.
+#!  do not indent function code.
+#!  set tab to 4 spaces with conversion to spaces.
+#!  90 columns
+#
+#============================== perceiver.recorder =============================
+
+import os
+import time
+import queue
+import threading
+import bisect
+import numpy as np
+
+from ivapy.Configuration import AlgConfig
+
+
+#============================== Support Functions ==============================
+#
+
+INDEXFILE = "index.csv"
+
+def _chunkName(chunkID):
+  return "chunk{:06d}.npz".format(chunkID)
+
+def _readIndex(dirname):
+  """!
+  @brief  Read chunk index of a session directory.  Recovers chunks that exist on
+          disk but did not get indexed (crash between chunk write and index write).
+
+  @param[in]  dirname   Session directory.
+
+  @return     List of index entries [chunkID, t0, t1, frame0, nFrames], sorted by ID.
+  """
+
+  entries = dict()
+
+  fname = os.path.join(dirname, INDEXFILE)
+  if os.path.isfile(fname):
+    with open(fname, "r") as fid:
+      for line in fid:
+        vals = line.strip().split(",")
+        if len(vals) != 5:                    # Partially written line. Ignore.
+          continue
+        try:
+          entries[int(vals[0])] = [int(vals[0]), float(vals[1]), float(vals[2]),
+                                   int(vals[3]), int(vals[4])]
+        except ValueError:
+          continue
+
+  # Scan for chunks missing from the index.  Only the last one(s) might be.
+  if os.path.isdir(dirname):
+    for cfile in sorted(os.listdir(dirname)):
+      if not (cfile.startswith("chunk") and cfile.endswith(".npz")):
+        continue
+      try:
+        cid = int(cfile[5:-4])
+      except ValueError:
+        continue
+      if cid in entries:
+        continue
+      try:
+        with np.load(os.path.join(dirname, cfile)) as cdata:
+          tvec = cdata["time"]
+          fvec = cdata["frame"]
+        entries[cid] = [cid, float(tvec[0]), float(tvec[-1]), int(fvec[0]), len(tvec)]
+      except Exception:
+        continue                              # Corrupt chunk. Lost to crash.
+
+  return [entries[cid] for cid in sorted(entries)]
+
+def _stackField(values, shape = None):
+  """!
+  @brief  Stack per-frame values of a field into a single array.
+
+  Missing values (None) get NaN filled to match the shape of the others.  If the
+  values do not share a shape, then an object array is the fallback.
+
+  @param[in]  values  List of per-frame values.
+  @param[in]  shape   Per-frame shape to use if all values are missing (optional).
+  """
+
+  proto = None
+  for val in values:
+    if val is not None:
+      proto = np.asarray(val)
+      break
+
+  if proto is None:
+    return np.full((len(values),) + tuple(shape or ()), np.nan)
+
+  try:
+    fill = np.full(proto.shape, np.nan)
+    return np.stack([fill if val is None else np.asarray(val) for val in values])
+  except (ValueError, TypeError):
+    theField = np.empty(len(values), dtype=object)
+    theField[:] = values
+    return theField
+
+def _asValue(theVal):
+  """!
+  @brief  Recordable version of a state field value.  Poses (Homog instances) map
+          to homogeneous matrices, and arrays get copied.
+  """
+
+  if hasattr(theVal, "R") and hasattr(theVal, "x"):
+    R = np.asarray(theVal.R, dtype=float)
+    x = np.reshape(np.asarray(theVal.x, dtype=float), (-1, 1))
+    return np.block([[R, x], [np.zeros((1, R.shape[1])), np.ones((1, 1))]])
+  elif isinstance(theVal, np.ndarray):
+    return theVal.copy()
+
+  return theVal
+
+def _joinParts(parts):
+  """!
+  @brief  Concatenate the per-chunk arrays of a field.
+
+  A chunk without values for the field is NaN filled to the per-frame shape of
+  the other chunks.  It is either missing the field (given as its frame count), or
+  has it as a 1D NaN array since no frame had a value when the chunk was written.
+
+  @param[in]  parts   List of arrays or frame counts, one per chunk.
+  """
+
+  shape = ()
+  for part in parts:
+    if isinstance(part, np.ndarray) and (part.ndim > 1):
+      shape = part.shape[1:]
+      break
+
+  full = []
+  for part in parts:
+    if not isinstance(part, np.ndarray):
+      part = np.full((part,) + shape, np.nan)
+    elif (part.ndim == 1) and (len(shape) > 0) and (part.dtype.kind == "f") \
+                                                and np.all(np.isnan(part)):
+      part = np.full((len(part),) + shape, np.nan)
+    full.append(part)
+
+  try:
+    return np.concatenate(full)
+  except ValueError:                  # Shapes still differ.  Fall back to objects.
+    theField = np.empty(sum(len(part) for part in full), dtype=object)
+    for (fi, val) in enumerate(val for part in full for val in part):
+      theField[fi] = val
+    return theField
+
+
+#================================= CfgRecorder =================================
+#
+class CfgRecorder(AlgConfig):
+  """!
+  @ingroup  Perceiver
+  @brief    Configuration instance for a session Recorder.
+
+  Fields of the CfgRecorder include:
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | dirname     | Session directory.  Created if missing, appended to if existing. |
+  | chunkLen    | Number of frames per chunk.  Also the maximum loss on a crash. |
+  | saveFrames  | Save the image frames (True) or only the states (False). |
+  | copyFrames  | Copy frames before queueing, in case the caller reuses the buffer. |
+  | fields      | PerceiverState fields to record. |
+  | block       | Wait for the writer when a chunk's worth is not yet on disk, |
+  |             | instead of dropping the frame. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a recorder configuration node.
+    """
+
+    if init_dict is None:
+      init_dict = CfgRecorder.get_default_settings()
+
+    super(CfgRecorder,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default configuration settings for Recorder.
+    """
+
+    default_settings = dict(dirname = "session", chunkLen = 100, saveFrames = True,
+                            copyFrames = True, block = False,
+                            fields = ["tMeas", "g", "tPts", "gOB", "haveObs", 
+                                      "haveState"])
+    return default_settings
+
+
+#=================================== Recorder ==================================
+#
+class Recorder(object):
+  """!
+  @ingroup  Perceiver
+  @brief    Archive perceiver frames and states to a chunked, time-indexed session.
+
+  The record member function is what gets invoked by the Perceiver or Monitor
+  process routines when the recorder is attached to them (set the `recorder`
+  member variable).  It only queues the information.  Compression and disk
+  writes happen on the writer thread.  Call close when done to write out the
+  final (partial) chunk.
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for the session recorder.
+
+    @param[in]  theConfig   Recorder configuration (optional).
+    """
+
+    if theConfig is None:
+      theConfig = CfgRecorder()
+
+    self.config = theConfig
+
+    os.makedirs(self.config.dirname, exist_ok = True)
+
+    # Continue from where the existing session (if any) left off.  Rewrite the
+    # index to drop any partially written line and to include recovered chunks.
+    index = _readIndex(self.config.dirname)
+    if len(index) > 0:
+      iname = os.path.join(self.config.dirname, INDEXFILE)
+      with open(iname + ".tmp", "w") as fid:
+        for entry in index:
+          fid.write("{},{!r},{!r},{},{}\n".format(*entry))
+      os.replace(iname + ".tmp", iname)
+
+      self.nextChunk = index[-1][0] + 1           #< ID of next chunk to write.
+      self.nFrames   = index[-1][3] + index[-1][4]  #< Frames submitted so far.
+    else:
+      self.nextChunk = 0
+      self.nFrames   = 0
+
+    self.shapes   = dict()                #< Per-frame shape of array fields.
+    self.queue    = queue.Queue()
+    self.unsaved  = threading.Semaphore(self.config.chunkLen)  #< Room for unsaved frames.
+    self.nDropped = 0                     #< Frames dropped, writer not keeping up.
+    self.isOpen   = True
+    self.thread = threading.Thread(target = self._writer, daemon = True)
+    self.thread.start()
+
+  #=================================== record ==================================
+  #
+  def record(self, I, pState, aState = None, tstamp = None):
+    """!
+    @brief  Queue up a frame record for archiving.
+
+    @param[in]  I       Image frame processed (ignored if frames not saved).
+    @param[in]  pState  PerceiverState after processing the frame.
+    @param[in]  aState  Activity state (optional).
+    @param[in]  tstamp  Time stamp of frame (optional). Default is current time.
+    """
+
+    if not self.isOpen:
+      return
+
+    if not self.unsaved.acquire(blocking = self.config.block):
+      self.nDropped += 1
+      self.nFrames  += 1                  # Frame numbers still count dropped frames.
+      return
+
+    if tstamp is None:
+      tstamp = time.time()
+
+    if not self.config.saveFrames:
+      I = None
+    elif self.config.copyFrames and I is not None:
+      I = np.array(I, copy=True)
+
+    theState = tuple(_asValue(getattr(pState, name, None)) 
+                                                for name in self.config.fields)
+
+    if aState is not None:
+      aState = getattr(aState, 'x', aState)
+
+    self.queue.put((tstamp, self.nFrames, I, theState, aState))
+    self.nFrames += 1
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Stop recording.  Writes out the last (partial) chunk and waits for the
+            writer thread to finish.
+    """
+
+    if self.isOpen:
+      self.isOpen = False
+      self.queue.put(None)
+      self.thread.join()
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  Only the configuration is kept.
+    """
+    return dict(config = self.config)
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Re-opens the session for appending.
+    """
+    self.__init__(theState["config"])
+
+  #================================== _writer ==================================
+  #
+  def _writer(self):
+    """!
+    @brief  Writer thread loop.  Accumulates records and writes them out per chunk.
+    """
+
+    chunk = []
+    while True:
+      item = self.queue.get()
+      if item is None:
+        break
+
+      chunk.append(item)
+      if len(chunk) >= self.config.chunkLen:
+        self._writeChunk(chunk)
+        chunk = []
+
+    if len(chunk) > 0:
+      self._writeChunk(chunk)
+
+  #================================ _writeChunk ================================
+  #
+  def _writeChunk(self, chunk):
+    """!
+    @brief  Compress and write a chunk, then add it to the session index.
+
+    @param[in]  chunk   List of frame records.
+    """
+
+    fields = list(zip(*chunk))
+
+    theData = dict(time      = np.array(fields[0], dtype=float),
+                   frame     = np.array(fields[1], dtype=np.int64))
+
+    for (name, values) in zip(self.config.fields, zip(*fields[3])):
+      theData[name] = self._stackField(name, values)
+
+    if self.config.saveFrames:
+      theData["image"] = self._stackField("image", fields[2])
+
+    if any(aval is not None for aval in fields[4]):
+      theData["activity"] = self._stackField("activity", fields[4])
+
+    cname = os.path.join(self.config.dirname, _chunkName(self.nextChunk))
+    with open(cname + ".tmp", "wb") as fid:
+      np.savez_compressed(fid, **theData)
+      fid.flush()
+      os.fsync(fid.fileno())
+    os.replace(cname + ".tmp", cname)
+
+    with open(os.path.join(self.config.dirname, INDEXFILE), "a") as fid:
+      fid.write("{},{!r},{!r},{},{}\n".format(self.nextChunk, float(fields[0][0]),
+                                          float(fields[0][-1]), fields[1][0], len(chunk)))
+      fid.flush()
+      os.fsync(fid.fileno())
+
+    self.nextChunk += 1
+    self.unsaved.release(len(chunk))
+
+  #================================ _stackField ================================
+  #
+  def _stackField(self, name, values):
+    """!
+    @brief  Stack per-frame values of a field, keeping track of its per-frame shape
+            so that a chunk with no values for it still gets stored with that shape.
+    """
+
+    theField = _stackField(values, self.shapes.get(name))
+    if (theField.dtype != object) and (theField.ndim > 1):
+      self.shapes[name] = theField.shape[1:]
+
+    return theField
+
+
+#================================ SessionReader ================================
+#
+class SessionReader(object):
+  """!
+  @ingroup  Perceiver
+  @brief    Read back a recorded session with seek-by-time and partial loading.
+
+  Only the index is loaded at construction.  Chunk contents are loaded on demand,
+  and only for the fields requested.  Field names are those of the recorder: time,
+  frame, image, activity, and the recorded PerceiverState fields (by default tMeas,
+  g, tPts, gOB, haveObs, and haveState).
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self, dirname):
+    """!
+    @brief  Constructor for the session reader.
+
+    @param[in]  dirname     Session directory.
+    """
+
+    self.dirname = dirname
+
+    index = np.array(_readIndex(dirname), dtype=float).reshape(-1, 5)
+
+    self.chunkIDs = index[:,0].astype(int)      #< Chunk IDs.
+    self.tStart   = index[:,1]                  #< Chunk start times.
+    self.tEnd     = index[:,2]                  #< Chunk end times.
+    self.frame0   = index[:,3].astype(int)      #< Chunk first frame indices.
+    self.nFrames  = index[:,4].astype(int)      #< Chunk frame counts.
+
+  #================================= numFrames =================================
+  #
+  def numFrames(self):
+    """!
+    @brief  Return the number of frames available in the session.
+    """
+    return int(np.sum(self.nFrames))
+
+  #================================= timeRange =================================
+  #
+  def timeRange(self):
+    """!
+    @brief  Return the session time range as (start, end), or None if empty.
+    """
+    if len(self.chunkIDs) == 0:
+      return None
+
+    return (self.tStart[0], self.tEnd[-1])
+
+  #================================= loadChunk =================================
+  #
+  def loadChunk(self, ci, fields = None):
+    """!
+    @brief  Load the requested fields of a chunk.
+
+    @param[in]  ci      Chunk position within index (not chunk ID).
+    @param[in]  fields  List of fields to load.  Default is all of them.
+
+    @return     Dict of field name to array.
+    """
+
+    cname = os.path.join(self.dirname, _chunkName(self.chunkIDs[ci]))
+    with np.load(cname, allow_pickle=True) as cdata:
+      if fields is None:
+        fields = cdata.files
+      return {fn: cdata[fn] for fn in fields if fn in cdata.files}
+
+  #==================================== seek ===================================
+  #
+  def seek(self, tstamp):
+    """!
+    @brief  Find the frame being processed at given time, i.e., the last frame
+            with time stamp no later than the given time.
+
+    @param[in]  tstamp  Time to seek to.
+
+    @return     Tuple (chunk position, offset within chunk), or None if the time
+                precedes the session.
+    """
+
+    ci = bisect.bisect_right(self.tStart, tstamp) - 1
+    if ci < 0:
+      return None
+
+    tvec = self.loadChunk(ci, ["time"])["time"]
+    return (ci, int(np.searchsorted(tvec, tstamp, side="right")) - 1)
+
+  #==================================== load ===================================
+  #
+  def load(self, tStart = None, tEnd = None, fields = None):
+    """!
+    @brief  Load all frames within a time window.  Only chunks overlapping the
+            window are opened.
+
+    @param[in]  tStart  Window start time (optional).  Default is session start.
+    @param[in]  tEnd    Window end time (optional).  Default is session end.
+    @param[in]  fields  List of fields to load (optional).  Default is all of them.
+
+    @return     Dict of field name to array, concatenated over frames.
+    """
+
+    if tStart is None:
+      tStart = -np.inf
+    if tEnd is None:
+      tEnd = np.inf
+
+    if fields is not None and "time" not in fields:
+      loadFields = list(fields) + ["time"]
+    else:
+      loadFields = fields
+
+    # Fields missing from a chunk (e.g., no activity state) get NaN filled so that
+    # all loaded fields stay aligned by frame.  The fields are those of any chunk.
+    chunks = []
+    names  = dict()
+    for ci in np.flatnonzero((self.tEnd >= tStart) & (self.tStart <= tEnd)):
+      cdata = self.loadChunk(ci, loadFields)
+      inWin = (cdata["time"] >= tStart) & (cdata["time"] <= tEnd)
+      chunks.append({fn: fv[inWin] for fn, fv in cdata.items()})
+      names.update(dict.fromkeys(cdata.keys()))
+
+    parts = dict()
+    for cdata in chunks:
+      for fn in names:
+        parts.setdefault(fn, []).append(cdata.get(fn, len(cdata["time"])))
+
+    theData = {fn: _joinParts(fv) for fn, fv in parts.items()}
+    if fields is not None:
+      theData = {fn: theData[fn] for fn in fields if fn in theData}
+
+    return theData
+
+  #================================== frameAt ==================================
+  #
+  def frameAt(self, tstamp, fields = None):
+    """!
+    @brief  Load the frame record being processed at the given time.
+
+    @param[in]  tstamp  Time to seek to.
+    @param[in]  fields  List of fields to load (optional).  Default is all of them.
+
+    @return     Dict of field name to value, or None if time precedes the session.
+    """
+
+    spot = self.seek(tstamp)
+    if spot is None:
+      return None
+
+    cdata = self.loadChunk(spot[0], fields)
+    return {fn: fv[spot[1]] for fn, fv in cdata.items()}
+
+
+#
+#============================== perceiver.recorder =============================
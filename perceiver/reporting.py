@@ -21,6 +21,7 @@
 #============================= perceiver.reporting =============================
 
 import itertools
+import numpy as np
 
 from ivapy.Configuration import AlgConfig
 import perceiver.reports.channels as chans
@@ -180,6 +181,75 @@ class Reporter:
     else:
       return False
 
+  #================================ processBatch ===============================
+  #
+  def processBatch(self, theSignals):
+    """!
+    @brief  Process a sequence of signals (e.g., from a recorded session) and
+            report as specified.
+
+    The trigger runs over the whole sequence at once.  Only the signals that
+    trigger get announced, in order (see _announceBatch).
+
+    @param[in]  theSignals  Sequence of signals (list, or array with time first).
+
+    @return     Boolean array of trigger outcomes.
+    """
+
+    isFired = self.trigger.testBatch(theSignals)
+    self._announceBatch([theSignals[si] for si in np.flatnonzero(isFired)], False)
+
+    return isFired
+
+  #=============================== _announceBatch ==============================
+  #
+  def _announceBatch(self, theSignals, useMessage = True):
+    """!
+    @brief  Announce the triggered signals of a batch, in order.
+
+    When the announcer does not act on acknowledgements (the base ack), each
+    announcement stands on its own.  They all get prepared first, then go to the
+    channel in one batch.  Otherwise (e.g., a RunningCommentary, which resets its
+    history on ack), the outcome of each ack affects the next announcement.  Then
+    each signal gets prepared, sent, and acknowledged in turn, as for process.
+
+    @param[in]  theSignals  List of triggered signals.
+    @param[in]  useMessage  Send the announcer message (else its announcement).
+    """
+
+    if len(theSignals) == 0:
+      return
+
+    if type(self.announcer).ack is not Announce.Announcement.ack:
+      for theSig in theSignals:
+        self.announcer.prepare(theSig)
+        theMsg = self.announcer.message() if useMessage else self.announcer.announcement
+        if self.channel.send(theMsg):
+          self.announcer.ack()
+      return
+
+    theMsgs = []
+    for theSig in theSignals:
+      self.announcer.prepare(theSig)
+      theMsgs.append(self.announcer.message() if useMessage
+                                              else self.announcer.announcement)
+
+    Reporter._ackBatch(self.announcer, self.channel.sendBatch(theMsgs))
+
+  #================================= _ackBatch =================================
+  #
+  @staticmethod
+  def _ackBatch(theAnnouncer, hasAcks):
+    """!
+    @brief  Acknowledge announcer once per acknowledged announcement of a batch.
+    """
+    if hasAcks is None:
+      return
+
+    for hasAck in hasAcks:
+      if hasAck:
+        theAnnouncer.ack()
+
 
 # NOT SURE WHAT THIS WAS INTENDED TO BE!!
 # MAYBE A SPECIALIZED CONSTRUCTION THE REQUIRED LESS PIECES DUE TO
@@ -196,9 +266,12 @@ class Reporter:
 class CfgBeatReporter(AlgConfig):
   """!
   @ingroup  Reports
-  @brief    Configuration instance for a Reporter.
+  @brief    Configuration instance for a BeatReporter.
 
-  @warning  NOT IMPLEMENTED.  JUST STUB CODE AS OF NOW.
+  | Field        | Meaning |
+  | :---         | :------- |
+  | filterSignal | Function applied to a triggering signal before announcing (optional). |
+  | signal       | Name of signal consumed, for Editor.tick routing (optional). |
   """
 
   #------------------------------ __init__ -----------------------------
@@ -223,7 +296,7 @@ class CfgBeatReporter(AlgConfig):
     """
 
     default_settings = CfgReporter.get_default_settings()
-    default_settings.update(dict( filterSignal = None ))
+    default_settings.update(dict( filterSignal = None, signal = None ))
     return default_settings
 
 
@@ -353,16 +426,17 @@ class BeatReporter(Reporter):
 
   #================================ unassignBeat ===============================
   #
-  def pauseBeat(self):
+  def unassignBeat(self):
     """!
-    @brief  Pause assignment.  
-    
-    When an assignment is paused, the BeatReporter will not report to Editor.
-    In fact, the default for the class is to not even process triggers.
-    Subclasses can overload this operational scheme and continue processing triggers
-    but without reporting the outcomes to the Editor. 
+    @brief  End assignment by unlinking from the Editor.
+
+    Usually invoked by the Editor when removing the beat.  The BeatReporter no
+    longer reports and cannot resume until given a new assignment.
     """
+
+    self.channel.assign(None, None)
     self.isOnAssignment = False
+    self.hasAssignment  = False
 
   #================================== process ==================================
   #
@@ -376,20 +450,67 @@ class BeatReporter(Reporter):
     """
 
     if self.isOnAssignment and self.trigger.test(theSignal):
+      self._announce(theSignal)
+      return True
+    else:
+      return False
 
-      if (self.config.filterSignal is None):
-        self.announcer.prepare(theSignal)
-      else:
-        self.announcer.prepare(self.config.filterSignal(theSignal))
+  #================================ processBatch ===============================
+  #
+  def processBatch(self, theSignals):
+    """!
+    @brief  Process a sequence of signals and report as specified.  See
+            Reporter.processBatch.
 
-      hasAck = self.channel.send(self.announcer.message())
+    The filter function (if any) is applied only to the signals that trigger.
+    When not on assignment, the trigger is not run, as for process.  See
+    Reporter._announceBatch for how the announcements are sent.
 
-      if hasAck:
-        self.announcer.ack()
+    BeatReporters of the Editor sharing an announcer (e.g., a group built with
+    buildGroupWithRunningCommentary) cannot process their batches one after the
+    other, since the shared announcer must see the frames in order.  Then a
+    ValueError is raised.  Use Editor.processBatch instead.
 
-      return True
+    @param[in]  theSignals  Sequence of signals (list, or array with time first).
+
+    @return     Boolean array of trigger outcomes.
+    """
+
+    if not self.isOnAssignment:
+      return np.zeros(len(theSignals), dtype=bool)
+
+    theEditor = getattr(self.channel, "editor", None)
+    if (theEditor is not None) and any((theReporter is not self) 
+                                       and (theReporter.announcer is self.announcer)
+                                       for theReporter in theEditor.reporters.values()):
+      raise ValueError("BeatReporter shares its announcer.  Use Editor.processBatch.")
+
+    isFired  = self.trigger.testBatch(theSignals)
+    theFired = [theSignals[si] for si in np.flatnonzero(isFired)]
+
+    if (self.config.filterSignal is not None):
+      theFired = [self.config.filterSignal(theSig) for theSig in theFired]
+
+    self._announceBatch(theFired)
+
+    return isFired
+
+  #================================= _announce =================================
+  #
+  def _announce(self, theSignal):
+    """!
+    @brief  Announce a triggered signal to the Editor.
+    """
+
+    if (self.config.filterSignal is None):
+      self.announcer.prepare(theSignal)
     else:
-      return False
+      self.announcer.prepare(self.config.filterSignal(theSignal))
+
+    hasAck = self.channel.send(self.announcer.message())
+
+    if hasAck:
+      self.announcer.ack()
 
 
   #=============================== assignToEditor ==============================
@@ -445,7 +566,7 @@ class BeatReporter(Reporter):
     if (beatrepCfg is None):
       beatrepCfg = CfgBeatReporter()
   
-    if (len(beatrepCfg) == 1):
+    if (beatrepCfg.__class__  != list):
       theBRCfgs = list()
       for ii in range(len(triggers)):
         theBRCfgs.append( beatrepCfg.clone() )
@@ -515,7 +636,7 @@ class BeatReporter(Reporter):
     if beatrepCfg is None:
       beatrepCfg = CfgBeatReporter()
   
-    if (len(beatrepCfg) == 1):
+    if (beatrepCfg.__class__  != list):
       theBRCfgs = list()
       for ii in range(len(triggers)):
         theBRCfgs.append( beatrepCfg.clone() )
@@ -706,6 +827,11 @@ class Editor:
   Typically the Editor will have a set of BeatReporters that are responsible for
   creating specific reporting output.  All of their streams are integrated into a
   single output stream (or channel).
+
+  The BeatReporters can be driven one by one, or all at once from a dict of named
+  signals per frame through tick.  Each BeatReporter consumes the signal named by
+  its configuration (signal field).  Derived signals (see addSignal) are computed
+  once per tick, no matter how many BeatReporters consume them.
   """
 
   #================================== __init__ =================================
@@ -730,16 +856,24 @@ class Editor:
     """
 
     if (theConfig is None):
-      theConfig = CfgEditor()
+      theConfig = CfgReporter()
 
-    ## List of BeatReporters to manage (replaces role of Triggers).
-    self.reporters = list()             
+    ## BeatReporters to manage, keyed by assignment ID (replaces role of Triggers).
+    self.reporters = dict()
     ## Final output channel for all reports.
     self.channel   = theChannel     
     ## Configuration of Editor
     self.config    = theConfig      
-    ## List of Revision filters for BeatReporter Commentary (optional).
-    self.revisions = list()             
+    ## Revision filters for BeatReporter Commentary, keyed by assignment ID.
+    self.revisions = dict()
+    ## Next automatic assignment ID.  IDs are never reused.
+    self.nextID    = 0
+    ## Derived signals, from name to (source signal name, filter function).
+    self.derived   = dict()
+    ## Routing table for tick, as (signal name, BeatReporter process functions).
+    self.routes    = None
+    ## Derived signals needed by the routing table, in order of computation.
+    self.derivs    = []
 
   #================================== addBeat ==================================
   #
@@ -751,21 +885,27 @@ class Editor:
     @param[in]  beatReporter    Tell editor to manage new beat reporter.
     @param[in]  beatRevisor     To revise reporters commentary output, if needed.
     @param[in]  assignID        Assignment ID. If not given, automatically done. 
-    """
 
-    nEl = len(self.reporters)
-    #DEBUG
-    #print('addBeat: ' + str(nEl))
+    @return     The assignment ID.
+    """
 
     #if (self.config.autoAssign):    # WHAT IS GOING ON HERE??? WHERE IS AUTOASSIGN?
     if assignID is None:
-      assignID = nEl
+      while self.nextID in self.reporters:
+        self.nextID += 1
+      assignID = self.nextID
+      self.nextID += 1
+    elif assignID in self.reporters:
+      raise ValueError("Assignment ID already in use: " + str(assignID))
 
-    self.reporters.append(beatReporter)
-    self.revisions.append(beatRevisor)
+    self.reporters[assignID] = beatReporter
+    self.revisions[assignID] = beatRevisor
+    self.routes = None
 
     beatReporter.assignBeat(self, assignID)
 
+    return assignID
+
     # @todo Or is this done by the channel?
     # @todo Figure out whether Editor configures things or channel construction
     #       does it. Or some mix?  Maybe channel is its own type but gets
@@ -776,6 +916,8 @@ class Editor:
   def assignGroup(self, theGroup, theRevisor = None, assignIDs = None):
     """!
     @brief  Assign a group of BeatReporters to the Editor.
+
+    @return     List of assignment IDs.
     """
 
     if (theRevisor is None) or (len(theRevisor) == 0) :
@@ -784,8 +926,8 @@ class Editor:
     if (assignIDs is None) or (len(assignIDs) !=  len(theGroup)):    
       assignIDs = list(itertools.repeat(None, len(theGroup)))
 
-    for bi in range(len(theGroup)):
-      self.addBeat(theGroup[bi], theRevisor[bi], assignIDs[bi])
+    return [self.addBeat(theGroup[bi], theRevisor[bi], assignIDs[bi])
+                                                         for bi in range(len(theGroup))]
 
   #================================== remBeat ==================================
   #
@@ -793,39 +935,158 @@ class Editor:
     """!
     @brief  Remove BeatReporter based on provided assignment ID. 
 
-    If the assignment ID is non-sensical (out of bounds), then the request
-    is ignored.  Currently no indication is provided for this outcome.
+    If the assignment ID is not known, then the request is ignored.  Assignment
+    IDs are stable, thus removing a beat does not affect the other BeatReporters.
+    The removed BeatReporter is unassigned, and can be added again later.
+
+    @param[in]  assignID    Assignment ID of reporter.
 
-    The default version of the Editor maintains a list of BeatReporters whose
-    assignment IDs match their placement in the list.  Removing a beat
-    reshuffles the list and triggers updated assignment IDs.  If outer
-    processing requires static IDs, then this class needs to be overloaded.
-    Or, it might be better for outer scope to use the Reporter handle.
-    That might be problematic if the outer scope is not privy to assignment
-    status.  Should query BeatReporter to know if it is on assignment. 
+    @return     The removed BeatReporter, or None if no such assignment.
+    """
+
+    theReporter = self.reporters.pop(assignID, None)
+    if theReporter is None:
+      return None
+
+    del self.revisions[assignID]
+    theReporter.unassignBeat()
+    self.routes = None
+
+    return theReporter
+
+  #================================== getBeat ==================================
+  #
+  def getBeat(self, assignID):
+    """!
+    @brief  BeatReporter with the provided assignment ID, or None if not known.
 
     @param[in]  assignID    Assignment ID of reporter.
     """
 
-    if (assignID >= 0) and (assignID < len(self.reporters)):
-      # @warning    Not good.  First find index by ID. Then remove
-      #             from reporter list and revision list.
-      #             Then unassign and whatever else.
-      #
-      # @note       Actually, looks kosher as reporters get new assignment IDs
-      #             in the for loop just below.  what is good way to manage?
-      #             What is Editor uses ordering or assignID to decide what
-      #             to do?  This can cause problems. To resolve later.
-      #
-      theReporter = self.reporters.pop(assignID)
-      self.revision.pop(assignID)
+    return self.reporters.get(assignID)
+
+  #================================= addSignal =================================
+  #
+  def addSignal(self, theName, theSource, theFilter):
+    """!
+    @brief  Define a derived signal for tick to compute from a source signal.
+
+    The filter gets applied once per tick, then all BeatReporters consuming the
+    derived signal get the outcome.  Use it for filters that would otherwise be
+    repeated in each BeatReporter's filterSignal, or in outer scope.  The source
+    may itself be a derived signal, as long as it was added before.
+
+    @param[in]  theName     Name of derived signal.
+    @param[in]  theSource   Name of source signal.
+    @param[in]  theFilter   Function mapping source signal to derived signal.
+    """
+
+    self.derived[theName] = (theSource, theFilter)
+    self.routes = None
+
+  #================================== reroute ==================================
+  #
+  def reroute(self):
+    """!
+    @brief  Rebuild routing table on next tick.
+
+    Adding or removing beats and signals does so automatically.  Invoke after
+    changing the signal consumed by a BeatReporter already assigned.
+    """
+
+    self.routes = None
+
+  #==================================== tick ===================================
+  #
+  def tick(self, theSignals):
+    """!
+    @brief  Process a frame of named signals through all routed BeatReporters.
+
+    BeatReporters are processed in groups by signal (in order of the earliest
+    assigned consumer), then in assignment order within a group.  Signals missing
+    from the dict are skipped, as are BeatReporters with no signal configured.
+
+    @param[in]  theSignals  Dict from signal name to signal value.
+    """
+
+    if self.routes is None:
+      self._buildRoutes()
 
-      theReporter.unAssign();
-      # TODO:   BeatReporter needs isOnAssignment or onAssignment
+    if self.derivs:
+      theSignals = dict(theSignals)
+      for (theName, theSource, theFilter) in self.derivs:
+        if theSource in theSignals:
+          theSignals[theName] = theFilter(theSignals[theSource])
 
-      for ii in range(assignID,len(self.reporters)):
-        self.reporters(ii).newAssignment(ii)
+    for (theName, theBeats) in self.routes:
+      if theName in theSignals:
+        theSig = theSignals[theName]
+        for process in theBeats:
+          process(theSig)
 
+  #================================ processBatch ===============================
+  #
+  def processBatch(self, theSignals):
+    """!
+    @brief  Process a sequence of signals through all BeatReporters, with the same
+            outcome as giving each frame to each BeatReporter in turn (process).
+
+    The triggers run over the whole sequence at once.  The triggered signals are
+    then announced frame by frame, in assignment order within a frame.  Thus
+    BeatReporters sharing an announcer (e.g., a RunningCommentary) see the frames
+    in order, and the Editor channel gets the reports in the same order as for
+    step by step processing.  BeatReporters not on assignment are skipped.
+
+    @param[in]  theSignals  Sequence of signals (list, or array with time first).
+
+    @return     Dict from assignment ID to boolean array of trigger outcomes.
+    """
+
+    theBeats = [(assignID, theReporter) for (assignID, theReporter) 
+                        in self.reporters.items() if theReporter.isOnAssignment]
+
+    isFired = dict()
+    (iSigs, iBeats) = ([], [])
+    for (bi, (assignID, theReporter)) in enumerate(theBeats):
+      isFired[assignID] = np.asarray(theReporter.trigger.testBatch(theSignals),
+                                                                        dtype=bool)
+      iFired = np.flatnonzero(isFired[assignID])
+      iSigs.append(iFired)
+      iBeats.append(np.full(len(iFired), bi))
+
+    if iSigs:
+      (iSigs, iBeats) = (np.concatenate(iSigs), np.concatenate(iBeats))
+      for ei in np.lexsort((iBeats, iSigs)):
+        theBeats[iBeats[ei]][1]._announce(theSignals[iSigs[ei]])
+
+    return isFired
+
+  #================================ _buildRoutes ===============================
+  #
+  def _buildRoutes(self):
+    """!
+    @brief  Build routing table from the BeatReporter signal names.
+
+    Only derived signals with consumers (directly or through other derived
+    signals) are kept for computing.
+    """
+
+    theRoutes = dict()
+    for theReporter in self.reporters.values():
+      theName = getattr(theReporter.config, "signal", None)
+      if theName is not None:
+        theRoutes.setdefault(theName, []).append(theReporter.process)
+
+    isNeeded = set(theRoutes)
+    for theName in reversed(list(self.derived)):
+      if theName in isNeeded:
+        isNeeded.add(self.derived[theName][0])
+
+    self.derivs = [(theName, theSource, theFilter)
+                      for (theName, (theSource, theFilter)) in self.derived.items()
+                      if theName in isNeeded]
+    self.routes = [(theName, tuple(theBeats))
+                      for (theName, theBeats) in theRoutes.items()]
 
   #================================== incoming =================================
   #
@@ -835,13 +1096,12 @@ class Editor:
             assignment ID.
 
     The default Editor simply has a bunch of BeatReporters and gives them IDs
-    according to order attached to the Editor.  This gives placement in the
-    list.  
+    according to order attached to the Editor (unless given).  Reports from an
+    unknown assignment ID are ignored.
     
     If more specialized processing with interactions between BeatReporters is
     needed, then this Editor class should be overloaded so that assigment
     conditional output and assigment coordinated output may be implemented.
-    Or so that assignment ID involves a lookup to be unbound from ordering.
 
     @param[in]  assignID    Assignment ID
     @param[in]  theReport   Report generated by the BeatReporter.
@@ -851,17 +1111,38 @@ class Editor:
     #print('Editor: incoming. ' + str(assignID))
     #print(theReport)
     #print(type(theReport))
-    if (assignID >= 0) and (assignID < len(self.reporters)):
-      
-      if (self.revisions[assignID] is None):
-        if theReport is not None:
-          self.channel.send(theReport)
-          # self.reporter(assignID).getCommentary)
-      else:
-        self.channel.send(self.revisions(assignID).review(theReport))
+    if assignID not in self.revisions:
+      return
+
+    theRevisor = self.revisions[assignID]
+    if (theRevisor is None):
+      if theReport is not None:
+        self.channel.send(theReport)
+    else:
+      self.channel.send(theRevisor.review(theReport))
+
+  #=============================== incomingBatch ===============================
+  #
+  def incomingBatch(self, assignID, theReports):
+    """!
+    @brief  There are several incoming outputs from a BeatReporter (batch
+            processing).  Same as incoming for each, but sent on in one batch.
+
+    @param[in]  assignID    Assignment ID
+    @param[in]  theReports  List of reports generated by the BeatReporter.
+    """
+
+    if assignID not in self.revisions:
+      return
+
+    theRevisor = self.revisions[assignID]
+    if (theRevisor is None):
+      theReports = [theReport for theReport in theReports if theReport is not None]
+    else:
+      theReports = [theRevisor.review(theReport) for theReport in theReports]
 
-    # TODO: Just made up how operates above.  Review function invocations and
-    #       correct as needed.
+    if theReports:
+      self.channel.sendBatch(theReports)
 
 
 
@@ -24,8 +24,128 @@
 #========================== perceiver.reports.channel ==========================
 
 from ivapy.Configuration import AlgConfig
+import os
 import csv
-import rospy
+import math
+import gzip
+import lzma
+import json
+import time
+import shutil
+import queue
+import pickle
+import socket
+import struct
+import threading
+import collections
+import dataclasses
+import multiprocessing
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+FRAMELEN = struct.Struct("!I")         # Length prefix of out-of-process messages.
+
+RECLEN    = struct.Struct("<I")         # Shared ring record length.
+RINGHEAD  = struct.Struct("<8sQQQ")     # Shared ring magic, capacity, write cursor,
+RINGMAGIC = b"PRING002"                 # and write reservation.
+RINGWRAP  = 0xFFFFFFFF                  # Shared ring wrap marker.
+
+_attachLock = threading.Lock()          # Shared ring reader attach (Python < 3.13).
+
+
+#============================== Support Functions ==============================
+#
+
+def _reopen(filename, fpos, newline=None, replay=False):
+  """!
+  @brief  Re-open a channel output file for appending.
+
+  Used to restore file based channels from a checkpoint.  By default, output
+  written after the checkpoint was taken is kept (e.g., crash recovery, where the
+  restored run does not reproduce it).  For exact replay, the file gets truncated
+  to the saved position, since the output will be regenerated.
+  """
+  if replay and os.path.isfile(filename) and (os.path.getsize(filename) > fpos):
+    os.truncate(filename, fpos)
+
+  return open(filename, "a", newline=newline)
+
+def _toBytes(thePayload, usePickle = False):
+  """!
+  @brief  Serialize payload for out-of-process channels.  A one byte tag gives the
+          payload type: B for bytes, S for (utf-8) text, J for anything else (JSON
+          encoded), or P (pickled) when pickling is requested.
+  """
+  if isinstance(thePayload, (bytes, bytearray, memoryview)):
+    return b"B" + bytes(thePayload)
+  elif isinstance(thePayload, str):
+    return b"S" + thePayload.encode("utf-8")
+  elif usePickle:
+    return b"P" + pickle.dumps(thePayload, protocol = pickle.HIGHEST_PROTOCOL)
+  else:
+    return b"J" + json.dumps(_jsonSafe(thePayload), default = _jsonDefault,
+                             separators = (",", ":"), allow_nan = False).encode("utf-8")
+
+def _fromBytes(theData, allowPickle = False):
+  """!
+  @brief  Deserialize payload serialized by _toBytes.
+
+  Pickled payloads are decoded only when allowed, since unpickling data from an
+  untrusted source can run arbitrary code.  Otherwise they raise a ValueError.
+  """
+  theTag  = bytes(theData[:1])
+  theBody = theData[1:]
+  if theTag == b"S":
+    return bytes(theBody).decode("utf-8")
+  elif theTag == b"J":
+    return json.loads(bytes(theBody))
+  elif theTag == b"P":
+    if not allowPickle:
+      raise ValueError("Pickled payload refused.  Pickle decoding not enabled.")
+    return pickle.loads(theBody)
+  else:
+    return bytes(theBody)
+
+def _jsonDefault(theObj):
+  """!
+  @brief  Convert instance not natively handled by the json package: numpy arrays
+          and scalars, sets, dataclasses, and instances with attributes.
+  """
+  if isinstance(theObj, np.ndarray):
+    theObj = theObj.tolist()
+  elif isinstance(theObj, np.generic):
+    theObj = theObj.item()
+  elif isinstance(theObj, (set, frozenset)):
+    theObj = list(theObj)
+  elif dataclasses.is_dataclass(theObj):
+    theObj = {field.name: getattr(theObj, field.name)
+                                      for field in dataclasses.fields(theObj)}
+  elif hasattr(theObj, "__dict__"):
+    theObj = dict(vars(theObj))
+  else:
+    raise TypeError("Cannot JSON encode type: " + type(theObj).__name__)
+
+  return _jsonSafe(theObj)
+
+def _jsonSafe(theObj):
+  """!
+  @brief  Replace non-finite floats with None (JSON null), recursing into dicts
+          and lists.  The standard json package would write NaN, which is not JSON.
+  """
+  if isinstance(theObj, float):
+    return theObj if math.isfinite(theObj) else None
+  elif isinstance(theObj, dict):
+    return {key: _jsonSafe(val) for (key, val) in theObj.items()}
+  elif isinstance(theObj, (list, tuple)):
+    return [_jsonSafe(val) for val in theObj]
+
+  return theObj
+
 
 #=================================== Channel ===================================
 #
@@ -103,6 +223,48 @@ class Channel:
     print(theAnnouncement, end = self.config.end)
     return True
 
+  #================================= sendBatch =================================
+  #
+  def sendBatch(self, theAnnouncements):
+    """!
+    @brief  Send several announcements in one call.
+
+    The base version sends each in turn.  Derived classes that can do better
+    (fewer writes, fewer transfers) overload it.
+
+    @param[in]  theAnnouncements    List of announcements.
+
+    @return     List of send outcomes (acknowledgements), one per announcement.
+    """
+    return [self.send(theAnnouncement) for theAnnouncement in theAnnouncements]
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Push out any pending output.  Nothing to do for the base class.
+    """
+    pass
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Release the channel output stream.  Nothing to do for the base class.
+    """
+    pass
+
+  #================================= __enter__ =================================
+  #
+  def __enter__(self):
+    return self
+
+  #================================== __exit__ =================================
+  #
+  def __exit__(self, excType, excValue, traceback):
+    self.close()
+    return False
+
 
 
 #==================================== toFile ===================================
@@ -112,6 +274,14 @@ class CfgToFile(CfgChannel):
   """!
   @ingroup  Reports
   @brief    Configuration instance for a Channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | filename    | Output file name. |
+  | otype       | File open mode, "w" to start over, "a" to append. |
+  | header      | Header written at the top (optional). |
+  | runner      | Value put in front of each row, for csv output (optional). |
+  | replay      | On checkpoint restore, drop output written after the checkpoint. |
   """
 
   #------------------------------ __init__ -----------------------------
@@ -137,7 +307,7 @@ class CfgToFile(CfgChannel):
 
     default_settings = CfgChannel.get_default_settings()
     default_settings.update(dict(filename = "chanout.txt", otype="w", 
-                                 header=None, runner=None))
+                                 header=None, runner=None, replay=False))
     return default_settings
 
 class toFile(Channel):
@@ -165,10 +335,49 @@ class toFile(Channel):
     return True
     # @todo see if fid.write returns success status?
 
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    self.fid.flush()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Flush any pending output and close the file.  Safe to call again.
+    """
+    if not self.fid.closed:
+      self.flush()
+      self.fid.close()
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  The file object gets replaced by the file position.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    theState["fid"] = self.fid.tell()
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Re-opens the file for appending.  With replay set,
+            anything written after the checkpoint gets dropped.
+    """
+    self.__dict__.update(theState)
+    self.fid = _reopen(self.config.filename, theState["fid"], 
+                                             replay = self.config.replay)
+
   #================================== __del__ ==================================
   #
   def __del__(self):
-    self.fid.close()
+    if hasattr(self, "fid"):
+      self.close()
 
 #==================================== toCSV ====================================
 #
@@ -225,14 +434,66 @@ class toCSV(Channel):
 
     return True
 
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    self.fid.flush()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Flush any pending output and close the file.  Safe to call again.
+    """
+    if not self.fid.closed:
+      self.flush()
+      self.fid.close()
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  The file object gets replaced by the file position.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    theState["fid"] = self.fid.tell()
+    del theState["writer"]
+    return theState
 
-#==================================== toROSmsg ===================================
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Re-opens the file for appending.  With replay set,
+            anything written after the checkpoint gets dropped.
+    """
+    self.__dict__.update(theState)
+    self.fid    = _reopen(self.config.filename, theState["fid"], newline='',
+                                                replay = self.config.replay)
+    self.writer = csv.writer(self.fid)
+
+  #================================== __del__ ==================================
+  #
+  def __del__(self):
+    if hasattr(self, "fid"):
+      self.close()
+
+
+#================================ toBufferedFile ===============================
 #
 
-class CfgToROSmsg(CfgChannel):
+class CfgToBufferedFile(CfgToFile):
   """!
   @ingroup  Reports
-  @brief    Configuration instance for a Channel.
+  @brief    Configuration instance for buffered file channels.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | maxBytes    | Text channel flushes once this many characters are pending. |
+  | maxRows     | CSV channel flushes once this many rows are pending. |
+  | interval    | Flush when this many seconds passed since last flush. None to disable. |
   """
 
   #------------------------------ __init__ -----------------------------
@@ -243,7 +504,7 @@ class CfgToROSmsg(CfgChannel):
     """
 
     if init_dict is None:
-      init_dict = CfgToROSmsg.get_default_settings()
+      init_dict = CfgToBufferedFile.get_default_settings()
 
     super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
 
@@ -253,107 +514,2518 @@ class CfgToROSmsg(CfgChannel):
   @staticmethod
   def get_default_settings():
     """!
-    @brief  Get default build configuration settings for Trigger.
+    @brief  Get default build configuration settings for buffered file channels.
     """
 
-    default_settings = CfgChannel.get_default_settings()
-    default_settings.update(dict(topic = "", type = None, bufflen = 0))
+    default_settings = CfgToFile.get_default_settings()
+    default_settings.update(dict(maxBytes = 65536, maxRows = 1000, interval = 1.0))
     return default_settings
 
-
-class toROSmsg(Channel):
+class toBufferedFile(toFile):
   """!
   @ingroup  Reports
-  @brief    Pass along to a ROS topic. 
+  @brief    Save to file channel with batched writes.
 
-  Saves the reports to a ROS message compatible with the message type.
-  This class will most likely be overloaded to permit customization of
-  the message type and announcement contents.
+  Announcements are held in memory and written out as one block once enough of
+  them are pending, or once the flush interval has passed.  The interval is checked
+  when sending, thus no output happens while nothing is being sent.  Use flush or
+  close for the tail data, or use as a context manager:
+
+      with toBufferedFile(theConfig) as media:
+        ...
   """
 
-  #============================= toROSmsg __init__ =============================
+  #========================== toBufferedFile __init__ ==========================
   #
-  def __init__(self, theConfig = CfgToROSmsg()):
+  def __init__(self, theConfig = None):
     """!
-    @brief  Constructor for base trigger class.
+    @brief  Constructor for buffered file channel.
     """
-    self.config = theConfig
+    if theConfig is None:
+      theConfig = CfgToBufferedFile()
+
+    super(toBufferedFile,self).__init__(theConfig)
 
-    self.pub = rospy.Publisher(self.config.topic, self.config.type, self.config.bufflen)
-    #self.fid = open(self.config.filename, self.config.otype)
-    # @todo Deal with ros topic connection / open for publishing.
-    # Also will need the publisher, or is that internally handled here?
+    self.pending  = []                  #< Announcements not yet written.
+    self.nPending = 0                   #< Number of characters pending.
+    self.tFlush   = time.monotonic()    #< Time of last flush.
 
   #==================================== send ===================================
   #
   def send(self, theAnnouncement):
-    # REPLACE: self.fid.write(theAnnouncement)
-    # PUBLISH THE TOPIC.
-    self.publish(theAnnouncement)
+    self.pending.append(theAnnouncement)
+    self.nPending += len(theAnnouncement)
+
+    if (self.nPending >= self.config.maxBytes) or self._isDue():
+      self.flush()
+
     return True
-    # @todo see if fid.write returns success status?
 
-  #================================== __del__ ==================================
+  #=================================== flush ===================================
   #
-  def __del__(self):
-    #!self.fid.close()
-    # @todo Probably nothing to do here.
+  def flush(self):
+    """!
+    @brief  Write out pending announcements.
+    """
+    if self.pending:
+      self.fid.write("".join(self.pending))
+      self.pending  = []
+      self.nPending = 0
 
+    self.fid.flush()
+    self.tFlush = time.monotonic()
 
+  #=================================== _isDue ==================================
+  #
+  def _isDue(self):
+    return (self.config.interval is not None) and \
+           (time.monotonic() - self.tFlush >= self.config.interval)
 
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    super(toBufferedFile,self).__setstate__(theState)
+    self.tFlush = time.monotonic()
 
 
-#================================== Assignment =================================
+#================================ toBufferedCSV ================================
 #
-class Assignment(Channel):
+
+class toBufferedCSV(toCSV):
   """!
   @ingroup  Reports
-  @brief    Assignment class for communication between BeatReporter and Editor.
+  @brief    Save to CSV formatted file channel with batched writes.
 
-  An assignment is what links a BeatReporter with and Editor.  It maintains
-  information about the assignment (at minimum it's ID) and what Editor is
-  attached to the BeatReporter.  The base implementation will simply pass along
-  the BeatReporter's Commentary or Announcement.
+  Same as toCSV, except that the rows are held in memory and written out together
+  once enough of them are pending, or once the flush interval has passed.  Rows
+  get copied when sent, so the caller may re-use the row instance.  See
+  toBufferedFile regarding the flush interval, flush/close, and context manager use.
   """
 
-  #============================ Assignment __init__ ============================
+  #=========================== toBufferedCSV __init__ ==========================
   #
-  def __init__(self, theConfig = CfgChannel()):
+  def __init__(self, theConfig = None):
     """!
-    @brief  Constructor for base trigger class.
+    @brief  Constructor for buffered CSV channel.
     """
-    super(Assignment,self).__init__(theConfig)
+    if theConfig is None:
+      theConfig = CfgToBufferedFile()
 
-    ## Assignment ID given by managing editor.
-    self.id     = None
-    ## Editor linked to the assignment.  Who to report news to.
-    self.editor = None
-    ## Is assignment one that doesn't report to editor, but just part of accumulating info?
-    self.keepQuiet = False
+    super(toBufferedCSV,self).__init__(theConfig)
 
-  #=================================== assign ==================================
+    self.pending = []                   #< Rows not yet written.
+    self.tFlush  = time.monotonic()     #< Time of last flush.
+
+  #================================= sendHeader ================================
   #
-  def assign(self, assignID, assignEditor):
+  def sendHeader(self, theHeader = None):
+    self.flush()
+    super(toBufferedCSV,self).sendHeader(theHeader)
+
+  #==================================== send ===================================
+  #
+  def send(self, theRow):
+    if theRow is None:
+      print("Skipping")
+      return False
+
+    if self.config.runner is not None:
+      outRow = [self.config.runner]
+      outRow.extend(theRow)
+    else:
+      outRow = list(theRow)
+
+    self.pending.append(outRow)
+
+    if (len(self.pending) >= self.config.maxRows) or self._isDue():
+      self.flush()
+
+    return True
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
     """!
-    @brief  BeatReporter has been assigned work. Follow up on request by
-            configuring a channel between (i.e., linking) Reporter and Editor.
+    @brief  Write out pending rows.
+    """
+    if self.pending:
+      self.writer.writerows(self.pending)
+      self.pending = []
 
-    @param[in]  assignID        ID of assignment/beat.
-    @param[in]  assignEditor    Editor managing the assignment/beat.
+    self.fid.flush()
+    self.tFlush = time.monotonic()
+
+  #=================================== _isDue ==================================
+  #
+  def _isDue(self):
+    return (self.config.interval is not None) and \
+           (time.monotonic() - self.tFlush >= self.config.interval)
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    super(toBufferedCSV,self).__setstate__(theState)
+    self.tFlush = time.monotonic()
+
+
+#=================================== toJSONL ===================================
+#
+
+class CfgToJSONL(CfgToBufferedFile):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a JSON Lines channel.
+
+  Same fields as CfgToBufferedFile, with a default file name for JSON Lines.
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
     """
 
-    self.id     = assignID
-    self.editor = assignEditor
+    if init_dict is None:
+      init_dict = CfgToJSONL.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toJSONL.
+    """
+
+    default_settings = CfgToBufferedFile.get_default_settings()
+    default_settings.update(dict(filename = "chanout.jsonl"))
+    return default_settings
+
+class toJSONL(toBufferedFile):
+  """!
+  @ingroup  Reports
+  @brief    Save structured payloads (e.g., Commentary) as JSON Lines.
+
+  Each sent payload becomes one JSON encoded line.  Dicts, lists, and scalars map
+  directly.  Numpy arrays and scalars are converted without an intermediate copy of
+  the payload.  Other instances (dataclasses such as PerceiverState, or plain
+  classes) are encoded as a dict of their fields.  The field layout of dataclasses
+  and slotted classes is worked out once per type and cached, while plain class
+  instances use their own attributes.
+
+  The orjson package is used for encoding when installed, otherwise the standard
+  json package.  Both give the same output: non-string dict keys (e.g., int) are
+  written as strings, and non-finite floats as null.  Lines are batched as per
+  toBufferedFile.
+  """
+
+  #============================== toJSONL __init__ =============================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for JSON Lines channel.
+    """
+    if theConfig is None:
+      theConfig = CfgToJSONL()
+
+    super(toJSONL,self).__init__(theConfig)
+
+    self.layouts = dict()               #< Field names by (fixed layout) payload type.
 
   #==================================== send ===================================
   #
-  def send(self, theCommentary):
-    if not self.keepQuiet:
-      self.editor.incoming(self.id, theCommentary)
-      return True
+  def send(self, thePayload):
+    if thePayload is None:
+      return False
+
+    return super(toJSONL,self).send(self.encode(thePayload) + "\n")
+
+  #=================================== encode ==================================
+  #
+  def encode(self, thePayload):
+    """!
+    @brief  Encode payload as a JSON string (no line ending).
+    """
+    if orjson is not None:
+      return orjson.dumps(thePayload, default = self._default,
+                 option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    else:
+      return json.dumps(_jsonSafe(thePayload), default = self._default,
+                        separators = (",", ":"), allow_nan = False)
+
+  #================================== _default =================================
+  #
+  def _default(self, theObj):
+    """!
+    @brief  Convert instance not natively handled by the JSON encoder.
+    """
+    if isinstance(theObj, np.ndarray):
+      theObj = theObj.tolist()
+    elif isinstance(theObj, np.generic):
+      theObj = theObj.item()
+    elif isinstance(theObj, (set, frozenset)):
+      theObj = list(theObj)
     else:
+      theType = type(theObj)
+      fields  = self.layouts.get(theType)
+      if fields is None:
+        if dataclasses.is_dataclass(theObj):
+          fields = [field.name for field in dataclasses.fields(theObj)]
+          self.layouts[theType] = fields
+        elif hasattr(theObj, "__dict__"):   # Attributes may differ per instance.
+          fields = list(vars(theObj).keys())
+        elif hasattr(theType, "__slots__"):
+          fields = list(theType.__slots__)
+          self.layouts[theType] = fields
+        else:
+          raise TypeError("Cannot JSON encode type: " + theType.__name__)
+
+      theObj = {name: getattr(theObj, name) for name in fields}
+
+    return theObj if orjson is not None else _jsonSafe(theObj)
+
+
+#================================== toColumns ==================================
+#
+
+class CfgToColumns(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a columnar binary channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | dirname     | Output directory.  One file per column plus an index file. |
+  | schema      | List of (name, dtype) or (name, dtype, shape) tuples. |
+  | chunkRows   | Number of rows to buffer before appending to the column files. |
+  | otype       | "w" to start over, "a" to append to existing output. |
+  | replay      | On checkpoint restore, drop rows written after the checkpoint. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToColumns.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toColumns.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(dirname = "chancols", schema = None, 
+                                 chunkRows = 4096, otype = "w", replay = False))
+    return default_settings
+
+class toColumns(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Save to typed binary column files.
+
+  Formatting numbers as text (toCSV) is slow to write and slow to load back.  The
+  toColumns channel instead keeps a fixed schema of named, typed fields.  Sent rows
+  are placed into a typed chunk buffer, which gets appended as raw binary to one
+  file per field once full.  A small JSON index holds the schema and the row count,
+  and is updated after each chunk so that the files are always loadable.  The
+  static load member function memory maps the column files.
+
+  A row is either a sequence in schema order or a dict keyed by field name.  Use
+  sendBatch to append many rows at once, given as a dict of column arrays.
+  """
+
+  INDEXFILE = "index.json"
+
+  #============================= toColumns __init__ ============================
+  #
+  def __init__(self, theConfig):
+    """!
+    @brief  Constructor for columnar binary channel.
+
+    @param[in]  theConfig   CfgToColumns instance.  The schema must be given.
+    """
+    super(toColumns,self).__init__(theConfig)
+
+    if self.config.schema is None:
+      raise ValueError("toColumns channel requires a schema.")
+
+    self.dtype  = np.dtype([tuple(field) for field in self.config.schema])
+    self.buffer = np.zeros(self.config.chunkRows, dtype=self.dtype)
+    self.nBuf   = 0                     #< Number of rows in buffer.
+    self.nRows  = 0                     #< Number of rows in column files.
+
+    self._openColumns()
+
+  #==================================== send ===================================
+  #
+  def send(self, theRow):
+    if theRow is None:
       return False
 
+    if isinstance(theRow, dict):
+      theRow = tuple(theRow[name] for name in self.dtype.names)
+
+    self.buffer[self.nBuf] = tuple(theRow)
+    self.nBuf += 1
+
+    if self.nBuf >= self.config.chunkRows:
+      self.flush()
+
+    return True
+
+  #================================= sendBatch =================================
+  #
+  def sendBatch(self, theColumns):
+    """!
+    @brief  Append many rows at once.
+
+    @param[in]  theColumns  Dict of column arrays by field name, structured array,
+                            or list of rows.
+
+    @return     List of send outcomes, one per row.
+    """
+    if isinstance(theColumns, list):
+      return super(toColumns,self).sendBatch(theColumns)
+
+    self.flush()
+
+    nNew = len(theColumns[self.dtype.names[0]])
+    for name in self.dtype.names:
+      theCol = np.ascontiguousarray(theColumns[name], dtype=self.dtype[name].base)
+      self.fids[name].write(theCol.reshape((nNew,) + self.dtype[name].shape).tobytes())
+
+    self.nRows += nNew
+    self._writeIndex()
+    return [True] * nNew
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Append buffered rows to the column files and update the index.
+    """
+    if self.nBuf > 0:
+      for name in self.dtype.names:
+        self.fids[name].write(np.ascontiguousarray(self.buffer[name][:self.nBuf]).tobytes())
+
+      self.nRows += self.nBuf
+      self.nBuf   = 0
+
+    for fid in self.fids.values():
+      fid.flush()
+
+    self._writeIndex()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Write out buffered rows and close the column files.  Safe to call again.
+    """
+    if self.fids is not None:
+      self.flush()
+      for fid in self.fids.values():
+        fid.close()
+      self.fids = None
+
+  #==================================== load ===================================
+  #
+  @staticmethod
+  def load(dirname, fields = None, mode = "r"):
+    """!
+    @brief  Memory map saved columns.
+
+    @param[in]  dirname     Output directory of a toColumns channel.
+    @param[in]  fields      List of field names to load (optional). Default is all.
+    @param[in]  mode        Memory map mode (optional). Default is read-only.
+
+    @return     Dict of column arrays by field name.
+    """
+    with open(os.path.join(dirname, toColumns.INDEXFILE), "r") as fid:
+      theIndex = json.load(fid)
+
+    theCols = dict()
+    for (name, dstr, shape) in theIndex["schema"]:
+      if (fields is not None) and (name not in fields):
+        continue
+
+      shape = (theIndex["rows"],) + tuple(shape)
+      if theIndex["rows"] == 0:
+        theCols[name] = np.zeros(shape, dtype=np.dtype(dstr))
+      else:
+        theCols[name] = np.memmap(os.path.join(dirname, name + ".bin"), 
+                                  dtype=np.dtype(dstr), mode=mode, shape=shape)
+
+    return theCols
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  Buffered rows are written out first, then the
+            open files are left out.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    del theState["fids"]
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Rows written after the checkpoint are kept, up to
+            the last row complete in every column.  With replay set, column files
+            are truncated to the saved row count instead.
+    """
+    self.__dict__.update(theState)
+    if not self.config.replay:
+      self.nRows = max(self.nRows, self._rowsOnDisk())
+    self._appendColumns()
+
+  #================================== __del__ ==================================
+  #
+  def __del__(self):
+    if hasattr(self, "fids"):
+      self.close()
+
+  #================================ _openColumns ===============================
+  #
+  def _openColumns(self):
+    """!
+    @brief  Open column files for appending.  When appending to existing output,
+            the saved schema must match.
+    """
+    os.makedirs(self.config.dirname, exist_ok = True)
+
+    iname = os.path.join(self.config.dirname, toColumns.INDEXFILE)
+    if (self.config.otype == "a") and os.path.isfile(iname):
+      with open(iname, "r") as fid:
+        theIndex = json.load(fid)
+
+      if theIndex["schema"] != self._schemaList():
+        raise ValueError("Schema does not match existing output: " + iname)
+
+      self.nRows = theIndex["rows"]
+      self._appendColumns()
+    else:
+      self.fids = {name: open(os.path.join(self.config.dirname, name + ".bin"), "wb")
+                                                        for name in self.dtype.names}
+      self._writeIndex()
+
+  #================================ _rowsOnDisk ================================
+  #
+  def _rowsOnDisk(self):
+    """!
+    @brief  Number of rows complete in every column file.
+    """
+    nRows = []
+    for name in self.dtype.names:
+      fname = os.path.join(self.config.dirname, name + ".bin")
+      nRows.append(os.path.getsize(fname) // self.dtype[name].itemsize
+                                              if os.path.isfile(fname) else 0)
+
+    return min(nRows)
+
+  #=============================== _appendColumns ==============================
+  #
+  def _appendColumns(self):
+    """!
+    @brief  Open column files for appending, truncated to the current row count.
+    """
+    for name in self.dtype.names:
+      fname = os.path.join(self.config.dirname, name + ".bin")
+      if os.path.isfile(fname):
+        os.truncate(fname, self.nRows * self.dtype[name].itemsize)
+
+    self.fids = {name: open(os.path.join(self.config.dirname, name + ".bin"), "ab")
+                                                        for name in self.dtype.names}
+    self._writeIndex()
+
+  #================================ _writeIndex ================================
+  #
+  def _writeIndex(self):
+    iname = os.path.join(self.config.dirname, toColumns.INDEXFILE)
+    with open(iname + ".tmp", "w") as fid:
+      json.dump(dict(schema = self._schemaList(), rows = self.nRows), fid)
+
+    os.replace(iname + ".tmp", iname)
+
+  #================================ _schemaList ================================
+  #
+  def _schemaList(self):
+    return [[name, self.dtype[name].base.str, list(self.dtype[name].shape)] 
+                                                        for name in self.dtype.names]
+
+
+#================================== toRotating =================================
+#
+
+class CfgToRotating(CfgToFile):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a rotating file channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | filename    | Base file name.  Segments get a number inserted before the extension. |
+  | maxBytes    | Roll over to a new segment once this size is reached. |
+  | interval    | Roll over after this many seconds (wall clock). None to disable. |
+  | compress    | Compression of closed segments: "gzip", "lzma", or None. |
+  | maxSegments | Number of closed segments to keep.  None to keep all. |
+  | csv         | Write rows as CSV (as toCSV does) instead of text announcements. |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToRotating.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toRotating.
+    """
+
+    default_settings = CfgToFile.get_default_settings()
+    default_settings.update(dict(maxBytes = 10485760, interval = 3600.0, 
+                                 compress = "gzip", maxSegments = None, csv = False))
+    return default_settings
+
+class toRotating(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Save to a sequence of size or time limited files, compressing old ones.
+
+  Output goes to segment files named after the configured file name with a segment
+  number before the extension (chanout.000000.txt, chanout.000001.txt, ...).  Once
+  the current segment reaches the size limit, or has been open for the time
+  interval, it is closed and a new one is opened.  Closed segments are compressed,
+  and the oldest ones deleted when over the segment count, by a background thread.
+  The reporting path only pays for the file switch.
+
+  A manifest file (chanout.manifest.json) lists the segments with their current
+  file names, the time range (wall clock) of their contents, and their size before
+  compression.  It is rewritten whenever a segment gets opened, compressed, or
+  deleted.
+
+  With the csv flag set, rows are written as per toCSV.  Otherwise the header is
+  text, written as is.  Either way, the header (if any) gets repeated at the top of
+  each segment.
+
+  Only compressed segments get deleted.  A segment still waiting for compression
+  stays, even if that briefly makes for more than maxSegments of them.
+
+  When the manifest of an earlier run exists, the channel picks up its segments
+  and continues with the next segment number, so nothing gets overwritten.  Any
+  segment left open or uncompressed (e.g., after a crash) gets closed out and
+  compressed.  On checkpoint restore, writing continues in the saved segment, as
+  long as it is still the latest one and not yet compressed.  Otherwise a new
+  segment is opened.
+  """
+
+  #============================ toRotating __init__ ============================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for rotating file channel.
+    """
+    if theConfig is None:
+      theConfig = CfgToRotating()
+
+    if theConfig.compress not in (None, "gzip", "lzma"):
+      raise ValueError("Unknown compression: " + str(theConfig.compress))
+
+    super(toRotating,self).__init__(theConfig)
+
+    (self.stem, self.ext) = os.path.splitext(self.config.filename)
+
+    self.manifest = []                  #< Segment entries (dicts).
+    self.segID    = 0                   #< Number of the current segment.
+    self.fid      = None
+    self.writer   = None
+
+    self._resume()
+
+  #================================= sendHeader ================================
+  #
+  def sendHeader(self, theHeader = None):
+    if theHeader is not None:
+      self.config.header = theHeader
+
+    self._writeHeader()
+
+  #================================= setRunner =================================
+  #
+  def setRunner(self, theRunner):
+    self.config.runner = theRunner
+
+  #==================================== send ===================================
+  #
+  def send(self, theAnnouncement):
+    if theAnnouncement is None:
+      return False
+
+    if not self.config.csv:
+      self.fid.write(theAnnouncement)
+    elif self.config.runner is not None:
+      outRow = [self.config.runner]
+      outRow.extend(theAnnouncement)
+      self.writer.writerow(outRow)
+    else:
+      self.writer.writerow(theAnnouncement)
+
+    tNow  = time.time()
+    entry = self.manifest[-1]
+    if entry["t0"] is None:
+      entry["t0"] = tNow
+    entry["t1"] = tNow
+
+    if (self.fid.tell() >= self.config.maxBytes) or ((self.config.interval is not None)
+                               and (time.monotonic() - self.tOpen >= self.config.interval)):
+      self._rollover()
+
+    return True
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    self.fid.flush()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Close current segment, then wait for it to be compressed and for the
+            background thread to stop.  Safe to call again.
+    """
+    if self.thread is not None:
+      self._closeSegment()
+      self.queue.put(None)
+      self.thread.join()
+      self.thread = None
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  The file, lock, queue, and background thread are
+            left out.  The file gets replaced by the file position.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    with self.lock:
+      theState["manifest"] = [dict(seg) for seg in self.manifest]
+    theState["fid"] = self.fid.tell()
+    for name in ("writer", "lock", "queue", "thread"):
+      del theState[name]
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Picks up the segments on disk, then re-opens the
+            saved segment or opens a new one.  Starts up a new background thread.
+    """
+    self.__dict__.update(theState)
+    self.writer = None
+    self._resume(theState["fid"])
+
+  #================================== __del__ ==================================
+  #
+  def __del__(self):
+    if hasattr(self, "thread"):
+      self.close()
+
+  #================================== _resume ==================================
+  #
+  def _resume(self, fpos = None):
+    """!
+    @brief  Pick up segments of an earlier run (if any), start the background
+            thread, then continue the current segment or open the next one.
+
+    @param[in]  fpos    Saved position in current segment (checkpoint restore).
+    """
+    theSegs = self._readManifest()
+    if theSegs is not None:
+      self.manifest = theSegs
+    else:
+      self.manifest = [seg for seg in self.manifest if os.path.isfile(seg["file"])]
+
+    doReopen = (fpos is not None) and (len(self.manifest) > 0) \
+                                  and (self.manifest[-1]["id"] == self.segID) \
+                                  and not self._isCompressed(self.manifest[-1])
+
+    self.lock   = threading.Lock()
+    self.queue  = queue.Queue()
+    for seg in self.manifest[:len(self.manifest) - int(doReopen)]:
+      if seg["bytes"] is None:
+        seg["bytes"] = os.path.getsize(seg["file"])
+      if not self._isCompressed(seg):
+        self.queue.put(seg)
+
+    self.thread = threading.Thread(target = self._compressor, daemon = True)
+    self.thread.start()
+
+    if doReopen:
+      entry = self.manifest[-1]
+      entry["bytes"] = None
+      self.fid   = _reopen(entry["file"], fpos, "" if self.config.csv else None,
+                                              self.config.replay)
+      self.tOpen = time.monotonic()
+      if self.config.csv:
+        self.writer = csv.writer(self.fid)
+    else:
+      self.segID = 1 + max([seg["id"] for seg in self.manifest], default = -1)
+      self._openSegment()
+
+  #=============================== _readManifest ===============================
+  #
+  def _readManifest(self):
+    """!
+    @brief  Segment entries from the manifest file, leaving out those whose file is
+            gone.  None if there is no manifest file.
+    """
+    mname = self.stem + ".manifest.json"
+    if not os.path.isfile(mname):
+      return None
+
+    with open(mname) as fid:
+      theSegs = json.load(fid)
+
+    return [seg for seg in theSegs if os.path.isfile(seg["file"])]
+
+  #=============================== _isCompressed ===============================
+  #
+  def _isCompressed(self, entry):
+    """!
+    @brief  Is segment done with compression (or is there none to do)?
+    """
+    return (self.config.compress is None) or entry["file"].endswith((".gz", ".xz"))
+
+  #================================ _openSegment ===============================
+  #
+  def _openSegment(self):
+    """!
+    @brief  Open next segment file and add it to the manifest.
+    """
+    fname = "{}.{:06d}{}".format(self.stem, self.segID, self.ext)
+
+    self.fid    = open(fname, "w", newline = "" if self.config.csv else None)
+    self.tOpen  = time.monotonic()
+    if self.config.csv:
+      self.writer = csv.writer(self.fid)
+
+    self._writeHeader()
+
+    with self.lock:
+      self.manifest.append(dict(id = self.segID, file = fname, t0 = None, t1 = None,
+                                bytes = None))
+      self._writeManifest()
+
+  #================================ _writeHeader ===============================
+  #
+  def _writeHeader(self):
+    """!
+    @brief  Write header (if any) to current segment, as a csv row or as text.
+    """
+    if self.config.header is None:
+      return
+
+    if self.config.csv:
+      self.writer.writerow(self.config.header)
+    else:
+      self.fid.write(self.config.header)
+
+  #=============================== _closeSegment ===============================
+  #
+  def _closeSegment(self):
+    """!
+    @brief  Close current segment and hand it over to the background thread.
+    """
+    entry = self.manifest[-1]
+
+    self.fid.close()
+    with self.lock:
+      entry["bytes"] = os.path.getsize(entry["file"])
+
+    self.queue.put(entry)
+
+  #================================= _rollover =================================
+  #
+  def _rollover(self):
+    self._closeSegment()
+    self.segID += 1
+    self._openSegment()
+
+  #================================ _compressor ================================
+  #
+  def _compressor(self):
+    """!
+    @brief  Background thread loop.  Compresses closed segments, then deletes the
+            oldest ones when there are too many.
+
+    Segments get compressed in closing order, thus the segments up to the one just
+    compressed are the ones done.  Only these may get deleted.
+    """
+    while True:
+      entry = self.queue.get()
+      if entry is None:
+        break
+
+      if (self.config.compress is not None) and os.path.isfile(entry["file"]):
+        cname = toRotating._compress(entry["file"], self.config.compress)
+        with self.lock:
+          entry["file"] = cname
+
+      with self.lock:
+        if self.config.maxSegments is not None:
+          nClosed = sum(seg["bytes"] is not None for seg in self.manifest)
+          nDone   = 1 + next(si for (si, seg) in enumerate(self.manifest) if seg is entry)
+          nDrop   = min(max(nClosed - self.config.maxSegments, 0), nDone)
+          for seg in self.manifest[:nDrop]:
+            if os.path.isfile(seg["file"]):
+              os.remove(seg["file"])
+            self.manifest.remove(seg)
+
+        self._writeManifest()
+
+  #================================= _compress =================================
+  #
+  @staticmethod
+  def _compress(fname, method):
+    """!
+    @brief  Compress file, then remove the original.
+
+    @return     Compressed file name.
+    """
+    if method == "gzip":
+      (opener, cname) = (gzip.open, fname + ".gz")
+    else:
+      (opener, cname) = (lzma.open, fname + ".xz")
+
+    with open(fname, "rb") as fin, opener(cname + ".tmp", "wb") as fout:
+      shutil.copyfileobj(fin, fout)
+
+    os.replace(cname + ".tmp", cname)
+    os.remove(fname)
+    return cname
+
+  #=============================== _writeManifest ==============================
+  #
+  def _writeManifest(self):
+    """!
+    @brief  Rewrite manifest file.  Lock must be held by caller.
+    """
+    mname = self.stem + ".manifest.json"
+    with open(mname + ".tmp", "w") as fid:
+      json.dump(self.manifest, fid, indent = 1)
+
+    os.replace(mname + ".tmp", mname)
+
+
+#=================================== toSocket ==================================
+#
+
+class CfgToSocket(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a socket channel.
+
+  | Field         | Meaning |
+  | :---          | :------- |
+  | address       | Unix domain socket path, or host name when port is given. |
+  | port          | TCP port.  None for Unix domain socket. |
+  | batchSize     | Number of messages to collect before sending. |
+  | maxPending    | Maximum number of unsent messages (e.g., while disconnected). |
+  | overflow      | When too many pending: "block", "dropOldest", "dropNewest". |
+  | timeout       | Socket send timeout (seconds). None to wait forever. |
+  | retryInterval | Minimum time between reconnect attempts (seconds). |
+  | usePickle     | Pickle payloads instead of JSON encoding them (trusted peers). |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToSocket.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toSocket.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(address = "/tmp/perceiver.sock", port = None,
+                                 batchSize = 64, maxPending = 10000, overflow = "block",
+                                 timeout = 1.0, retryInterval = 0.5,
+                                 usePickle = False))
+    return default_settings
+
+class toSocket(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Send to a local process over a Unix domain or TCP socket.
+
+  Each message is a frame consisting of a 4 byte (network order) length, then the
+  serialized payload.  The payload starts with a one byte type tag: B for bytes, S
+  for utf-8 text, and J for anything else, JSON encoded (tuples arrive as lists,
+  instances as dicts of their attributes).  With usePickle set, instances are
+  pickled instead (tag P), which the receiver must explicitly accept.  Messages are
+  collected and sent together once the batch size is reached, or when flushed.
+
+  If the connection is not up or breaks, messages stay pending and reconnection is
+  attempted on the next send (no more often than the retry interval).  A batch that
+  failed mid-send gets re-sent in full on reconnection (possibly repeating some
+  messages), but messages already accepted by the socket when the receiver went
+  away are lost.  Once there are too many pending messages, the overflow policy applies:
+  block the sender until the messages go out (backpressure), or drop the oldest or
+  the newest messages.  Dropped messages are counted.
+
+  Sending still happens on the caller thread.  To decouple it from the processing
+  loop, wrap the channel with Async.  The SocketReceiver class is a reference
+  receiver.
+  """
+
+  #============================= toSocket __init__ =============================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for socket channel.  Attempts to connect right away.
+    """
+    if theConfig is None:
+      theConfig = CfgToSocket()
+
+    if theConfig.overflow not in ("block", "dropOldest", "dropNewest"):
+      raise ValueError("Unknown overflow policy: " + str(theConfig.overflow))
+
+    super(toSocket,self).__init__(theConfig)
+
+    self.sock     = None
+    self.pending  = collections.deque()   #< Unsent frames.
+    self.nSent    = 0                     #< Number of messages sent.
+    self.nDropped = 0                     #< Number of messages dropped.
+    self.tRetry   = 0                     #< Earliest time for next connect attempt.
+
+    self._connect()
+
+  #==================================== send ===================================
+  #
+  def send(self, thePayload):
+    """!
+    @brief  Queue payload for sending.  Sends the batch if it is complete.
+
+    @return     False if the payload got dropped, otherwise True.
+    """
+    if thePayload is None:
+      return False
+
+    theData = _toBytes(thePayload, self.config.usePickle)
+
+    if len(self.pending) >= self.config.maxPending:
+      if self.config.overflow == "dropNewest":
+        self.nDropped += 1
+        return False
+      elif self.config.overflow == "dropOldest":
+        self.pending.popleft()
+        self.nDropped += 1
+      else:
+        while not self.flush():
+          time.sleep(self.config.retryInterval)
+
+    self.pending.append(FRAMELEN.pack(len(theData)) + theData)
+
+    if len(self.pending) >= self.config.batchSize:
+      self.flush()
+
+    return True
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Send pending messages.
+
+    @return     True if nothing remains pending.
+    """
+    if len(self.pending) == 0:
+      return True
+
+    if self.sock is None:
+      self._connect()
+      if self.sock is None:
+        return False
+
+    try:
+      self.sock.sendall(b"".join(self.pending))
+    except OSError:
+      self._disconnect()
+      return False
+
+    self.nSent += len(self.pending)
+    self.pending.clear()
+    return True
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Make a last attempt to send pending messages, then disconnect.
+    """
+    self.tRetry = 0
+    self.flush()
+    self._disconnect()
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  The socket is left out, pending messages kept.
+    """
+    theState = self.__dict__.copy()
+    theState["sock"] = None
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    self.__dict__.update(theState)
+    self.tRetry = 0
+
+  #================================== _connect =================================
+  #
+  def _connect(self):
+    """!
+    @brief  Attempt connection, unless the last attempt was too recent.
+    """
+    tNow = time.monotonic()
+    if tNow < self.tRetry:
+      return
+
+    self.tRetry = tNow + self.config.retryInterval
+
+    if self.config.port is None:
+      theSock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+      theAddr = self.config.address
+    else:
+      theSock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+      theSock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+      theAddr = (self.config.address, self.config.port)
+
+    try:
+      theSock.settimeout(self.config.timeout)
+      theSock.connect(theAddr)
+      self.sock = theSock
+    except OSError:
+      theSock.close()
+
+  #================================ _disconnect ================================
+  #
+  def _disconnect(self):
+    if self.sock is not None:
+      try:
+        self.sock.close()
+      except OSError:
+        pass
+      self.sock = None
+
+
+#================================ SocketReceiver ===============================
+#
+
+class SocketReceiver(object):
+  """!
+  @ingroup  Reports
+  @brief    Reference receiver for toSocket channels.
+
+  Listens on a Unix domain or TCP socket and accepts any number of senders.  The
+  frames are read on background threads, deserialized, and queued up for the
+  caller.  Useful as a local stand-in for an out-of-process aggregator.
+
+  TCP listens on the loopback interface unless given another address.  Pickled
+  payloads are refused (and counted) unless allowPickle is set.  Unpickling lets
+  the sender run arbitrary code in the receiving process, so only allow it when
+  every peer that can reach the socket is trusted.  In particular, do not combine
+  it with a socket bound beyond loopback.
+  """
+
+  #========================== SocketReceiver __init__ ==========================
+  #
+  def __init__(self, address = None, port = None, allowPickle = False):
+    """!
+    @brief  Constructor for socket receiver.  Starts listening right away.
+
+    @param[in]  address     Unix domain socket path, or host name when port given
+                            (optional).  Default is /tmp/perceiver.sock, or the
+                            loopback interface for TCP.
+    @param[in]  port        TCP port (optional).  Zero picks a free port.
+    @param[in]  allowPickle Decode pickled payloads (optional).  Trusted peers only.
+    """
+    if address is None:
+      address = "/tmp/perceiver.sock" if port is None else "127.0.0.1"
+
+    self.address  = address
+    self.port     = port
+    self.allowPickle = allowPickle
+    self.queue    = queue.Queue()
+    self.running  = True
+    self.conns    = set()               #< Open sender connections.
+    self.nRefused = 0                   #< Number of refused (undecodable) messages.
+
+    if port is None:
+      if os.path.exists(address):
+        os.remove(address)
+      self.lsock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+      self.lsock.bind(address)
+    else:
+      self.lsock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+      self.lsock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+      self.lsock.bind((address, port))
+      self.port = self.lsock.getsockname()[1]
+
+    self.lsock.listen()
+    self.lsock.settimeout(0.1)          # So that the accept loop notices close.
+
+    self.thread = threading.Thread(target = self._accept, daemon = True)
+    self.thread.start()
+
+  #==================================== recv ===================================
+  #
+  def recv(self, timeout = None):
+    """!
+    @brief  Get next received message.
+
+    @param[in]  timeout     Time to wait (optional).  Default is to wait forever.
+
+    @return     The message, or None if timed out.
+    """
+    try:
+      return self.queue.get(timeout = timeout)
+    except queue.Empty:
+      return None
+
+  #================================== messages =================================
+  #
+  def messages(self):
+    """!
+    @brief  Get all messages received so far, as a list.
+    """
+    theMsgs = []
+    while True:
+      try:
+        theMsgs.append(self.queue.get_nowait())
+      except queue.Empty:
+        return theMsgs
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Stop listening and drop sender connections.
+    """
+    if self.running:
+      self.running = False
+      self.thread.join()
+      self.lsock.close()
+      for conn in list(self.conns):
+        try:
+          conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+          pass
+      if (self.port is None) and os.path.exists(self.address):
+        os.remove(self.address)
+
+  #================================== _accept ==================================
+  #
+  def _accept(self):
+    while self.running:
+      try:
+        (conn, addr) = self.lsock.accept()
+      except socket.timeout:
+        continue
+      except OSError:
+        break
+
+      conn.settimeout(None)
+      self.conns.add(conn)
+      threading.Thread(target = self._serve, args = (conn,), daemon = True).start()
+
+  #=================================== _serve ==================================
+  #
+  def _serve(self, conn):
+    """!
+    @brief  Read frames from a connection until the sender closes it.  A partial
+            frame at the end is discarded.
+    """
+    with conn:
+      while True:
+        theHead = SocketReceiver._recvExact(conn, FRAMELEN.size)
+        if theHead is None:
+          break
+
+        theData = SocketReceiver._recvExact(conn, FRAMELEN.unpack(theHead)[0])
+        if theData is None:
+          break
+
+        try:
+          self.queue.put(_fromBytes(theData, self.allowPickle))
+        except ValueError:
+          self.nRefused += 1
+
+    self.conns.discard(conn)
+
+  #================================= _recvExact ================================
+  #
+  @staticmethod
+  def _recvExact(conn, nBytes):
+    theBuf = bytearray(nBytes)
+    theView = memoryview(theBuf)
+    nRead = 0
+    while nRead < nBytes:
+      try:
+        nNew = conn.recv_into(theView[nRead:])
+      except OSError:
+        return None
+      if nNew == 0:
+        return None
+      nRead += nNew
+
+    return theBuf
+
+
+#================================= toSharedRing ================================
+#
+
+class CfgToSharedRing(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a shared memory ring buffer channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | name        | Name of the shared memory block. |
+  | capacity    | Ring buffer size in bytes (rounded up to a multiple of 8). |
+  | usePickle   | Pickle payloads instead of JSON encoding them (trusted readers). |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToSharedRing.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toSharedRing.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(name = "perceiver_ring", capacity = 1048576,
+                                 usePickle = False))
+    return default_settings
+
+class toSharedRing(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Write reports into a shared memory ring buffer for local consumers.
+
+  The shared memory block has a small header (magic, capacity, write cursor), then
+  the ring buffer.  Each record is a 4 byte length followed by the payload (as per
+  toSocket), padded to a multiple of 8 bytes.  When a record does not fit before the
+  end of the buffer, a wrap marker is written and the record goes at the start.
+  As for toSocket, instances get pickled only with usePickle set, and readers must
+  then allow it.  Any process of the same user can attach to the block.
+
+  There is one writer and no lock.  The write cursor is the total number of bytes
+  written, and it gets updated only after the record is in place.  Before writing,
+  the writer publishes a reservation, the write cursor once the record is in place.
+  Readers keep their own cursor.  After copying a record, a reader checks the
+  reservation to detect when the writer has lapped it, even when the write is still
+  in progress.  The writer never waits on readers; slow readers lose records
+  instead.  Any number of readers may attach with SharedRingReader.
+
+  The channel creates the shared memory block, and removes it when closed.  On
+  checkpoint restore, the channel re-attaches to the block when it still exists
+  (same name and capacity), else creates it anew.  Writing continues from the saved
+  write cursor, or from the block's own if further along.
+  """
+
+  #=========================== toSharedRing __init__ ===========================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for shared memory ring channel.
+    """
+    if theConfig is None:
+      theConfig = CfgToSharedRing()
+
+    super(toSharedRing,self).__init__(theConfig)
+
+    self.capacity = 8 * ((self.config.capacity + 7) // 8)
+    try:
+      self.shm = shared_memory.SharedMemory(name = self.config.name, create = True,
+                                            size = RINGHEAD.size + self.capacity)
+    except FileExistsError:             # Stale block from earlier run. Replace it.
+      shared_memory.SharedMemory(name = self.config.name).unlink()
+      self.shm = shared_memory.SharedMemory(name = self.config.name, create = True,
+                                            size = RINGHEAD.size + self.capacity)
+
+    RINGHEAD.pack_into(self.shm.buf, 0, RINGMAGIC, self.capacity, 0, 0)
+    self.cursor = 0                                           #< Total bytes written.
+    self._view()
+
+  #==================================== send ===================================
+  #
+  def send(self, thePayload):
+    if thePayload is None:
+      return False
+
+    theData = _toBytes(thePayload, self.config.usePickle)
+    nData   = len(theData)
+    recLen  = 8 * ((RECLEN.size + nData + 7) // 8)
+
+    if recLen > self.capacity:
+      raise ValueError("Report too large for shared ring: " + str(nData) + " bytes.")
+
+    pos = self.cursor % self.capacity
+    if pos + recLen > self.capacity:
+      self.words[3] = self.cursor + self.capacity - pos + recLen  # Reserve.
+      RECLEN.pack_into(self.ring, pos, RINGWRAP)
+      self.cursor += self.capacity - pos
+      pos = 0
+    else:
+      self.words[3] = self.cursor + recLen                        # Reserve.
+
+    RECLEN.pack_into(self.ring, pos, nData)
+    self.ring[pos+RECLEN.size:pos+RECLEN.size+nData] = theData
+
+    self.cursor  += recLen
+    self.words[2] = self.cursor                                 # Publish.
+    return True
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Release and remove the shared memory block.  Safe to call again.
+    """
+    if self.shm is not None:
+      self.words.release()
+      self.ring.release()
+      self.shm.close()
+      try:
+        self.shm.unlink()
+      except FileNotFoundError:         # Already removed (e.g., by a restored copy).
+        pass
+      self.shm = None
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  Only the configuration and write cursor are kept.
+    """
+    return dict(config = self.config, capacity = self.capacity, cursor = self.cursor)
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Re-attaches to the shared memory block, or creates
+            it if gone (or not compatible).
+    """
+    self.__dict__.update(theState)
+
+    try:
+      self.shm = shared_memory.SharedMemory(name = self.config.name)
+      (magic, capacity, cursor, _) = RINGHEAD.unpack_from(self.shm.buf, 0)
+      if (magic != RINGMAGIC) or (capacity != self.capacity):
+        self.shm.close()
+        self.shm.unlink()
+        raise FileNotFoundError
+      self.cursor = max(self.cursor, cursor)
+    except FileNotFoundError:
+      self.shm = shared_memory.SharedMemory(name = self.config.name, create = True,
+                                            size = RINGHEAD.size + self.capacity)
+
+    RINGHEAD.pack_into(self.shm.buf, 0, RINGMAGIC, self.capacity, self.cursor, 
+                                                                  self.cursor)
+    self._view()
+
+  #================================== __del__ ==================================
+  #
+  def __del__(self):
+    if hasattr(self, "shm"):
+      self.close()
+
+  #=================================== _view ===================================
+  #
+  def _view(self):
+    self.words  = self.shm.buf[:RINGHEAD.size].cast("Q")      #< Header as uint64s.
+    self.ring   = self.shm.buf[RINGHEAD.size:]                #< Ring buffer data.
+
+
+#=============================== SharedRingReader ==============================
+#
+
+class SharedRingReader(object):
+  """!
+  @ingroup  Reports
+  @brief    Reader for toSharedRing channels (in another process, typically).
+
+  The reader starts at the current write cursor, thus gets only records written
+  after attaching.  When the writer laps the reader, the reader skips ahead to the
+  write cursor and counts the overrun.  Pickled payloads are refused (and counted)
+  unless allowPickle is set, as for SocketReceiver.
+  """
+
+  #========================= SharedRingReader __init__ =========================
+  #
+  def __init__(self, name = "perceiver_ring", decode = True, allowPickle = False):
+    """!
+    @brief  Constructor for shared memory ring reader.
+
+    @param[in]  name        Name of the shared memory block.
+    @param[in]  decode      Deserialize payloads (optional).  Else return bytes.
+    @param[in]  allowPickle Decode pickled payloads (optional).  Trusted writers only.
+    """
+    self.shm      = SharedRingReader._attach(name)
+    self.decode   = decode
+    self.allowPickle = allowPickle
+
+    (magic, self.capacity, self.cursor, _) = RINGHEAD.unpack_from(self.shm.buf, 0)
+    if magic != RINGMAGIC:
+      self.shm.close()
+      raise ValueError("Not a perceiver shared ring: " + name)
+
+    self.words    = self.shm.buf[:RINGHEAD.size].cast("Q")
+    self.ring     = self.shm.buf[RINGHEAD.size:]
+    self.nLost    = 0                   #< Number of overruns.
+    self.nRefused = 0                   #< Number of refused (undecodable) records.
+
+  #==================================== read ===================================
+  #
+  def read(self):
+    """!
+    @brief  Read all records written since the last read.
+
+    @return     List of payloads.
+    """
+    theMsgs = []
+    wCursor = self.words[2]
+
+    while self.cursor < wCursor:
+      pos = self.cursor % self.capacity
+      (nData,) = RECLEN.unpack_from(self.ring, pos)
+      if nData != RINGWRAP:
+        theData = bytes(self.ring[pos+RECLEN.size:pos+RECLEN.size+nData])
+
+      # Lapped, or the writer reserved (is writing) over the record while copying?
+      if self.words[3] - self.cursor > self.capacity:
+        self.nLost += 1
+        self.cursor = self.words[2]
+        break
+
+      if nData == RINGWRAP:
+        self.cursor += self.capacity - pos
+        continue
+
+      self.cursor += 8 * ((RECLEN.size + nData + 7) // 8)
+      if not self.decode:
+        theMsgs.append(theData)
+        continue
+
+      try:
+        theMsgs.append(_fromBytes(theData, self.allowPickle))
+      except ValueError:
+        self.nRefused += 1
+
+    return theMsgs
+
+  #==================================== poll ===================================
+  #
+  def poll(self, timeout = None, interval = 0.0005):
+    """!
+    @brief  Wait for new records, then read them.
+
+    @param[in]  timeout     Maximum wait time (optional).  Default is forever.
+    @param[in]  interval    Sleep time between checks (optional).
+
+    @return     List of payloads, empty if timed out.
+    """
+    tEnd = None if timeout is None else time.monotonic() + timeout
+    while self.words[2] == self.cursor:
+      if (tEnd is not None) and (time.monotonic() >= tEnd):
+        return []
+      time.sleep(interval)
+
+    return self.read()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Detach from the shared memory block.  Safe to call again.
+    """
+    if self.shm is not None:
+      self.words.release()
+      self.ring.release()
+      self.shm.close()
+      self.shm = None
+
+  #================================== _attach ==================================
+  #
+  @staticmethod
+  def _attach(name):
+    """!
+    @brief  Attach to existing shared memory without taking ownership of it.  Else
+            the resource tracker would remove the block when the reader exits.
+    """
+    try:
+      return shared_memory.SharedMemory(name = name, track = False)
+    except TypeError:                   # Python < 3.13. Skip the registration.
+      pass
+
+    # Only the registration of this block is skipped, and only while attaching.
+    # The lock keeps concurrent attaches from restoring the wrong function.
+    with _attachLock:
+      register = resource_tracker.register
+
+      def skipRing(theName, theType):
+        if (theType != "shared_memory") or (theName.lstrip("/") != name.lstrip("/")):
+          register(theName, theType)
+
+      resource_tracker.register = skipRing
+      try:
+        return shared_memory.SharedMemory(name = name)
+      finally:
+        resource_tracker.register = register
+
+
+#================================== toProcess ==================================
+#
+
+class CfgToProcess(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for an out-of-process channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | batchSize   | Number of payloads to collect per queue transfer. |
+  | queueSize   | Maximum number of pending transfers. |
+  | startMethod | Multiprocessing start method (optional). None for the default. |
+  | timeout     | Time to wait for the reporting process on flush/close (seconds). |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToProcess.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toProcess.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(batchSize = 32, queueSize = 1000, 
+                                 startMethod = None, timeout = 30.0))
+    return default_settings
+
+class toProcess(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Send raw payloads to a channel running in a dedicated reporting process.
+
+  Formatting and output then happen outside of the perception process, so that
+  they do not compete for the interpreter lock.  The reporting process builds its
+  channel (e.g., toCSV, toColumns, or an Editor's channel stack) by invoking the
+  builder function given to the constructor.  With the spawn start method, the
+  builder must be importable (module level function).
+
+  Payloads are collected into batches and each batch goes through a multiprocessing
+  queue, which is the only per-report cost in the perception process.  Calls to
+  sendHeader and setRunner are forwarded in order with the payloads.  Invoking
+  flush waits until the reporting process has sent and flushed everything so far.
+  Invoking close also has the reporting process drain the queue, close its channel,
+  and exit.  An exception raised in the reporting process is raised again, as a
+  RuntimeError, by the next flush or close.  So is a reporting process that does
+  not respond within the timeout.  Close then terminates it.
+
+  On checkpoint, everything pending gets flushed and only the builder is kept.
+  On restore, a new reporting process starts up and invokes the builder again,
+  thus the builder should open its outputs for appending (else restoring would
+  start them over).  The builder must be picklable (module level function).
+  """
+
+  #============================= toProcess __init__ ============================
+  #
+  def __init__(self, theBuilder, theConfig = None):
+    """!
+    @brief  Constructor for out-of-process channel.  Starts the reporting process.
+
+    @param[in]  theBuilder  Function with no arguments that returns the channel.
+    @param[in]  theConfig   Out-of-process channel configuration (optional).
+    """
+    if theConfig is None:
+      theConfig = CfgToProcess()
+
+    super(toProcess,self).__init__(theConfig)
+
+    self.builder  = theBuilder          #< Reporting channel builder.
+    self.pending  = []                  #< Payloads not yet transferred.
+
+    self._start()
+
+  #==================================== send ===================================
+  #
+  def send(self, thePayload):
+    self.pending.append(thePayload)
+    if len(self.pending) >= self.config.batchSize:
+      self._put(self.pending)
+      self.pending = []
+
+    return True
+
+  #================================= sendBatch =================================
+  #
+  def sendBatch(self, thePayloads):
+    self.pending.extend(thePayloads)
+    if len(self.pending) >= self.config.batchSize:
+      self._put(self.pending)
+      self.pending = []
+
+    return [True] * len(thePayloads)
+
+  #================================= sendHeader ================================
+  #
+  def sendHeader(self, theHeader = None):
+    self._call("sendHeader", theHeader)
+
+  #================================= setRunner =================================
+  #
+  def setRunner(self, theRunner):
+    self._call("setRunner", theRunner)
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Wait until the reporting process has sent and flushed all payloads.
+    """
+    self._call("flush")
+    self._checkError(self._getAck())
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Drain pending payloads, close the reporting channel, and stop the
+            reporting process.  Safe to call again.
+    """
+    if self.process is None:
+      return
+
+    theError = None
+    try:
+      if self.pending:
+        self._put(self.pending, self.config.timeout)
+        self.pending = []
+
+      self._put(None, self.config.timeout)
+      theAck = self._getAck()
+    except RuntimeError as err:
+      theError = err
+    finally:
+      self.process.join(self.config.timeout)
+      if self.process.is_alive():
+        self.process.terminate()
+        self.process.join()
+      self.process = None
+
+    if theError is not None:
+      raise theError
+
+    self._checkError(theAck)
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  Everything pending gets flushed first, then the
+            queues and reporting process are left out.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    for name in ("queue", "acks", "process"):
+      del theState[name]
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Starts up a new reporting process.
+    """
+    self.__dict__.update(theState)
+    self._start()
+
+  #=================================== _start ==================================
+  #
+  def _start(self):
+    theContext    = multiprocessing.get_context(self.config.startMethod)
+    self.queue    = theContext.Queue(maxsize = self.config.queueSize)
+    self.acks     = theContext.Queue()
+
+    self.process  = theContext.Process(target = toProcess._serve, daemon = True,
+                                       args = (self.builder, self.queue, self.acks))
+    self.process.start()
+
+  #==================================== _put ===================================
+  #
+  def _put(self, theItem, timeout = None):
+    """!
+    @brief  Transfer item to the reporting process.  Waits for room in the queue,
+            forever by default.
+    """
+    if self.process is None:
+      raise RuntimeError("toProcess channel is closed.")
+
+    try:
+      self.queue.put(theItem, timeout = timeout)
+    except queue.Full:
+      raise RuntimeError("Reporting process did not respond (timed out).") from None
+
+  #================================== _getAck ==================================
+  #
+  def _getAck(self):
+    """!
+    @brief  Wait for acknowledgement of flush or stop from the reporting process.
+    """
+    try:
+      return self.acks.get(timeout = self.config.timeout)
+    except queue.Empty:
+      raise RuntimeError("Reporting process did not respond (timed out).") from None
+
+  #=================================== _call ===================================
+  #
+  def _call(self, theName, *theArgs):
+    """!
+    @brief  Forward member function call, after any pending payloads.
+    """
+    if self.pending:
+      self._put(self.pending)
+      self.pending = []
+
+    self._put((theName, theArgs))
+
+  #================================ _checkError ================================
+  #
+  def _checkError(self, theAck):
+    if theAck is not None:
+      raise RuntimeError("Reporting process failed: " + theAck)
+
+  #=================================== _serve ==================================
+  #
+  @staticmethod
+  def _serve(theBuilder, theQueue, theAcks):
+    """!
+    @brief  Reporting process main loop.
+
+    Items are lists of payloads, (member function name, arguments) tuples, or None
+    to stop.  Flush and stop are acknowledged with None, or with the text of the
+    first error since the last acknowledgement.
+    """
+    theError   = None
+    theChannel = None
+    try:
+      theChannel = theBuilder()
+    except Exception as err:
+      theError = repr(err)
+
+    while True:
+      theItem = theQueue.get()
+
+      try:
+        if theItem is None:
+          if theChannel is not None:
+            theChannel.close()
+        elif theChannel is None:
+          pass
+        elif isinstance(theItem, list):
+          for thePayload in theItem:
+            theChannel.send(thePayload)
+        else:
+          getattr(theChannel, theItem[0])(*theItem[1])
+      except Exception as err:
+        if theError is None:
+          theError = repr(err)
+
+      if (theItem is None) or (isinstance(theItem, tuple) and theItem[0] == "flush"):
+        theAcks.put(theError)
+        theError = None
+
+      if theItem is None:
+        break
+
+
+#==================================== Async ====================================
+#
+
+class CfgAsync(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for an Async channel wrapper.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | queueSize   | Maximum number of pending announcements. |
+  | overflow    | What to do when queue is full: "block", "dropOldest", "dropNewest". |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgAsync.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for Async.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(queueSize = 1000, overflow = "block"))
+    return default_settings
+
+class Async(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Send to a wrapped channel from a background writer thread.
+
+  Sending to a file (or other blocking output) puts the output latency into the
+  perception loop.  The Async wrapper instead queues the announcements and a
+  dedicated writer thread passes them along to the wrapped channel.  The caller only
+  pays for the queueing.  Calls that change the wrapped channel (sendHeader,
+  setRunner) are queued too, so that they happen in order with the announcements.
+
+  The queue is bounded.  When full, the overflow policy decides whether the sender
+  waits (block), the oldest pending announcement is dropped (dropOldest), or the
+  new announcement is dropped (dropNewest).  Dropped announcements are counted.
+  Queued calls other than announcements (sendHeader, setRunner, flush) are never
+  dropped.  When they fill the queue, the sender waits.
+
+  Invoke flush to wait until all queued announcements have been sent, and close to
+  also stop the writer thread and close the wrapped channel.  An exception raised
+  by the wrapped channel is kept and raised again by the next flush or close.
+  """
+
+  #=============================== Async __init__ ==============================
+  #
+  def __init__(self, theChannel, theConfig = None):
+    """!
+    @brief  Constructor for background writer channel.
+
+    @param[in]  theChannel  Channel to send to from the writer thread.
+    @param[in]  theConfig   Async configuration (optional).
+    """
+    if theConfig is None:
+      theConfig = CfgAsync()
+
+    if theConfig.overflow not in ("block", "dropOldest", "dropNewest"):
+      raise ValueError("Unknown overflow policy: " + str(theConfig.overflow))
+
+    super(Async,self).__init__(theConfig)
+
+    self.channel  = theChannel
+    self.nDropped = 0                   #< Number of dropped announcements.
+    self.error    = None                #< Exception raised on writer thread.
+
+    self._start()
+
+  #==================================== send ===================================
+  #
+  def send(self, theAnnouncement):
+    """!
+    @brief  Queue announcement for sending.
+
+    @return     False if the announcement got dropped, otherwise True.
+    """
+    return self._enqueue(("send", (theAnnouncement,)))
+
+  #================================= sendBatch =================================
+  #
+  def sendBatch(self, theAnnouncements):
+    """!
+    @brief  Queue several announcements as one item, for the wrapped channel's
+            sendBatch.  The overflow policy applies to the batch as a whole.
+    """
+    isQueued = self._enqueue(("sendBatch", (list(theAnnouncements),)))
+    return [isQueued] * len(theAnnouncements)
+
+  #================================= sendHeader ================================
+  #
+  def sendHeader(self, theHeader = None):
+    self._enqueue(("sendHeader", (theHeader,)), True)
+
+  #================================= setRunner =================================
+  #
+  def setRunner(self, theRunner):
+    self._enqueue(("setRunner", (theRunner,)), True)
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Wait for queued announcements to be sent, then flush wrapped channel.
+    """
+    if self.thread is not None:
+      self._enqueue(("flush", ()), True)
+      self.queue.join()
+
+    self._raiseError()
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    """!
+    @brief  Send queued announcements, stop the writer thread, and close the
+            wrapped channel.
+    """
+    if self.thread is not None:
+      self.queue.put(None)
+      self.thread.join()
+      self.thread = None
+      self.channel.close()
+
+    self._raiseError()
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  Pending announcements get sent first, then the
+            queue and writer thread are left out.
+    """
+    self.flush()
+
+    theState = self.__dict__.copy()
+    del theState["queue"]
+    del theState["thread"]
+    return theState
+
+  #================================ __setstate__ ===============================
+  #
+  def __setstate__(self, theState):
+    """!
+    @brief  Checkpoint restore.  Starts up a new writer thread.
+    """
+    self.__dict__.update(theState)
+    self._start()
+
+  #=================================== _start ==================================
+  #
+  def _start(self):
+    self.queue  = queue.Queue(maxsize = self.config.queueSize)
+    self.thread = threading.Thread(target = self._writer, daemon = True)
+    self.thread.start()
+
+  #================================== _enqueue =================================
+  #
+  def _enqueue(self, theItem, mustKeep = False):
+    """!
+    @brief  Queue item according to the overflow policy.
+
+    @param[in]  theItem     Tuple (member function name, arguments).
+    @param[in]  mustKeep    Always block when full, regardless of policy.
+
+    @return     False if the item got dropped, otherwise True.
+    """
+    if self.thread is None:
+      raise RuntimeError("Async channel is closed.")
+
+    if mustKeep or (self.config.overflow == "block"):
+      self.queue.put(theItem)
+      return True
+
+    while True:
+      try:
+        self.queue.put_nowait(theItem)
+        return True
+      except queue.Full:
+        if self.config.overflow == "dropNewest":
+          self.nDropped += 1
+          return False
+
+      if not self._dropOldest():        # Nothing to drop. Wait for room.
+        self.queue.put(theItem)
+        return True
+
+  #================================ _dropOldest ================================
+  #
+  def _dropOldest(self):
+    """!
+    @brief  Remove the oldest queued announcement (send or sendBatch item) to make
+            room.  Other queued calls stay in place.
+
+    @return     True if an announcement got dropped.
+    """
+    with self.queue.mutex:
+      for (qi, theItem) in enumerate(self.queue.queue):
+        if (theItem is not None) and (theItem[0] in ("send", "sendBatch")):
+          del self.queue.queue[qi]
+          self.queue.unfinished_tasks -= 1
+          if self.queue.unfinished_tasks == 0:
+            self.queue.all_tasks_done.notify_all()
+          self.queue.not_full.notify()
+          self.nDropped += 1
+          return True
+
+    return False
+
+  #================================== _writer ==================================
+  #
+  def _writer(self):
+    """!
+    @brief  Writer thread loop.
+    """
+    while True:
+      theItem = self.queue.get()
+      if theItem is None:
+        self.queue.task_done()
+        break
+
+      try:
+        getattr(self.channel, theItem[0])(*theItem[1])
+      except Exception as err:
+        self.error = err
+      finally:
+        self.queue.task_done()
+
+  #================================ _raiseError ================================
+  #
+  def _raiseError(self):
+    if self.error is not None:
+      theError   = self.error
+      self.error = None
+      raise theError
+
+
+#================================= LocalBroker =================================
+#
+
+class LocalBroker(object):
+  """!
+  @ingroup  Reports
+  @brief    In-process publish/subscribe broker.  Stand-in transport for toPublisher.
+
+  Published messages go straight to the subscriber callbacks of the topic, on the
+  publishing thread.  Message counts are kept per topic, and optionally the most
+  recent messages, so that tests and benchmarks can run without ROS.
+  """
+
+  #============================ LocalBroker __init__ ===========================
+  #
+  def __init__(self, keep = 0):
+    """!
+    @brief  Constructor for local broker.
+
+    @param[in]  keep    Number of recent messages to keep per topic (optional).
+    """
+    self.keep        = keep
+    self.subscribers = collections.defaultdict(list)  #< Callbacks by topic.
+    self.recent      = dict()                         #< Recent messages by topic.
+    self.nPublished  = collections.Counter()          #< Message counts by topic.
+    self.nBatches    = collections.Counter()          #< Publish calls by topic.
+
+  #================================= subscribe =================================
+  #
+  def subscribe(self, topic, callback):
+    """!
+    @brief  Have callback invoked with each message published to topic.
+    """
+    self.subscribers[topic].append(callback)
+
+  #================================== publish ==================================
+  #
+  def publish(self, topic, theMsg):
+    self.publishBatch(topic, [theMsg])
+
+  #================================ publishBatch ===============================
+  #
+  def publishBatch(self, topic, theMsgs):
+    """!
+    @brief  Publish several messages to a topic in one go.
+    """
+    self.nPublished[topic] += len(theMsgs)
+    self.nBatches[topic]   += 1
+
+    if self.keep > 0:
+      if topic not in self.recent:
+        self.recent[topic] = collections.deque(maxlen = self.keep)
+      self.recent[topic].extend(theMsgs)
+
+    for callback in self.subscribers.get(topic, ()):
+      for theMsg in theMsgs:
+        callback(theMsg)
+
+  #================================== received =================================
+  #
+  def received(self, topic):
+    """!
+    @brief  Return list of recent messages kept for topic.
+    """
+    return list(self.recent.get(topic, ()))
+
+
+#================================= RosTransport ================================
+#
+
+class RosTransport(object):
+  """!
+  @ingroup  Reports
+  @brief    ROS publishing transport for toPublisher.
+
+  The rospy package is imported, and the topic publishers created, on first use.
+  Building the transport (or the channel) therefore does not require ROS.
+  """
+
+  #=========================== RosTransport __init__ ===========================
+  #
+  def __init__(self, msgType = None, queueSize = 0):
+    """!
+    @brief  Constructor for ROS transport.
+
+    @param[in]  msgType     ROS message type of the published messages.
+    @param[in]  queueSize   ROS publisher queue size (optional).
+    """
+    self.msgType    = msgType
+    self.queueSize  = queueSize
+    self.publishers = dict()            #< rospy publishers by topic.
+
+  #================================== publish ==================================
+  #
+  def publish(self, topic, theMsg):
+    self._publisher(topic).publish(theMsg)
+
+  #================================ publishBatch ===============================
+  #
+  def publishBatch(self, topic, theMsgs):
+    thePub = self._publisher(topic)
+    for theMsg in theMsgs:
+      thePub.publish(theMsg)
+
+  #================================= _publisher ================================
+  #
+  def _publisher(self, topic):
+    if topic not in self.publishers:
+      import rospy
+
+      self.publishers[topic] = rospy.Publisher(topic, self.msgType, 
+                                               queue_size = self.queueSize)
+    return self.publishers[topic]
+
+
+#================================= toPublisher =================================
+#
+
+class CfgToPublisher(CfgChannel):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a publishing channel.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | topic       | Topic to publish to. |
+  | type        | Message type (ROS transport). |
+  | bufflen     | Publisher queue size (ROS transport). |
+  | batchSize   | Number of messages per publish cycle. 1 publishes right away. |
+  | msgBuilder  | Function converting an announcement to a message (optional). |
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToPublisher.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for toPublisher.
+    """
+
+    default_settings = CfgChannel.get_default_settings()
+    default_settings.update(dict(topic = "", type = None, bufflen = 0, batchSize = 1,
+                                 msgBuilder = None))
+    return default_settings
+
+class toPublisher(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Publish to a topic through a pluggable publish/subscribe transport.
+
+  A transport is any instance with a publish(topic, msg) member function, and
+  optionally publishBatch(topic, msgs).  RosTransport goes to ROS, while
+  LocalBroker stays in-process.  Messages are collected until the batch size is
+  reached, or until flush is invoked (e.g., once per processing cycle), then handed
+  to the transport together.
+  """
+
+  #============================ toPublisher __init__ ===========================
+  #
+  def __init__(self, theConfig = None, theTransport = None):
+    """!
+    @brief  Constructor for publishing channel.
+
+    @param[in]  theConfig       Publisher configuration (optional).
+    @param[in]  theTransport    Transport instance (optional). Default is ROS.
+    """
+    if theConfig is None:
+      theConfig = CfgToPublisher()
+
+    if theTransport is None:
+      theTransport = RosTransport(theConfig.type, theConfig.bufflen)
+
+    super(toPublisher,self).__init__(theConfig)
+
+    self.transport = theTransport
+    self.pending   = []                 #< Messages for the next publish cycle.
+
+  #==================================== send ===================================
+  #
+  def send(self, theAnnouncement):
+    if self.config.msgBuilder is not None:
+      theAnnouncement = self.config.msgBuilder(theAnnouncement)
+
+    self.pending.append(theAnnouncement)
+    if len(self.pending) >= self.config.batchSize:
+      self.flush()
+
+    return True
+
+  #=================================== flush ===================================
+  #
+  def flush(self):
+    """!
+    @brief  Publish the collected messages.
+    """
+    if len(self.pending) == 0:
+      return
+
+    if hasattr(self.transport, "publishBatch"):
+      self.transport.publishBatch(self.config.topic, self.pending)
+    else:
+      for theMsg in self.pending:
+        self.transport.publish(self.config.topic, theMsg)
+
+    self.pending = []
+
+  #=================================== close ===================================
+  #
+  def close(self):
+    self.flush()
+
+
+#=================================== toROSmsg ==================================
+#
+
+class CfgToROSmsg(CfgToPublisher):
+  """!
+  @ingroup  Reports
+  @brief    Configuration instance for a Channel.
+  """
+
+  #------------------------------ __init__ -----------------------------
+  #
+  def __init__(self, init_dict=None, key_list=None, new_allowed=True):
+    """!
+    @brief    Instantiate a channel build configuration.
+    """
+
+    if init_dict is None:
+      init_dict = CfgToROSmsg.get_default_settings()
+
+    super(CfgChannel,self).__init__(init_dict, key_list, new_allowed)
+
+
+  #------------------------ get_default_settings -----------------------
+  #
+  @staticmethod
+  def get_default_settings():
+    """!
+    @brief  Get default build configuration settings for Trigger.
+    """
+
+    default_settings = CfgToPublisher.get_default_settings()
+    return default_settings
+
+
+class toROSmsg(toPublisher):
+  """!
+  @ingroup  Reports
+  @brief    Pass along to a ROS topic. 
+
+  Saves the reports to a ROS message compatible with the message type.
+  This class will most likely be overloaded to permit customization of
+  the message type and announcement contents (or use the msgBuilder option).
+  It is a toPublisher with the ROS transport, so rospy only gets imported
+  when the first message is published.
+  """
+
+  #============================= toROSmsg __init__ =============================
+  #
+  def __init__(self, theConfig = None):
+    """!
+    @brief  Constructor for ROS topic channel.
+    """
+    if theConfig is None:
+      theConfig = CfgToROSmsg()
+
+    super(toROSmsg,self).__init__(theConfig, 
+                                  RosTransport(theConfig.type, theConfig.bufflen))
+
+
+
+
+#================================== Assignment =================================
+#
+class Assignment(Channel):
+  """!
+  @ingroup  Reports
+  @brief    Assignment class for communication between BeatReporter and Editor.
+
+  An assignment is what links a BeatReporter with and Editor.  It maintains
+  information about the assignment (at minimum it's ID) and what Editor is
+  attached to the BeatReporter.  The base implementation will simply pass along
+  the BeatReporter's Commentary or Announcement.
+  """
+
+  #============================ Assignment __init__ ============================
+  #
+  def __init__(self, theConfig = CfgChannel()):
+    """!
+    @brief  Constructor for base trigger class.
+    """
+    super(Assignment,self).__init__(theConfig)
+
+    ## Assignment ID given by managing editor.
+    self.id     = None
+    ## Editor linked to the assignment.  Who to report news to.
+    self.editor = None
+    ## Is assignment one that doesn't report to editor, but just part of accumulating info?
+    self.keepQuiet = False
+
+  #=================================== assign ==================================
+  #
+  def assign(self, assignID, assignEditor):
+    """!
+    @brief  BeatReporter has been assigned work. Follow up on request by
+            configuring a channel between (i.e., linking) Reporter and Editor.
+
+    @param[in]  assignID        ID of assignment/beat.
+    @param[in]  assignEditor    Editor managing the assignment/beat.
+    """
+
+    self.id     = assignID
+    self.editor = assignEditor
+
+  #==================================== send ===================================
+  #
+  def send(self, theCommentary):
+    if not self.keepQuiet:
+      self.editor.incoming(self.id, theCommentary)
+      return True
+    else:
+      return False
+
+  #================================= sendBatch =================================
+  #
+  def sendBatch(self, theCommentaries):
+    if not self.keepQuiet:
+      self.editor.incomingBatch(self.id, theCommentaries)
+      return [True] * len(theCommentaries)
+    else:
+      return [False] * len(theCommentaries)
+
 
 #
 #========================== perceiver.reports.channel ==========================
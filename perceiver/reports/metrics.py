@@ -0,0 +1,285 @@
+#========================== perceiver.reports.metrics ==========================
+"""!
+
+@brief    Distance metrics with batch kernels, for the distance triggers.
+
+A metric instance is a distance function, distance(sig1, sig2), thus it can be
+assigned to the distance field of a CfgDistTrigger like any other function.  It
+also exposes the pieces that the distance triggers use to skip work:
+
+  - kernel(sig1, sig2) is a cheaper, order preserving version of the distance
+    (e.g., squared Euclidean distance for the Euclidean metric, so no sqrt).
+  - level(tau) maps a threshold to the kernel scale (e.g., tau -> tau^2).
+  - batch(sigs1, sigs2) computes the kernel for a whole batch in one go.
+
+Comparing kernel(sig1, sig2) < level(tau) is equivalent to distance < tau.  Since
+distances are non-negative, a negative threshold (e.g., tau - band for a whenFar
+hysteresis band wider than tau) is taken to be zero.
+
+Signals may be scalars, vectors (or arrays), and batches of these with the batch
+index first.  For batch, one of the two arguments may be a single signal, which
+then gets compared against each batch entry.  The se2 metric also takes Homog
+instances from Lie.group.SE2.
+
+@author   agent,                agent@local
+@date     2026/10/19            [created]
+"""
+#========================== perceiver.reports.metrics ==========================
+#!
+#!NOTE:
+#!  set indent to 2 spaces.
+#!  do not indent function code.
+#!  set tab to 4 spaces with conversion to spaces.
+#!  90 columns, word margin 9 or 10.
+#
+#========================== perceiver.reports.metrics ==========================
+
+import numpy as np
+
+
+#==================================== Metric ===================================
+#
+
+class Metric(object):
+  """!
+  @ingroup  Reports
+  @brief    Base class for a distance metric with batch kernel.
+
+  Sub-classes override _reduce, _diff, level, finish, asSignal, and asBatch as
+  needed.  The base versions are for plain numeric signals, and give the squared
+  Euclidean distance.
+  """
+
+  #================================== __call__ =================================
+  #
+  def __call__(self, sig1, sig2):
+    """!
+    @brief  Distance between two signals.
+    """
+    return self.finish(self.kernel(sig1, sig2))
+
+  #=================================== kernel ==================================
+  #
+  def kernel(self, sig1, sig2):
+    """!
+    @brief  Kernel (order preserving version of distance) between two signals.
+    """
+    theDiff = self._diff(self.asSignal(sig1), self.asSignal(sig2))
+    return float(self._reduce(theDiff, None))
+
+  #=================================== batch ===================================
+  #
+  def batch(self, sigs1, sigs2):
+    """!
+    @brief  Kernel between each entry of two signal batches.
+
+    Arguments should already be arrays (see asSignal and asBatch).  One of them
+    may be a single signal.
+
+    @return     Array of kernel values, one per batch entry.
+    """
+    theDiff = self._diff(sigs1, sigs2)
+    return self._reduce(theDiff, tuple(range(1, theDiff.ndim)))
+
+  #=================================== level ===================================
+  #
+  def level(self, tau):
+    """!
+    @brief  Threshold on kernel scale that is equivalent to distance threshold tau.
+            Negative thresholds are clamped to zero.
+    """
+    return max(tau, 0)
+
+  #=================================== finish ==================================
+  #
+  def finish(self, theKernel):
+    """!
+    @brief  Convert kernel value(s) to distance(s).
+    """
+    return theKernel
+
+  #================================== asSignal =================================
+  #
+  def asSignal(self, theSig):
+    """!
+    @brief  Single signal as numpy array.
+    """
+    return np.asarray(theSig)
+
+  #================================== asBatch ==================================
+  #
+  def asBatch(self, theSigs):
+    """!
+    @brief  Signal sequence as numpy array with batch index first.
+
+    @return     The array, or None if the signals are not numeric.
+    """
+    theSigs = np.asarray(theSigs)
+    if (theSigs.ndim == 0) or (theSigs.dtype.kind not in "biuf"):
+      return None
+
+    return theSigs
+
+  #=================================== _diff ===================================
+  #
+  def _diff(self, sigs1, sigs2):
+    """!
+    @brief  Element-wise difference.
+    """
+    return np.subtract(sigs1, sigs2)
+
+  #================================== _reduce ==================================
+  #
+  def _reduce(self, theDiff, axis):
+    """!
+    @brief  Kernel from element-wise difference, reduced over given axes.
+
+    The base version is the sum of squares.
+    """
+    return np.sum(theDiff*theDiff, axis=axis)
+
+
+#================================= sqEuclidean =================================
+#
+
+class sqEuclidean(Metric):
+  """!
+  @ingroup  Reports
+  @brief    Squared Euclidean distance.  Same as the base metric.
+  """
+
+
+#================================== euclidean ==================================
+#
+
+class euclidean(sqEuclidean):
+  """!
+  @ingroup  Reports
+  @brief    Euclidean distance.  The kernel is the squared distance.
+  """
+
+  def level(self, tau):
+    return max(tau, 0)**2
+
+  def finish(self, theKernel):
+    return np.sqrt(theKernel)
+
+
+#====================================== L1 =====================================
+#
+
+class L1(Metric):
+  """!
+  @ingroup  Reports
+  @brief    L1 (sum of absolute differences) distance.
+  """
+
+  def _reduce(self, theDiff, axis):
+    return np.sum(np.abs(theDiff), axis=axis)
+
+
+#===================================== Linf ====================================
+#
+
+class Linf(Metric):
+  """!
+  @ingroup  Reports
+  @brief    L-infinity (largest absolute difference) distance.
+  """
+
+  def _reduce(self, theDiff, axis):
+    if axis == ():
+      return np.abs(theDiff)
+
+    return np.max(np.abs(theDiff), axis=axis)
+
+
+#=================================== angular ===================================
+#
+
+class angular(euclidean):
+  """!
+  @ingroup  Reports
+  @brief    Distance between angles (radians), with wrap around.
+
+  Scalar signals give the absolute angle difference, in [0, pi].  Vectors of
+  angles (e.g., joint angles) give the Euclidean norm of the angle differences.
+  """
+
+  def _diff(self, sigs1, sigs2):
+    return np.remainder(np.subtract(sigs1, sigs2) + np.pi, 2*np.pi) - np.pi
+
+
+#===================================== SE2 =====================================
+#
+
+class se2(euclidean):
+  """!
+  @ingroup  Reports
+  @brief    Distance between planar poses.
+
+  The distance is sqrt(|dx|^2 + (rotScale * dtheta)^2), where dx is the position
+  difference and dtheta the wrapped orientation difference.  The rotation scale
+  is a length, the one at which a radian of rotation counts as much as a unit of
+  translation.
+
+  Signals are Homog instances, or (x, y, theta) arrays.
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self, rotScale = 1.0):
+    """!
+    @brief  Constructor for SE(2) metric.
+
+    @param[in]  rotScale    Length scale of orientation difference (optional).
+    """
+    self.rotScale = rotScale
+
+  #================================== asSignal =================================
+  #
+  def asSignal(self, theSig):
+    """!
+    @brief  Pose as (x, y, theta) array.
+    """
+    if hasattr(theSig, 'R'):
+      return se2._pose(theSig)
+
+    return np.asarray(theSig)
+
+  #================================== asBatch ==================================
+  #
+  def asBatch(self, theSigs):
+    """!
+    @brief  Pose sequence as array of (x, y, theta) rows, or None if not poses.
+    """
+    if (len(theSigs) > 0) and hasattr(theSigs[0], 'R'):
+      return np.array([se2._pose(g) for g in theSigs])
+
+    theSigs = super(se2,self).asBatch(theSigs)
+    if (theSigs is None) or (theSigs.ndim != 2) or (theSigs.shape[1] != 3):
+      return None
+
+    return theSigs
+
+  #=================================== _diff ===================================
+  #
+  def _diff(self, sigs1, sigs2):
+    theDiff = np.subtract(sigs1, sigs2, dtype=float)
+    theDiff[...,2] = self.rotScale * \
+                     (np.remainder(theDiff[...,2] + np.pi, 2*np.pi) - np.pi)
+    return theDiff
+
+  #=================================== _pose ===================================
+  #
+  @staticmethod
+  def _pose(g):
+    """!
+    @brief  Homog instance as (x, y, theta) array.
+    """
+    R = np.asarray(g.R)
+    return np.array([*np.ravel(g.x)[0:2], np.arctan2(R[1,0], R[0,0])], dtype=float)
+
+
+#
+#========================== perceiver.reports.metrics ==========================
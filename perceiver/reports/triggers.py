@@ -13,7 +13,85 @@
 #
 #========================== perceiver.reports.trigger ==========================
 
+import numpy as np
+
 from ivapy.Configuration import AlgConfig
+import perceiver.reports.metrics as metrics
+
+
+#============================== Support Functions ==============================
+#
+
+def _asArray(theSigs):
+  """!
+  @brief  Signal sequence as numpy array, if it is a 1D array of numbers. Else None.
+  """
+  theSigs = np.asarray(theSigs)
+  if (theSigs.ndim == 1) and (theSigs.dtype.kind in "biuf"):
+    return theSigs
+
+  return None
+
+def _asBool(theSigs):
+  """!
+  @brief  Truth value of each signal in sequence, as boolean array.
+  """
+  return np.array([bool(sig) for sig in theSigs], dtype=bool) \
+                       if _asArray(theSigs) is None else (np.asarray(theSigs) != 0)
+
+def _sameLevel(tau):
+  """!
+  @brief  Threshold map for plain distance functions.  No change.
+  """
+  return tau
+
+def _kernelOf(theConfig):
+  """!
+  @brief  Distance function and threshold map of a distance trigger configuration.
+
+  Known metrics give their kernel and its threshold map, so that the distance
+  itself never gets computed (e.g., no sqrt for the Euclidean metric).
+  """
+  if isinstance(theConfig.distance, metrics.Metric):
+    return (theConfig.distance.kernel, theConfig.distance.level)
+
+  return (theConfig.distance, _sameLevel)
+
+def _batchOf(theDist, theSigs):
+  """!
+  @brief  Metric and signal batch array for vectorized distance checks.
+
+  Known metrics use their own batch array.  The scalarDist distance is the L1
+  metric on 1D arrays of numbers.
+
+  @return     Tuple (metric, batch array), or (None, None) if not vectorizable.
+  """
+  if isinstance(theDist, metrics.Metric):
+    sigArr = theDist.asBatch(theSigs)
+  elif theDist is CfgDistTrigger.scalarDist:
+    (theDist, sigArr) = (_scalarMetric, _asArray(theSigs))
+  else:
+    sigArr = None
+
+  if (sigArr is None) or (len(sigArr) == 0):
+    return (None, None)
+
+  return (theDist, sigArr)
+
+def _hysteresis(isEnter, isStay, isIn):
+  """!
+  @brief  Vectorized two threshold state sequence.
+
+  The state switches on when isEnter holds, stays on while isStay holds, and
+  otherwise is off.  Entries where isEnter holds or isStay fails decide the
+  state, the others keep the last decided one (or the initial state isIn).
+  """
+  isSet   = isEnter | ~isStay
+  lastSet = np.maximum.accumulate(np.where(isSet, np.arange(len(isSet)), -1))
+
+  return np.where(lastSet >= 0, isEnter[lastSet], isIn)
+
+_scalarMetric = metrics.L1()
 
 
 #=============================== BuildCfgTrigger ===============================
@@ -137,6 +215,48 @@ class Trigger:
     """
     return  False
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order.
+
+    Gives the same outcome as invoking test on each signal in turn, including the
+    trigger state afterwards, so batch and per-signal processing may be mixed.
+    The base version does exactly that.  Derived classes evaluate in one
+    vectorized pass when the signals permit (typically a 1D array of numbers).
+
+    @param[in]  theSigs     Sequence of signals (list, or array with time first).
+
+    @return     Boolean array, true where a report is triggered.
+    """
+    return np.fromiter((bool(self.test(sig)) for sig in theSigs), dtype=bool, 
+                                                               count=len(theSigs))
+
+  #================================== __and__ ==================================
+  #
+  def __and__(self, theOther):
+    """!
+    @brief  Trigger when both triggers do.  See allOf.
+    """
+    return allOf(self, theOther)
+
+  #=================================== __or__ ==================================
+  #
+  def __or__(self, theOther):
+    """!
+    @brief  Trigger when either trigger does.  See anyOf.
+    """
+    return anyOf(self, theOther)
+
+  #================================= __invert__ ================================
+  #
+  def __invert__(self):
+    """!
+    @brief  Trigger when trigger does not.  See isNot.
+    """
+    return isNot(self)
+
 
 #==================================== Always ===================================
 #
@@ -165,6 +285,11 @@ class Always(Trigger):
     """
     return  True
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    return np.ones(len(theSigs), dtype=bool)
+
 
 #==================================== Rising ===================================
 #
@@ -229,6 +354,26 @@ class Rising(Trigger):
 
     return isRising
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+    """
+    if len(theSigs) == 0:
+      return np.zeros(0, dtype=bool)
+
+    theBools = _asBool(theSigs)
+    if self.isInit:
+      pBools = np.concatenate(([bool(self.pBool)], theBools[:-1]))
+    else:
+      pBools = np.concatenate((theBools[:1], theBools[:-1]))
+
+    self.isInit = True
+    self.pBool  = bool(theBools[-1])
+
+    return theBools & ~pBools
+
 #=================================== Falling ===================================
 #
 
@@ -292,6 +437,26 @@ class Falling(Trigger):
 
     return isFalling
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+    """
+    if len(theSigs) == 0:
+      return np.zeros(0, dtype=bool)
+
+    theBools = _asBool(theSigs)
+    if self.isInit:
+      pBools = np.concatenate(([bool(self.pBool)], theBools[:-1]))
+    else:
+      pBools = np.concatenate((theBools[:1], theBools[:-1]))
+
+    self.isInit = True
+    self.pBool  = bool(theBools[-1])
+
+    return ~theBools & pBools
+
 
 #================================ NonNegative ================================
 #
@@ -326,6 +491,11 @@ class NonNegative(Trigger):
     """
     return (theSig >= 0)
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    return np.asarray(theSigs) >= 0
+
 
 #================================= IsNegative ================================
 #
@@ -360,6 +530,11 @@ class IsNegative(Trigger):
     """
     return (theSig < 0)
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    return np.asarray(theSigs) < 0
+
 
 #=================================== onChange ==================================
 #
@@ -409,6 +584,27 @@ class onChange(Trigger):
 
     return changeCheck
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    Vectorized for 1D arrays of numbers.  Otherwise the signals are tested in turn.
+    """
+    sigArr = _asArray(theSigs)
+    if (sigArr is None) or (len(sigArr) == 0):
+      return super(onChange,self).testBatch(theSigs)
+
+    isChange = np.empty(len(sigArr), dtype=bool)
+    isChange[1:] = (sigArr[1:] != sigArr[:-1])
+    isChange[0]  = (not (self.prevSig == theSigs[0])) if self.isInit else False
+
+    self.isInit  = True
+    self.prevSig = theSigs[-1]
+
+    return isChange
+
 
 #================================== onMatch ==================================
 #
@@ -456,6 +652,202 @@ class onMatch(Trigger):
     """
     return (self.targSig == theSig)
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals. See Trigger.testBatch.
+
+    Vectorized for 1D arrays of numbers and a scalar target.
+    """
+    sigArr = _asArray(theSigs)
+    if (sigArr is None) or (np.ndim(self.targSig) != 0):
+      return super(onMatch,self).testBatch(theSigs)
+
+    return (sigArr == self.targSig)
+
+
+#================================== onMatchAny =================================
+#
+
+class onMatchAny(Trigger):
+  """!
+  @ingroup  Reports
+  @brief    Class that triggers a report when the state matches any of many targets.
+
+  The targets are kept in a dict, thus membership is a hash lookup no matter how
+  many targets there are.  One trigger can then watch hundreds of values (e.g.,
+  region IDs, piece labels) instead of one onMatch trigger per value.
+
+  The targets may be given as a dict from target to label, or as any other
+  collection, in which case each target is its own label.  After a test, the
+  matched member holds the label of the matched target, or None if no match.
+
+  Signals should be hashable.  For integer signals, testBatch and matchBatch are
+  vectorized through a look-up table (or a sorted search for sparse targets).
+  """
+
+  LUTSPAN = 65536                     #< Largest target range for look-up table.
+
+  #============================ onMatchAny __init__ ============================
+  #
+  def __init__(self, theConfig, targets):
+    """!
+    @brief  Constructor for onMatchAny trigger class.
+
+    @param[in]  theConfig   Trigger configuration (optional, can be None).
+    @param[in]  targets     Dict from target to label, or collection of targets.
+    """
+    if (theConfig is None):
+      theConfig = CfgTrigger()
+
+    super(onMatchAny,self).__init__(theConfig)
+    self.newTargets(targets)
+
+  #================================= newTargets ================================
+  #
+  def newTargets(self, targets):
+    """!
+    @brief  Define the new targets to check against.
+
+    @param[in]  targets     Dict from target to label, or collection of targets.
+    """
+    if isinstance(targets, dict):
+      self.targets = dict(targets)
+    else:
+      self.targets = {targ: targ for targ in targets}
+
+    self.matched = None               #< Label of last matched target.
+    self.keys    = None               #< Integer look-up table (built on demand).
+
+  #================================= addTarget =================================
+  #
+  def addTarget(self, theTarg, theLabel = None):
+    """!
+    @brief  Add a target to check against.
+
+    @param[in]  theTarg     Target value.
+    @param[in]  theLabel    Label to report on match (optional). Default is target.
+    """
+    self.targets[theTarg] = theTarg if theLabel is None else theLabel
+    self.keys = None
+
+  #================================ removeTarget ===============================
+  #
+  def removeTarget(self, theTarg):
+    """!
+    @brief  Stop checking against a target.  Nothing happens if not a target.
+
+    @param[in]  theTarg     Target value.
+    """
+    if theTarg in self.targets:
+      del self.targets[theTarg]
+      self.keys = None
+
+  #==================================== test ===================================
+  #
+  def test(self, theSig):
+    """!
+    @brief  Report triggered when the passed signal matches any target.
+
+    @param[in]  theSig      The passed signal.
+    """
+    try:
+      self.matched = self.targets.get(theSig)
+    except TypeError:                 # Unhashable signal cannot be a target.
+      self.matched = None
+
+    return (self.matched is not None)
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals. See Trigger.testBatch.
+
+    Vectorized for 1D arrays of integers.  The matched member gets the label for
+    the last signal.
+    """
+    sigArr = _asArray(theSigs)
+    if (sigArr is None) or (sigArr.dtype.kind not in "biu") or (len(sigArr) == 0):
+      return super(onMatchAny,self).testBatch(theSigs)
+
+    theIDs = self._lookup(sigArr)
+    self.matched = None if theIDs[-1] < 0 else self.labels[theIDs[-1]]
+
+    return (theIDs >= 0)
+
+  #================================= matchBatch ================================
+  #
+  def matchBatch(self, theSigs):
+    """!
+    @brief  Matched target label for each signal in the supplied sequence.
+
+    @param[in]  theSigs     Sequence of signals.
+
+    @return     List of labels, with None for signals that match no target.
+    """
+    sigArr = _asArray(theSigs)
+    if (sigArr is None) or (sigArr.dtype.kind not in "biu"):
+      theMatches = []
+      for sig in theSigs:
+        self.test(sig)
+        theMatches.append(self.matched)
+      return theMatches
+
+    theIDs = self._lookup(sigArr)
+    theMatches = [None if ii < 0 else self.labels[ii] for ii in theIDs.tolist()]
+    if len(theMatches) > 0:
+      self.matched = theMatches[-1]
+
+    return theMatches
+
+  #================================== _lookup ==================================
+  #
+  def _lookup(self, sigArr):
+    """!
+    @brief  Index into labels of the target matched by each integer signal.
+
+    @return     Integer array, with -1 for signals that match no target.
+    """
+    if self.keys is None:
+      self._table()
+
+    if len(self.keys) == 0:
+      return np.full(len(sigArr), -1, dtype=np.int64)
+
+    sigArr = sigArr.astype(np.int64, copy=False)
+    if self.lut is not None:
+      offset = sigArr - self.keys[0]
+      isIn   = (offset >= 0) & (offset < len(self.lut))
+      return np.where(isIn, self.lut[np.where(isIn, offset, 0)], -1)
+
+    pos  = np.minimum(np.searchsorted(self.keys, sigArr), len(self.keys) - 1)
+    isIn = (self.keys[pos] == sigArr)
+    return np.where(isIn, pos, -1)
+
+  #=================================== _table ==================================
+  #
+  def _table(self):
+    """!
+    @brief  Build the integer look-up structures from the current targets.
+
+    Only integer valued targets can match integer signals.  Their values go into
+    a sorted key array, with labels in the same order.  When the key range is
+    small enough, there is also a direct look-up table from value to index.
+    """
+    intTargs = sorted((int(targ), label) for (targ, label) in self.targets.items()
+                       if isinstance(targ, (int, np.integer))
+                       or (isinstance(targ, (float, np.floating)) and targ.is_integer()))
+
+    self.keys   = np.array([targ for (targ, label) in intTargs], dtype=np.int64)
+    self.labels = [label for (targ, label) in intTargs]
+    self.lut    = None
+
+    if (len(self.keys) > 0) and (self.keys[-1] - self.keys[0] < onMatchAny.LUTSPAN):
+      self.lut = np.full(self.keys[-1] - self.keys[0] + 1, -1, dtype=np.int64)
+      self.lut[self.keys - self.keys[0]] = np.arange(len(self.keys))
+
 
 
 #================== Non-Equality Difference or Distance Checks =================
@@ -469,6 +861,12 @@ class CfgDistTrigger(AlgConfig):
   """!
   @ingroup  Reports
   @brief    Configuration instance for a Trigger.
+
+  | Field       | Meaning |
+  | :---        | :------- |
+  | tau         | Distance threshold. |
+  | distance    | Distance function, distance(sig1, sig2), or perceiver.reports.metrics instance. |
+  | band        | Hysteresis band of whenClose/whenFar. Zero for none. |
   """
 
   #------------------------------ __init__ -----------------------------
@@ -492,7 +890,7 @@ class CfgDistTrigger(AlgConfig):
     @brief  Get default build configuration settings for Trigger.
     """
 
-    default_settings = dict(tau = 0, distance = None)
+    default_settings = dict(tau = 0, distance = None, band = 0)
     return default_settings
 
 
@@ -518,6 +916,7 @@ class whenClose(Trigger):
     """
     super(whenClose,self).__init__(theConfig)
     self.targSig  = targSig
+    self.isIn     = False               #< Currently close to target? (for hysteresis)
 
   #==================================== test ===================================
   #
@@ -525,11 +924,44 @@ class whenClose(Trigger):
     """!
     @brief  Check if a report should be triggered for the supplied signal.
 
-    The base class is the worst trigger possible. Always false.  There is
-    no reporting.  For the opposite, use the always trigger.
+    Triggers while the signal is within tau of the target.  With a hysteresis
+    band, once close, it stays close until the distance reaches tau + band.
+    """
+
+    (theKern, level) = _kernelOf(self.config)
+    theDist = theKern(self.targSig, theSig)
+    band    = getattr(self.config, "band", 0)
+
+    if self.isIn and (band != 0):
+      self.isIn = (theDist < level(self.config.tau + band))
+    else:
+      self.isIn = (theDist < level(self.config.tau))
+
+    return self.isIn
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals. See Trigger.testBatch.
+
+    Vectorized for metrics from perceiver.reports.metrics, and for 1D arrays of
+    numbers with the scalarDist distance.
     """
+    (theMetric, sigArr) = _batchOf(self.config.distance, theSigs)
+    if theMetric is None:
+      return super(whenClose,self).testBatch(theSigs)
 
-    return (self.config.distance(self.targSig, theSig) < self.config.tau)
+    theDists = theMetric.batch(theMetric.asSignal(self.targSig), sigArr)
+    band     = getattr(self.config, "band", 0)
+
+    isIn = (theDists < theMetric.level(self.config.tau))
+    if (band != 0):
+      isIn = _hysteresis(isIn, theDists < theMetric.level(self.config.tau + band),
+                                                                          self.isIn)
+
+    self.isIn = bool(isIn[-1])
+    return isIn
 
 
 #=================================== whenFar ===================================
@@ -553,15 +985,52 @@ class whenFar(Trigger):
     """
     super(whenFar,self).__init__(theConfig)
     self.targSig  = targSig
+    self.isIn     = False               #< Currently far from target? (for hysteresis)
 
   #==================================== test ===================================
   #
   def test(self, theSig):
     """!
     @brief  Check if a report should be triggered for the supplied signal.
+
+    Triggers while the signal is more than tau from the target.  With a hysteresis
+    band, once far, it stays far until the distance gets down to tau - band.
     """
 
-    return (self.config.distance(self.targSig, theSig) > self.config.tau)
+    (theKern, level) = _kernelOf(self.config)
+    theDist = theKern(self.targSig, theSig)
+    band    = getattr(self.config, "band", 0)
+
+    if self.isIn and (band != 0):
+      self.isIn = (theDist > level(self.config.tau - band))
+    else:
+      self.isIn = (theDist > level(self.config.tau))
+
+    return self.isIn
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals. See Trigger.testBatch.
+
+    Vectorized for metrics from perceiver.reports.metrics, and for 1D arrays of
+    numbers with the scalarDist distance.
+    """
+    (theMetric, sigArr) = _batchOf(self.config.distance, theSigs)
+    if theMetric is None:
+      return super(whenFar,self).testBatch(theSigs)
+
+    theDists = theMetric.batch(theMetric.asSignal(self.targSig), sigArr)
+    band     = getattr(self.config, "band", 0)
+
+    isIn = (theDists > theMetric.level(self.config.tau))
+    if (band != 0):
+      isIn = _hysteresis(isIn, theDists > theMetric.level(self.config.tau - band),
+                                                                          self.isIn)
+
+    self.isIn = bool(isIn[-1])
+    return isIn
 
 
 
@@ -599,7 +1068,8 @@ class whenSimilar(Trigger):
     """
 
     if self.isInit:
-      changeCheck = (self.config.distance(self.prevSig, theSig) < self.config.tau)
+      (theKern, level) = _kernelOf(self.config)
+      changeCheck = (theKern(self.prevSig, theSig) < level(self.config.tau))
     else:
       self.isInit = True
       changeCheck = False
@@ -608,6 +1078,33 @@ class whenSimilar(Trigger):
 
     return changeCheck
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    Vectorized for metrics from perceiver.reports.metrics, and for 1D arrays of
+    numbers with the scalarDist distance.
+    """
+    (theMetric, sigArr) = _batchOf(self.config.distance, theSigs)
+    if theMetric is None:
+      return super(whenSimilar,self).testBatch(theSigs)
+
+    tauLevel = theMetric.level(self.config.tau)
+
+    isCheck = np.empty(len(sigArr), dtype=bool)
+    isCheck[1:] = (theMetric.batch(sigArr[:-1], sigArr[1:]) < tauLevel)
+    if self.isInit:
+      isCheck[0] = (theMetric.kernel(self.prevSig, theSigs[0]) < tauLevel)
+    else:
+      isCheck[0] = False
+
+    self.isInit  = True
+    self.prevSig = theSigs[-1]
+
+    return isCheck
+
 #================================= whenDiffers =================================
 #
 
@@ -642,7 +1139,8 @@ class whenDiffers(Trigger):
     """
 
     if self.isInit:
-      changeCheck = (self.config.distance(self.prevSig, theSig) > self.config.tau)
+      (theKern, level) = _kernelOf(self.config)
+      changeCheck = (theKern(self.prevSig, theSig) > level(self.config.tau))
     else:
       self.isInit = True
       changeCheck = False
@@ -651,6 +1149,653 @@ class whenDiffers(Trigger):
 
     return changeCheck
 
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    Vectorized for metrics from perceiver.reports.metrics, and for 1D arrays of
+    numbers with the scalarDist distance.
+    """
+    (theMetric, sigArr) = _batchOf(self.config.distance, theSigs)
+    if theMetric is None:
+      return super(whenDiffers,self).testBatch(theSigs)
+
+    tauLevel = theMetric.level(self.config.tau)
+
+    isCheck = np.empty(len(sigArr), dtype=bool)
+    isCheck[1:] = (theMetric.batch(sigArr[:-1], sigArr[1:]) > tauLevel)
+    if self.isInit:
+      isCheck[0] = (theMetric.kernel(self.prevSig, theSigs[0]) > tauLevel)
+    else:
+      isCheck[0] = False
+
+    self.isInit  = True
+    self.prevSig = theSigs[-1]
+
+    return isCheck
+
+
+#============================ Rate Control Wrappers ============================
+#
+# Noisy signals make the edge and change triggers fire in bursts.  The wrappers
+# below bound how often a wrapped trigger may report.  The wrapped trigger is still
+# tested at every step, so its own state stays current.  Time is measured in steps
+# (frames) by default, or by a clock function such as time.monotonic.
+#
+
+#=================================== Wrapper ===================================
+#
+
+class Wrapper(Trigger):
+  """!
+  @ingroup  Reports
+  @brief    Base class for triggers that gate another trigger.
+  """
+
+  #============================== Wrapper __init__ =============================
+  #
+  def __init__(self, theTrigger, clock = None):
+    """!
+    @brief  Constructor for trigger wrapper.
+
+    @param[in]  theTrigger  Trigger to wrap.
+    @param[in]  clock       Time function (optional). Default is to count steps.
+    """
+    super(Wrapper,self).__init__(None)
+
+    self.trigger = theTrigger
+    self.clock   = clock
+    self.nStep   = 0                    #< Number of steps so far.
+
+  #==================================== _now ===================================
+  #
+  def _now(self):
+    """!
+    @brief  Note a new step.  Returns current time (or step count).
+    """
+    self.nStep += 1
+    if self.clock is None:
+      return self.nStep
+    else:
+      return self.clock()
+
+
+#=================================== holdOff ===================================
+#
+
+class holdOff(Wrapper):
+  """!
+  @ingroup  Reports
+  @brief    Permit reports only if enough time passed since the last one.
+
+  Firings of the wrapped trigger that come within minGap of the last report are
+  suppressed.
+  """
+
+  #============================== holdOff __init__ =============================
+  #
+  def __init__(self, theTrigger, minGap, clock = None):
+    """!
+    @brief  Constructor for hold-off trigger wrapper.
+
+    @param[in]  theTrigger  Trigger to wrap.
+    @param[in]  minGap      Minimum time (or steps) between reports.
+    @param[in]  clock       Time function (optional). Default is to count steps.
+    """
+    super(holdOff,self).__init__(theTrigger, clock)
+
+    self.minGap = minGap
+    self.tLast  = None                  #< Time of last report.
+
+  #==================================== test ===================================
+  #
+  def test(self, theSig):
+    tNow = self._now()
+    if self.trigger.test(theSig) and ((self.tLast is None) 
+                                      or (tNow - self.tLast >= self.minGap)):
+      self.tLast = tNow
+      return True
+
+    return False
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    When counting steps, the wrapped trigger runs in batch mode and only its
+    firings are visited.
+    """
+    if self.clock is not None:
+      return super(holdOff,self).testBatch(theSigs)
+
+    isFired = np.asarray(self.trigger.testBatch(theSigs), dtype=bool)
+    isOut   = np.zeros(len(isFired), dtype=bool)
+    for si in np.flatnonzero(isFired):
+      tNow = self.nStep + 1 + int(si)
+      if (self.tLast is None) or (tNow - self.tLast >= self.minGap):
+        self.tLast = tNow
+        isOut[si]  = True
+
+    self.nStep += len(isFired)
+    return isOut
+
+
+#=================================== debounce ==================================
+#
+
+class debounce(Wrapper):
+  """!
+  @ingroup  Reports
+  @brief    Pass along a signal value only once it held for long enough.
+
+  The wrapped trigger gets the debounced signal, which changes to a new value only
+  after the raw signal kept that value for minHold consecutive steps, or with a
+  clock, for a span of at least minHold time since the value first showed up.
+  Until the first value is settled, the wrapped trigger is not tested and there is
+  no report.  A flickering signal then does not cause onChange, Rising, or Falling
+  to fire.  The signal should support equality (e.g., flags or labels).  For
+  continuous signals, use the hysteresis band of whenClose/whenFar instead.
+  """
+
+  #============================= debounce __init__ =============================
+  #
+  def __init__(self, theTrigger, minHold, clock = None):
+    """!
+    @brief  Constructor for debouncing trigger wrapper.
+
+    @param[in]  theTrigger  Trigger to wrap.
+    @param[in]  minHold     Number of consecutive steps (or time) to settle a value.
+    @param[in]  clock       Time function (optional). Default is to count steps.
+    """
+    super(debounce,self).__init__(theTrigger, clock)
+
+    self.minHold  = minHold
+    self.candSig  = None                #< Candidate (most recent raw) value.
+    self.tCand    = None                #< Time (or step) candidate showed up.
+    self.stable   = None                #< Debounced signal value.
+    self.isStable = False               #< Has a first value settled?
+
+  #==================================== test ===================================
+  #
+  def test(self, theSig):
+    tNow = self._now()
+
+    if (self.tCand is None) or not (self.candSig == theSig):
+      self.candSig = theSig
+      self.tCand   = tNow
+
+    if self._held(tNow - self.tCand):
+      self.stable   = self.candSig
+      self.isStable = True
+
+    if self.isStable:
+      return self.trigger.test(self.stable)
+    else:
+      return False
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    When counting steps and given a 1D array of numbers, the debounced signal is
+    worked out in one vectorized pass, then the wrapped trigger runs in batch mode
+    on it.  Otherwise the signals are tested in turn.
+    """
+    sigArr = _asArray(theSigs)
+    if (self.clock is not None) or (sigArr is None) or (len(sigArr) == 0):
+      return super(debounce,self).testBatch(theSigs)
+
+    nSigs = len(sigArr)
+    iStep = np.arange(nSigs)
+    tStep = self.nStep + 1 + iStep
+
+    isNew     = np.empty(nSigs, dtype=bool)
+    isNew[1:] = (sigArr[1:] != sigArr[:-1])
+    isNew[0]  = (self.tCand is None) or not (self.candSig == theSigs[0])
+
+    # Time candidate showed up: step of last new value, else carried over.
+    lastNew = np.maximum.accumulate(np.where(isNew, iStep, -1))
+    tCands  = np.where(lastNew >= 0, self.nStep + 1 + lastNew,
+                                     self.tCand if self.tCand is not None else 0)
+
+    # Debounced signal: value at last settled step, else carried over.
+    isHeld   = self._held(tStep - tCands)
+    lastHeld = np.maximum.accumulate(np.where(isHeld, iStep, -1))
+    isValid  = (lastHeld >= 0) | self.isStable
+
+    isOut = np.zeros(nSigs, dtype=bool)
+    if np.any(isValid):
+      stabArr = sigArr[np.maximum(lastHeld, 0)]
+      if self.isStable:
+        stabArr = np.where(lastHeld >= 0, stabArr, self.stable)
+      isOut[isValid] = self.trigger.testBatch(stabArr[isValid])
+      self.stable    = theSigs[lastHeld[-1]] if lastHeld[-1] >= 0 else self.stable
+      self.isStable  = True
+
+    self.candSig = theSigs[-1]
+    self.tCand   = int(tCands[-1])
+    self.nStep  += nSigs
+    return isOut
+
+  #=================================== _held ===================================
+  #
+  def _held(self, tSpan):
+    """!
+    @brief  Has a value held long enough, given time (or steps) since it showed up?
+    """
+    if self.clock is None:
+      return tSpan + 1 >= self.minHold   # Steps count the first one too.
+    else:
+      return tSpan >= self.minHold
+
+
+#================================== rateLimit ==================================
+#
+
+class rateLimit(Wrapper):
+  """!
+  @ingroup  Reports
+  @brief    Limit reports to a rate, with bursts, through a token bucket.
+
+  The bucket holds up to burst tokens and gains rate tokens per unit of time (or
+  per step).  Each report uses up one token.  Firings of the wrapped trigger when
+  the bucket has less than one token are suppressed.  The bucket starts full.
+  """
+
+  #============================= rateLimit __init__ ============================
+  #
+  def __init__(self, theTrigger, rate, burst = 1, clock = None):
+    """!
+    @brief  Constructor for rate limiting trigger wrapper.
+
+    @param[in]  theTrigger  Trigger to wrap.
+    @param[in]  rate        Tokens gained per unit of time (or step).
+    @param[in]  burst       Bucket size (optional).
+    @param[in]  clock       Time function (optional). Default is to count steps.
+    """
+    super(rateLimit,self).__init__(theTrigger, clock)
+
+    self.rate   = rate
+    self.burst  = burst
+    self.tokens = burst                 #< Tokens in bucket (as of tLast).
+    self.tLast  = None                  #< Time of last bucket update.
+
+  #==================================== test ===================================
+  #
+  def test(self, theSig):
+    tNow = self._now()
+    if self.trigger.test(theSig):
+      return self._take(tNow)
+
+    return False
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+
+    When counting steps, the wrapped trigger runs in batch mode and only its
+    firings are visited.
+    """
+    if self.clock is not None:
+      return super(rateLimit,self).testBatch(theSigs)
+
+    isFired = np.asarray(self.trigger.testBatch(theSigs), dtype=bool)
+    isOut   = np.zeros(len(isFired), dtype=bool)
+    for si in np.flatnonzero(isFired):
+      isOut[si] = self._take(self.nStep + 1 + int(si))
+
+    self.nStep += len(isFired)
+    return isOut
+
+  #=================================== _take ===================================
+  #
+  def _take(self, tNow):
+    """!
+    @brief  Refill bucket up to current time, then take a token if there is one.
+    """
+    if self.tLast is not None:
+      self.tokens = min(self.burst, self.tokens + self.rate * (tNow - self.tLast))
+    self.tLast = tNow
+
+    if self.tokens >= 1:
+      self.tokens -= 1
+      return True
+
+    return False
+
+
+#============================== Composite Triggers =============================
+#
+# Composite triggers combine other triggers, all tested on the same signal.  On
+# first use, the trigger tree gets compiled into one python function.  The state
+# of the built-in edge and change triggers moves into a flat state list owned by
+# the composite and their test code gets inlined.  Other triggers are invoked
+# through their test member function.  Every trigger in the tree is evaluated at
+# each step (no short-circuiting), so stateful triggers see every signal, the same
+# as when used on their own.
+#
+# Once a trigger is part of a composite, it should not be tested on its own.
+#
+
+class _Compiler(object):
+  """!
+  @brief  Collects code, flattened state, and invoked triggers for a composite.
+  """
+
+  def __init__(self):
+    self.lines = []                     #< Function body lines.
+    self.state = []                     #< Flattened state list.
+    self.calls = []                     #< Test functions of non-inlined triggers.
+    self.nVars = 0
+    self.done  = dict()                 #< Outcome variables of emitted triggers.
+    self.useBool = False                #< Code needs truth value of signal.
+
+  def newVar(self):
+    self.nVars += 1
+    return "v" + str(self.nVars)
+
+  def newSlot(self, theValue):
+    self.state.append(theValue)
+    return "S[" + str(len(self.state)-1) + "]"
+
+  def emit(self, theTrigger):
+    """!
+    @brief  Emit code evaluating trigger.  Returns the variable holding outcome.
+
+    A trigger appearing more than once in the tree is evaluated once per step.
+    """
+    if id(theTrigger) in self.done:
+      return self.done[id(theTrigger)]
+
+    if isinstance(theTrigger, Composite):
+      vOut = theTrigger._emit(self)
+      self.done[id(theTrigger)] = vOut
+      return vOut
+
+    vOut = self.newVar()
+    self.done[id(theTrigger)] = vOut
+    if type(theTrigger) is Always:
+      self.lines.append(vOut + " = True")
+    elif type(theTrigger) is NonNegative:
+      self.lines.append(vOut + " = (sig >= 0)")   # Same outcome as test.
+    elif type(theTrigger) is IsNegative:
+      self.lines.append(vOut + " = (sig < 0)")
+    elif type(theTrigger) in (Rising, Falling):
+      self.useBool = True
+      pBool  = self.newSlot(bool(theTrigger.pBool))
+      isInit = self.newSlot(theTrigger.isInit)
+      if type(theTrigger) is Rising:
+        self.lines.append(vOut + " = " + isInit + " and sb and not " + pBool)
+      else:
+        self.lines.append(vOut + " = " + isInit + " and " + pBool + " and not sb")
+      self.lines.append(pBool + " = sb")
+      self.lines.append(isInit + " = True")
+    elif type(theTrigger) is onChange:
+      prevSig = self.newSlot(theTrigger.prevSig)
+      isInit  = self.newSlot(theTrigger.isInit)
+      self.lines.append(vOut + " = " + isInit + " and not (" + prevSig + " == sig)")
+      self.lines.append(prevSig + " = sig")
+      self.lines.append(isInit + " = True")
+    else:
+      self.calls.append(theTrigger.test)
+      self.lines.append(vOut + " = bool(L[" + str(len(self.calls)-1) + "](sig))")
+
+    return vOut
+
+
+#================================== Composite ==================================
+#
+
+class Composite(Trigger):
+  """!
+  @ingroup  Reports
+  @brief    Base class for triggers that combine other triggers.
+
+  Compiled into a single evaluation function on first use.  The generated code is
+  kept in the source member, for inspection.
+  """
+
+  #============================= Composite __init__ ============================
+  #
+  def __init__(self, theTriggers, theConfig = None):
+    """!
+    @brief  Constructor for composite trigger.
+
+    @param[in]  theTriggers     List of triggers to combine.
+    @param[in]  theConfig       Trigger configuration (optional).
+    """
+    super(Composite,self).__init__(theConfig)
+
+    self.triggers = list(theTriggers)
+    self.source   = None                #< Generated code.
+    self.S        = None                #< Flattened state.
+    self.L        = None                #< Test functions invoked by generated code.
+    self._fn      = None
+
+  #==================================== test ===================================
+  #
+  def test(self, theSig):
+    if self._fn is None:
+      self.compile()
+
+    return self._fn(theSig, self.S, self.L)
+
+  #================================= testBatch =================================
+  #
+  def testBatch(self, theSigs):
+    """!
+    @brief  Check the supplied sequence of signals, in order. See Trigger.testBatch.
+    """
+    if self._fn is None:
+      self.compile()
+
+    (fn, S, L) = (self._fn, self.S, self.L)
+    return np.fromiter((fn(sig, S, L) for sig in theSigs), dtype=bool, 
+                                                         count=len(theSigs))
+
+  #================================== compile ==================================
+  #
+  def compile(self):
+    """!
+    @brief  Compile trigger tree into single evaluation function.
+
+    The flattened state is taken from the triggers, except when re-compiling
+    (e.g., after checkpoint restore), where the existing flattened state is kept.
+    """
+    theComp = _Compiler()
+    vOut    = self._emit(theComp)
+
+    theBody = theComp.lines + ["return " + vOut]
+    if theComp.useBool:
+      theBody.insert(0, "sb = bool(sig)")
+
+    self.source = "def _test(sig, S, L):\n" + "".join("  " + line + "\n" 
+                                                             for line in theBody)
+    theScope = dict()
+    exec(self.source, theScope)
+
+    if (self.S is None) or (len(self.S) != len(theComp.state)):
+      self.S = theComp.state
+    self.L   = theComp.calls
+    self._fn = theScope["_test"]
+
+  #================================ __getstate__ ===============================
+  #
+  def __getstate__(self):
+    """!
+    @brief  Checkpoint support.  The compiled function is left out.
+    """
+    theState = self.__dict__.copy()
+    theState["_fn"] = None
+    return theState
+
+  #=================================== _emit ===================================
+  #
+  def _emit(self, theComp):
+    """!
+    @brief  Emit code for this node.  Returns variable holding the outcome.
+
+    The base class evaluates the triggers, so they see every signal, but never
+    triggers a report (like the base Trigger).  Derived classes combine them.
+    """
+    for trig in self.triggers:
+      theComp.emit(trig)
+
+    vOut = theComp.newVar()
+    theComp.lines.append(vOut + " = False")
+    return vOut
+
+
+#==================================== allOf ====================================
+#
+
+class allOf(Composite):
+  """!
+  @ingroup  Reports
+  @brief    Trigger when all of the triggers do (AND).
+  """
+
+  #=============================== allOf __init__ ==============================
+  #
+  def __init__(self, *theTriggers):
+    super(allOf,self).__init__(theTriggers)
+
+  def _emit(self, theComp):
+    vIns = [theComp.emit(trig) for trig in self.triggers]
+    vOut = theComp.newVar()
+    theComp.lines.append(vOut + " = " + " and ".join(vIns))
+    return vOut
+
+
+#==================================== anyOf ====================================
+#
+
+class anyOf(Composite):
+  """!
+  @ingroup  Reports
+  @brief    Trigger when any of the triggers does (OR).
+  """
+
+  #=============================== anyOf __init__ ==============================
+  #
+  def __init__(self, *theTriggers):
+    super(anyOf,self).__init__(theTriggers)
+
+  def _emit(self, theComp):
+    vIns = [theComp.emit(trig) for trig in self.triggers]
+    vOut = theComp.newVar()
+    theComp.lines.append(vOut + " = " + " or ".join(vIns))
+    return vOut
+
+
+#==================================== isNot ====================================
+#
+
+class isNot(Composite):
+  """!
+  @ingroup  Reports
+  @brief    Trigger when the trigger does not (NOT).
+  """
+
+  #=============================== isNot __init__ ==============================
+  #
+  def __init__(self, theTrigger):
+    super(isNot,self).__init__([theTrigger])
+
+  def _emit(self, theComp):
+    vIn  = theComp.emit(self.triggers[0])
+    vOut = theComp.newVar()
+    theComp.lines.append(vOut + " = not " + vIn)
+    return vOut
+
+
+#================================== thenWithin =================================
+#
+
+class thenWithin(Composite):
+  """!
+  @ingroup  Reports
+  @brief    Trigger when the second trigger does within some number of steps after
+            the first one did (sequence).
+
+  The second trigger must happen strictly after the first, at most nSteps later.
+  Each firing of the first trigger permits one report.
+  """
+
+  #============================ thenWithin __init__ ============================
+  #
+  def __init__(self, firstTrigger, thenTrigger, nSteps):
+    """!
+    @brief  Constructor for sequence trigger.
+
+    @param[in]  firstTrigger    Trigger that must happen first.
+    @param[in]  thenTrigger     Trigger that must happen next.
+    @param[in]  nSteps          Maximum number of steps (frames) between the two.
+    """
+    super(thenWithin,self).__init__([firstTrigger, thenTrigger])
+    self.nSteps = nSteps
+
+  def _emit(self, theComp):
+    vFirst = theComp.emit(self.triggers[0])
+    vThen  = theComp.emit(self.triggers[1])
+    vOut   = theComp.newVar()
+    nAge   = theComp.newSlot(None)      # Steps since first trigger, None if expired.
+
+    theComp.lines += [
+      "if " + nAge + " is not None:",
+      "  " + nAge + " = " + nAge + " + 1 if " + nAge + " < " + str(self.nSteps) 
+                                                             + " else None",
+      vOut + " = " + vThen + " and " + nAge + " is not None",
+      "if " + vOut + ":",
+      "  " + nAge + " = None",
+      "if " + vFirst + ":",
+      "  " + nAge + " = 0"]
+    return vOut
+
+
+#=================================== countOf ===================================
+#
+
+class countOf(Composite):
+  """!
+  @ingroup  Reports
+  @brief    Trigger every n-th time that the trigger does.
+  """
+
+  #============================== countOf __init__ =============================
+  #
+  def __init__(self, theTrigger, nTimes):
+    """!
+    @brief  Constructor for counting trigger.
+
+    @param[in]  theTrigger  Trigger to count.
+    @param[in]  nTimes      Number of times to count before triggering.
+    """
+    super(countOf,self).__init__([theTrigger])
+    self.nTimes = nTimes
+
+  def _emit(self, theComp):
+    vIn    = theComp.emit(self.triggers[0])
+    vOut   = theComp.newVar()
+    nCount = theComp.newSlot(0)
+
+    theComp.lines += [
+      vOut + " = False",
+      "if " + vIn + ":",
+      "  " + nCount + " += 1",
+      "  if " + nCount + " >= " + str(self.nTimes) + ":",
+      "    " + nCount + " = 0",
+      "    " + vOut + " = True"]
+    return vOut
+
 
 #
 #========================== perceiver.reports.trigger ==========================
@@ -0,0 +1,241 @@
+#============================== perceiver.timeline =============================
+"""!
+
+@brief    Run-length encoded activity timeline for duration and transition queries.
+
+A Monitor keeps only the current activity state.  Durations, transition counts, or
+dwell times would otherwise require logging the activity state at every frame.  An
+ActivityTimeline instead stores only the state transitions, as runs with the state
+plus the frame index and time stamp of the run start.  Memory use is proportional
+to the number of transitions, not to the number of frames, and all queries are
+answered in one pass over the runs.
+
+The current (last) run is open.  It is taken to extend up to and including the
+last updated frame, and up to the last update time.
+
+Activity states should be hashable (e.g., region index or activity label).  Numpy
+scalars and single element arrays are converted to their python value, while
+other arrays are converted to tuples.
+
+@author   agent,                agent@local
+@date     2026/10/19            [created]
+"""
+#============================== perceiver.timeline =============================
+#!
+#!NOTE:
+#!  set indent to 2 spaces.
+#!  do not indent function code.
+#!  set tab to 4 spaces with conversion to spaces.
+#!  90 columns
+#
+#============================== perceiver.timeline =============================
+
+import time
+import bisect
+import numpy as np
+
+
+#=============================== ActivityTimeline ==============================
+#
+class ActivityTimeline(object):
+  """!
+  @ingroup  Perceiver
+  @brief    Activity state transitions, stored as runs.
+
+  Attach to a Monitor through its timeline member for automatic updates.
+  """
+
+  #================================== __init__ =================================
+  #
+  def __init__(self):
+    """!
+    @brief  Constructor for the activity timeline.  Starts out empty.
+    """
+
+    self.states = []                  #< State of each run.
+    self.frames = []                  #< Frame index at start of each run.
+    self.times  = []                  #< Time stamp at start of each run.
+
+    self.lastFrame = -1               #< Frame index of last update.
+    self.lastTime  = None             #< Time stamp of last update.
+
+  #=================================== update ==================================
+  #
+  def update(self, aState, tstamp = None, frame = None):
+    """!
+    @brief  Note the activity state for a new frame.  Only a state change gets
+            stored.
+
+    @param[in]  aState  Activity state (instance with x field or the state itself).
+    @param[in]  tstamp  Time stamp of frame (optional). Default is current time.
+    @param[in]  frame   Frame index (optional). Default is one past the last one.
+    """
+
+    x = ActivityTimeline._asKey(getattr(aState, 'x', aState))
+
+    if tstamp is None:
+      tstamp = time.time()
+
+    if frame is None:
+      frame = self.lastFrame + 1
+
+    if (len(self.states) == 0) or (x != self.states[-1]):
+      self.states.append(x)
+      self.frames.append(frame)
+      self.times.append(tstamp)
+
+    self.lastFrame = frame
+    self.lastTime  = tstamp
+
+  #=================================== clear ===================================
+  #
+  def clear(self):
+    """!
+    @brief  Forget all runs.
+    """
+
+    self.__init__()
+
+  #=============================== numTransitions ==============================
+  #
+  def numTransitions(self):
+    """!
+    @brief  Number of state transitions so far.
+    """
+
+    return max(len(self.states) - 1, 0)
+
+  #==================================== runs ===================================
+  #
+  def runs(self):
+    """!
+    @brief  Return the runs as arrays.
+
+    @return     Tuple (states, start frames, frame counts, start times, durations).
+    """
+
+    frames = np.array(self.frames + [self.lastFrame + 1], dtype=np.int64)
+    times  = np.array(self.times + [self.lastTime], dtype=float)
+
+    return (list(self.states), frames[:-1], np.diff(frames), times[:-1], np.diff(times))
+
+  #================================== stateAt ==================================
+  #
+  def stateAt(self, frame):
+    """!
+    @brief  Activity state at a given frame index.
+
+    @param[in]  frame   Frame index.
+
+    @return     State at frame, or None if outside of the timeline.
+    """
+
+    if (len(self.frames) == 0) or (frame > self.lastFrame):
+      return None
+
+    ri = bisect.bisect_right(self.frames, frame) - 1
+    if ri < 0:
+      return None
+
+    return self.states[ri]
+
+  #================================= durations =================================
+  #
+  def durations(self, useFrames = False):
+    """!
+    @brief  Total time (or frame count) spent in each state.
+
+    @param[in]  useFrames   Count frames instead of time (optional).
+
+    @return     Dict from state to total duration.
+    """
+
+    (states, f0, nFrames, t0, dt) = self.runs()
+    spans = nFrames if useFrames else dt
+
+    total = dict()
+    for (x, span) in zip(states, spans.tolist()):
+      total[x] = total.get(x, 0) + span
+
+    return total
+
+  #============================== transitionMatrix =============================
+  #
+  def transitionMatrix(self):
+    """!
+    @brief  Count of transitions between each pair of states.
+
+    Entry (i,j) is the number of transitions from state labels[i] to labels[j].
+    Labels are in order of first appearance.
+
+    @return     Tuple (labels, count matrix).
+    """
+
+    labels = list(dict.fromkeys(self.states))
+    lookup = {x: li for (li, x) in enumerate(labels)}
+    ids    = np.array([lookup[x] for x in self.states], dtype=np.int64)
+
+    counts = np.zeros((len(labels), len(labels)), dtype=np.int64)
+    np.add.at(counts, (ids[:-1], ids[1:]), 1)
+
+    return (labels, counts)
+
+  #================================= dwellTimes ================================
+  #
+  def dwellTimes(self, state = None, useFrames = False, closed = False):
+    """!
+    @brief  Durations of the runs, optionally for one state only.
+
+    @param[in]  state       State to get dwell times for (optional). Default is all.
+    @param[in]  useFrames   Count frames instead of time (optional).
+    @param[in]  closed      Exclude the current, still open, run (optional).
+
+    @return     Array of run durations.
+    """
+
+    (states, f0, nFrames, t0, dt) = self.runs()
+    spans = nFrames if useFrames else dt
+
+    if closed:
+      states = states[:-1]
+      spans  = spans[:-1]
+
+    if state is None:
+      return spans
+
+    state = ActivityTimeline._asKey(state)
+    return spans[np.array([x == state for x in states], dtype=bool)]
+
+  #=============================== dwellHistogram ==============================
+  #
+  def dwellHistogram(self, state = None, bins = 10, useFrames = False, closed = False):
+    """!
+    @brief  Histogram of dwell times (see dwellTimes for the arguments).
+
+    @param[in]  bins    Number of bins or bin edges, as for numpy.histogram.
+
+    @return     Tuple (counts, bin edges) as for numpy.histogram.
+    """
+
+    return np.histogram(self.dwellTimes(state, useFrames, closed), bins = bins)
+
+  #=================================== _asKey ==================================
+  #
+  @staticmethod
+  def _asKey(x):
+    """!
+    @brief  Convert state to a hashable, comparable value.
+    """
+
+    if isinstance(x, np.ndarray):
+      if x.size == 1:
+        return x.item()
+      return tuple(x.ravel().tolist())
+    elif isinstance(x, np.generic):
+      return x.item()
+
+    return x
+
+
+#
+#============================== perceiver.timeline =============================
@@ -22,6 +22,8 @@ setup(
             "improcessor @ git+https://github.com/ivapylibs/improcessor.git",
             "detector @ git+https://github.com/ivapylibs/detector.git",
             "trackpointer @ git+https://github.com/ivapylibs/trackpointer.git",
-        ]
+        ],
+        "checkpoint": ["cloudpickle"],
+        "jsonl": ["orjson"],
     },
 )
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+#=============================== activity03record ==============================
+## @file
+# @brief    Code to test out session recording of an activity monitor for the
+#           top-left/lower-right scenario of activity01regions.
+#
+# The monitor setup is the same as activity01regions.  A session recorder is
+# attached to the monitor so that frames, perceiver states, and activity states
+# get archived to a chunked session directory.  After the path is traversed, the
+# session is read back with seek-by-time and partial (state only) loading.
+#
+# The code below
+#
+# > ./activity03record
+#
+# runs the script.
+#
+# ### Outcome ###
+# The monitor runs for a fixed number of frames with text output only.  Then the
+# recorded activity states are printed out, along with the track point recorded
+# at the middle of the session.  There should be the same number of recorded
+# frames as processed frames.
+#
+# @ingroup  TestMonitor
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#=============================== activity03record ==============================
+#
+#!NOTE:
+#!  Indent is set to 2 spaces.
+#!  Tab is set to 4 spaces with conversion to spaces.
+#
+#=============================== activity03record ==============================
+
+
+#==[0] Environment dependencies.
+#
+import numpy as np
+
+import ivapy.test.paths as pathgen
+import ivapy.test.vision as visgen
+
+import perceiver.builders as perbuild
+import detector.activity.byRegion as regact
+import perceiver.monitor as monitor
+import perceiver.recorder as recorder
+
+
+#==[1] Setup necessary class instances.
+#
+pathPts = np.transpose(np.array([ [10,10] , [35, 35], [50, 50] ]))
+thePath = pathgen.StepLines(None, pathPts)
+
+thePerceiver = perbuild.buildTesterGS(10)
+
+theActivity  = regact.imageRegions()
+theActivity.initRegions([100, 100])
+theActivity.addRegionByPolygon([[ 5,  5, 15, 15],[ 5, 15, 15, 5]])
+theActivity.addRegionByPolygon([[35, 35, 45, 45],[35, 45, 45, 35]])
+
+theMonitor = monitor.Monitor(None, thePerceiver, theActivity)
+
+recConfig = recorder.CfgRecorder()
+recConfig.dirname  = "activity03session"
+recConfig.chunkLen = 10
+recConfig.block    = True               # Offline run.  Wait rather than drop frames.
+
+theMonitor.recorder = recorder.Recorder(recConfig)
+
+#==[2] Process for a fixed number of frames, then close out the recording.
+#
+nFrames = 60
+for fi in range(nFrames):
+  cpt = thePath.next()
+  theImage = visgen.squareInImage([100, 100], cpt, 5, [50])
+
+  theMonitor.process(theImage)
+
+theMonitor.recorder.close()
+
+#==[3] Read back the session.
+#
+theSession = recorder.SessionReader("activity03session")
+print("Recorded frames: " + str(theSession.numFrames()) + " of " + str(nFrames))
+
+states = theSession.load(fields = ["time", "activity"])
+print(states["activity"])
+
+tRange = theSession.timeRange()
+midRec = theSession.frameAt(0.5*(tRange[0] + tRange[1]), fields = ["frame", "tMeas"])
+print("Track point at frame " + str(midRec["frame"]) + ": " + str(midRec["tMeas"]))
+
+#
+#=============================== activity03record ==============================
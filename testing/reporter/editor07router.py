@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+#================================ editor07router ===============================
+## @file
+# @brief    Code that drives the editor06pilot scheme through Editor signal routing.
+# 
+# This script builds the same BeatReporters as ``editor06pilot``, but each one
+# declares the named signal it consumes through its configuration.  Instead of
+# invoking each BeatReporter's process member function with the right signal,
+# the outer loop passes a dict of named signals to the Editor once per frame.
+# The trial BeatReporters consume a derived signal, which the Editor computes
+# once per tick from the raw board area signal.
+#
+# The code below
+# 
+# > ./editor07router.py
+# 
+# runs the script.  
+#
+# The output should match that of ``editor06pilot``.
+#
+# @ingroup  TestReporter
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#================================ editor07router ===============================
+#
+# NOTE:
+#  Number of columns is 90 with margin at 10.
+#  Indent is set to 2 spaces.
+#  Tab is set to 4 spaces with conversion to spaces.
+#
+#================================ editor07router ===============================
+
+#==[0] Environment setup.
+#
+import time
+import perceiver as perceiver
+
+import perceiver.reports.drafts   as Announce
+import perceiver.reports.triggers as Trigger
+import perceiver.reports.channels as Channel
+import perceiver.reporting        as Reports
+
+import math
+
+
+#==[1] BeatReporters configurations.
+#
+# A set of BeatReporters will all have same Announcement but send different 
+# text to it, possibly even None (a skip/do nothing).
+# The Running Commentary output is according to its text output scheme.
+#
+
+# The first set of Beat Reporters is for outputting trial information
+# Rising is start of trial.  Gets binary signal concerning solution board.
+#
+trigs   = [Trigger.Rising(initState = False), Trigger.Rising(initState = False)]
+bquiet  = [True, False]
+sigfilt = [Announce.Commentary.counter(icnt = 1), Announce.Announcement.dateof()]
+
+theConfig = Announce.CfgRunningCommentary()
+theConfig.Leader = 'Trial'
+
+brConfig = Reports.CfgBeatReporter()
+brConfig.signal = "boardIn"
+
+trialReport = Reports.BeatReporter.buildGroupWithRunningCommentary(
+                triggers = trigs, keepQuiet = bquiet, filters = sigfilt,
+                beatrepCfg = brConfig, commentCfg = theConfig)
+
+# The second set of Beat Reporters is for outputting puzzle piece information.
+# In particular, when subject has indicated placement of a piece.
+#
+trigs   = [Trigger.Rising(initState=False), Trigger.onMatch(None, True), 
+           Trigger.Falling(initState=False)]
+bquiet  = [True, True, False]
+sigfilt = [Announce.Announcement.fixed("-")] + Announce.Commentary.counterWithReset()
+
+theConfig = Announce.CfgRunningCommentary()
+theConfig.Leader = 'Piece'
+
+brConfig = Reports.CfgBeatReporter()
+brConfig.signal = "button"
+
+pieceReport = Reports.BeatReporter.buildGroupWithRunningCommentary(
+                triggers = trigs, keepQuiet = bquiet, filters = sigfilt,
+                beatrepCfg = brConfig, commentCfg = theConfig)
+
+# The third set of Beat Reporters is for outputting timing information.
+#
+trigs   = [Trigger.Falling(initState=False), Trigger.Rising(initState=False), 
+           Trigger.Always()]
+bquiet  = [False, True, True]
+sigfilt = [Announce.Commentary.timeof(), Announce.Commentary.timeof(), None ]
+
+theConfig = Announce.CfgRunningCommentary()
+theConfig.Leader = 'Time'
+
+brConfig = [Reports.CfgBeatReporter() for ii in range(len(trigs))]
+brConfig[0].signal = "button"
+brConfig[1].signal = "button"
+brConfig[2].signal = "time"
+
+timeReport = Reports.BeatReporter.buildGroupWithRunningCommentary(
+                triggers = trigs, keepQuiet = bquiet, filters = sigfilt,
+                beatrepCfg = brConfig, commentCfg = theConfig)
+
+bReporters = trialReport + pieceReport + timeReport
+
+#==[2] Editor configuration.
+
+# The Editor will need an output channel.
+cfChan = Channel.CfgToFile();
+cfChan.filename = "editor07output.csv"
+cfChan.header   = ["Cluster Order: 12345", "Piece Order: Ascending"]
+media  = Channel.toCSV(cfChan)
+
+tEditor  = Reports.Editor(media)
+tEditor.assignGroup(bReporters)  
+
+# The board signal is the fraction of the solution board area that is visible.
+# The trial BeatReporters consume a thresholded (derived) version of it.
+tEditor.addSignal("boardIn", "boardArea", lambda area: area > 0.5)
+
+media.sendHeader()
+
+print("=== Output to text. Two rows per outer loop, with \"timings\" ==")
+# The BeatReporters will pass along to Editor who will output when appropriate.
+
+flist = (1.0, 1.5, 2.2, 2.5, 5.7, 6.2)
+
+for ni in range(3):
+  # Puzzle solution board is in place.
+  tEditor.tick({"boardArea": 0.9})
+
+  for si in flist:
+    # Puzzle place button pressed.  One tick drives all piece and time beats.
+    #
+    tEditor.tick({"button": True, "time": si})
+
+  time.sleep(0.25)
+
+  # Puzzle solution board removed.
+  #
+  tEditor.tick({"boardArea": 0.1, "button": False})
+
+
+# EXPECTED OUTPUT, EXCEPT THAT LAST ENTRY IN SECONDS SHOULD REFLECT 
+# CURRENT TIME AT INVOCATION OF SCRIPT:
+#
+# Cluster Order: 12345,Piece Order: Ascending
+# Trial,1,2024-07-25
+# Piece,-,0,1,2,3,4,5,
+# Time,12:27:59.932468,1.0,1.5,2.2,2.5,5.7,6.2,12:28:00.182900
+# Trial,2,2024-07-25
+# Piece,-,0,1,2,3,4,5,
+# Time,12:28:00.183091,1.0,1.5,2.2,2.5,5.7,6.2,12:28:00.433596
+# Trial,3,2024-07-25
+# Piece,-,0,1,2,3,4,5,
+# Time,12:28:00.433678,1.0,1.5,2.2,2.5,5.7,6.2,12:28:00.684130
+#
+# Except that date and time fields should reflect data and time at invocation.
+#
+#================================ editor07router ===============================
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+#================================ editor08batch ================================
+## @file
+# @brief    Code to test that batch processing of BeatReporters gives the same
+#           reports as step by step processing.
+# 
+# Two identical BeatReporters have an onChange trigger and a RunningCommentary
+# announcer, which keeps a history of triggered signals and resets it when
+# acknowledged.  One processes the signals step by step, the other processes the
+# whole sequence at once with processBatch.  Each reports to its own Editor.
+#
+# Then two identical groups of two BeatReporters sharing one RunningCommentary
+# (as built by buildGroupWithRunningCommentary) are compared.  One beat has an
+# Always trigger and keeps quiet, so it only accumulates the signals.  The other
+# reports on a falling edge.  One group is processed step by step, the other
+# through Editor.processBatch, which announces frame by frame.  Processing the
+# shared announcer group one BeatReporter batch at a time is refused.
+#
+# The code below
+# 
+# > ./editor08batch.py
+# 
+# runs the script.  
+#
+# ### Outcome ###
+# The reports of both are printed out, one per signal change.  They should be the
+# same, and the line after should say so.  Same for the shared RunningCommentary
+# groups, followed by the refusal message.
+#
+# @ingroup  TestReporter
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#================================ editor08batch ================================
+#
+# NOTE:
+#  Number of columns is 90 with margin at 10.
+#  Indent is set to 2 spaces.
+#  Tab is set to 4 spaces with conversion to spaces.
+#
+#================================ editor08batch ================================
+
+#==[0] Environment setup.
+#
+import perceiver.reports.drafts   as Announce
+import perceiver.reports.triggers as Trigger
+import perceiver.reports.channels as Channel
+import perceiver.reporting        as Reports
+
+
+#==[1] Channel that keeps the reports (as copies) for later comparison.
+#
+class toList(Channel.Channel):
+
+  def __init__(self):
+    super(toList,self).__init__()
+    self.reports = []
+
+  def send(self, theReport):
+    self.reports.append(list(theReport))
+    return True
+
+
+#==[2] Build the two BeatReporters, one Editor each.
+#
+def buildEditor(triggers, keepQuiet):
+  theGroup = Reports.BeatReporter.buildGroupWithRunningCommentary(
+                triggers = triggers, keepQuiet = keepQuiet)
+
+  theEditor = Reports.Editor(toList())
+  theEditor.assignGroup(theGroup)
+
+  return (theEditor, theGroup)
+
+(stepEditor, stepGroup)   = buildEditor([Trigger.onChange()], [False])
+(batchEditor, batchGroup) = buildEditor([Trigger.onChange()], [False])
+
+#==[3] Process the signals both ways and compare.
+#
+slist = [0, 1, 0, 1, 1, 0, 1]
+
+for si in slist:
+  for theReporter in stepGroup:
+    theReporter.process(si)
+
+for theReporter in batchGroup:
+  theReporter.processBatch(slist)
+
+print("=== Step by step. ==")
+print(stepEditor.channel.reports)
+print("=== Batch.        ==")
+print(batchEditor.channel.reports)
+
+print("Same reports: " + str(stepEditor.channel.reports == batchEditor.channel.reports))
+
+#==[4] Shared RunningCommentary groups, one step by step and one batch.
+#
+def sharedTriggers():
+  return [Trigger.Always(), Trigger.Falling(initState = False)]
+
+(stepEditor, stepGroup)   = buildEditor(sharedTriggers(), [True, False])
+(batchEditor, batchGroup) = buildEditor(sharedTriggers(), [True, False])
+
+slist = [1, 1, 0, 1, 0]
+
+for si in slist:
+  for theReporter in stepGroup:
+    theReporter.process(si)
+
+batchEditor.processBatch(slist)
+
+print("=== Shared, step by step. ==")
+print(stepEditor.channel.reports)
+print("=== Shared, batch.        ==")
+print(batchEditor.channel.reports)
+
+print("Same reports: " + str(stepEditor.channel.reports == batchEditor.channel.reports))
+
+try:
+  batchGroup[0].processBatch(slist)
+except ValueError as theErr:
+  print("Per beat batch refused: " + str(theErr))
+
+#
+#================================ editor08batch ================================
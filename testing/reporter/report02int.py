@@ -9,8 +9,8 @@
 # 
 # > ./report02int
 # 
-# runs the script.  It tests out the Always, onChange, onMatch, whenClose, whenFar,
-# whenDiffers, whenSimilar triggers.
+# runs the script.  It tests out the Always, onChange, onMatch, onMatchAny, whenClose,
+# whenFar, whenDiffers, whenSimilar triggers.
 # 
 # @ingroup  TestReporter
 # @quitf
@@ -76,6 +76,13 @@ print("=== On Match  : Match  1 times.  ===")
 for si in flist:
   testRep.process(si)
 
+trigr = Triggers.onMatchAny(None, {3, 10, 50})
+testRep = Reports.Reporter(trigr, crier, media)
+
+print("=== On Match Any : Match 4 times. ===")
+for si in flist:
+  testRep.process(si)
+
 
 cfgClose = Triggers.CfgDistTrigger(None)
 cfgClose.tau = 5
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+#=============================== report05buffered ==============================
+## @file
+# @brief    Code to test reporter with buffered csv output written from a
+#           background thread.
+# 
+# Same as report04csv, except that the CSV channel batches its rows and is wrapped
+# by an Async channel so that the file writes happen on a writer thread.  The
+# channel is used as a context manager, so closing it writes out the tail rows.
+# 
+# The code below
+# 
+# > ./report05buffered
+# 
+# runs the script.  The output is a CSV file whose contents are the floats
+# packaged into a list within the code.
+# 
+# @ingroup  TestReporter
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#=============================== report05buffered ==============================
+#
+#NOTE:
+#  Number of columns is 90 with margin at 10.
+#  Indent is set to 2 spaces.
+#  Tab is set to 4 spaces with conversion to spaces.
+#
+#=============================== report05buffered ==============================
+
+import perceiver as perceiver
+
+import perceiver.reports.drafts   as Announce
+import perceiver.reports.triggers as Triggers
+import perceiver.reports.channels as Channel
+import perceiver.reporting        as Reports
+
+trigr = Triggers.Always()
+
+cfAnn = Announce.CfgAnnouncement()
+cfAnn.signal2text = Announce.Announcement.toiterable
+cfCSV = Channel.CfgToBufferedFile();
+cfCSV.filename = "report05output.csv"
+cfCSV.maxRows  = 4
+
+crier = Announce.Announcement(cfAnn)
+flist = (1.0, 3.0, 3.2, 20.5, 20.7, 50.2)
+
+print("=== No output, goes to CSV file.  Check it against text output. ==")
+with Channel.Async(Channel.toBufferedCSV(cfCSV)) as media:
+  testRep = Reports.Reporter(trigr, crier, media)
+
+  media.sendHeader(["Iteration", "Times"])
+  ni = 0
+  for si in flist:
+    media.setRunner(ni)
+    testRep.process(si)
+    ni = ni+1
+
+print(open("report05output.csv").read())
+
+#
+#=============================== report05buffered ==============================
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+#============================== report06composite ==============================
+## @file
+# @brief    Code to test reporter with composite triggers.
+# 
+# A binary signal (e.g., a button) is processed by three reporters.  The first
+# reports presses that are quick taps (press then release within 2 steps).  The
+# second reports every third press.  The third reports presses and releases both,
+# through the | operator.  Each composite trigger is compiled into one evaluation
+# function, whose code is printed out.
+# 
+# The code below
+# 
+# > ./report06composite
+# 
+# runs the script.
+# 
+# @ingroup  TestReporter
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#============================== report06composite ==============================
+#
+#NOTE:
+#  Number of columns is 90 with margin at 10.
+#  Indent is set to 2 spaces.
+#  Tab is set to 4 spaces with conversion to spaces.
+#
+#============================== report06composite ==============================
+
+import perceiver as perceiver
+
+import perceiver.reports.drafts   as Announce
+import perceiver.reports.triggers as Triggers
+import perceiver.reports.channels as Channel
+import perceiver.reporting        as Reports
+
+trigs = [Triggers.thenWithin(Triggers.Rising(), Triggers.Falling(), 2),
+         Triggers.countOf(Triggers.Rising(), 3),
+         Triggers.Rising() | Triggers.Falling()]
+texts = ["Tap.", "Third press.", "Edge."]
+
+media = Channel.Channel(Channel.CfgChannel.forEditors())
+reps  = []
+for ti in range(len(trigs)):
+  cfAnn = Announce.CfgAnnouncement()
+  cfAnn.signal2text = Announce.Announcement.fixed(texts[ti])
+  reps.append(Reports.Reporter(trigs[ti], Announce.Announcement(cfAnn), media))
+
+blist = (0, 1, 0, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, 0)
+
+print("=== Step by step. ==")
+for bi in blist:
+  print(bi, end=": ")
+  for rep in reps:
+    rep.process(bi)
+  print()
+
+print("=== Compiled thenWithin trigger. ==")
+print(trigs[0].source)
+
+#
+#============================== report06composite ==============================
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+#================================= report07ring ================================
+## @file
+# @brief    Code to test the shared memory ring channel with slow readers.
+# 
+# A toSharedRing channel with a small ring (256 bytes) gets reports that a
+# SharedRingReader reads back.  Four cases are checked:
+#
+#   1. The reader keeps up.  All reports come back.
+#   2. The reader falls a full lap behind.  The lost reports are not returned,
+#      one overrun is counted, and the reports after that come back fine.
+#   3. The writer is stopped mid-write, after reserving space and overwriting
+#      the record the reader is about to copy, but before publishing it.  The
+#      reader should not return the overwritten record.
+#   4. The channel is checkpointed and restored.  The restored channel writes
+#      into the same block, from where the original left off, and structured
+#      reports come back JSON decoded.
+#
+# The code below
+# 
+# > ./report07ring.py
+# 
+# runs the script.
+# 
+# ### Outcome ###
+# Each case prints what was read and the number of overruns.  The last line of
+# each case should say True.
+#
+# @ingroup  TestReporter
+# @quitf
+#
+# @author   agent,              agent@local
+# @date     2026/10/19 [created]
+#
+#================================= report07ring ================================
+#
+#NOTE:
+#  Number of columns is 90 with margin at 10.
+#  Indent is set to 2 spaces.
+#  Tab is set to 4 spaces with conversion to spaces.
+#
+#================================= report07ring ================================
+
+import os
+import perceiver.reports.channels as Channel
+import perceiver.checkpoint       as Checkpoint
+
+cfRing = Channel.CfgToSharedRing()
+cfRing.name     = "report07ring"
+cfRing.capacity = 256
+
+media  = Channel.toSharedRing(cfRing)
+reader = Channel.SharedRingReader("report07ring")
+
+#==[1] Reader keeps up.  Each report is "msgNN" (16 byte record).
+#
+print("=== Reader keeps up. ===")
+for mi in range(10):
+  media.send("msg%02d" % mi)
+
+theMsgs = reader.read()
+print(theMsgs, reader.nLost)
+print(theMsgs == ["msg%02d" % mi for mi in range(10)])
+
+#==[2] Reader falls a full lap behind (more than 256 bytes written).
+#
+print("=== Reader a full lap behind. ===")
+for mi in range(10, 40):
+  media.send("msg%02d" % mi)
+
+theMsgs = reader.read()
+print(theMsgs, reader.nLost)
+
+media.send("msg40")
+theMsgs = reader.read()
+print(theMsgs, reader.nLost)
+print((theMsgs == ["msg40"]) and (reader.nLost == 1))
+
+#==[3] Writer stopped between the overwrite and the cursor publish.
+#
+print("=== Writer stopped mid-write. ===")
+media.send("msg41")
+
+# What send does for a record that laps the reader, less the publish: reserve,
+# then overwrite the text of the unread record.
+pos = reader.cursor % media.capacity
+media.words[3] = media.cursor + media.capacity
+media.ring[pos+5:pos+10] = b"XXXXX"
+
+theMsgs = reader.read()
+print(theMsgs, reader.nLost)
+print(("msg41" not in theMsgs) and all("X" not in msg for msg in theMsgs)
+                               and (reader.nLost == 2))
+
+#==[4] Checkpoint and restore the channel, then keep writing.
+#
+print("=== Checkpoint restore. ===")
+reader.read()
+Checkpoint.save(media, "report07ring.ckpt")
+restored = Checkpoint.load("report07ring.ckpt")
+os.remove("report07ring.ckpt")
+
+restored.send("msg42")
+restored.send({"id": 43, "pos": [1.0, 2.0]})
+
+theMsgs = reader.read()
+print(theMsgs, reader.nLost)
+print(theMsgs == ["msg42", {"id": 43, "pos": [1.0, 2.0]}])
+
+reader.close()
+restored.close()
+media.close()
+
+#
+#================================= report07ring ================================